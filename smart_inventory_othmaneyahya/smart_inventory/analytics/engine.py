@@ -0,0 +1,252 @@
+"""Vectorised sales reports for the notebook and offline / batch jobs.
+
+:class:`SalesAnalytics` wraps the four tables as DataFrames (from the
+exported files, or read straight from a DB-API connection) and computes
+each report with vectorised NumPy operations only.  The per-line
+``quantity * unit_price`` total, and the order / product each line
+belongs to, are derived once and shared by every report.
+
+Loading reads whole tables, so the web reports page aggregates in SQL
+instead (``web/inventory/reports.py``).
+
+Usage:
+    engine = SalesAnalytics(products_df, customers_df, orders_df, order_items_df)
+    engine.revenue_by_month()
+
+    conn = get_connection()
+    try:
+        engine = SalesAnalytics.from_connection(conn)
+    finally:
+        conn.close()
+"""
+
+from functools import cached_property
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# table -> columns read by from_connection (and required of the DataFrames)
+COLUMNS = {
+    "products": ["id", "name", "category", "price", "quantity_in_stock"],
+    "customers": ["id", "name", "email"],
+    "orders": ["id", "customer_id", "order_date"],
+    "order_items": ["id", "order_id", "product_id", "quantity", "unit_price"],
+}
+
+
+def _money(values: pd.Series) -> np.ndarray:
+    # Decimal objects (MySQL), decimal128 (columnar export) or floats (CSV)
+    return np.asarray(values.astype("float64"), dtype=np.float64)
+
+
+def _positions(keys: Any, ids: pd.Series) -> np.ndarray:
+    """Row position in *ids* of each key (-1 if absent).
+
+    AUTO_INCREMENT ids exported in order are usually ``first .. first+n-1``,
+    where the position is plain arithmetic; otherwise it is a hash join.
+    """
+    ids, keys = np.asarray(ids), np.asarray(keys)
+    if len(ids) and ids.dtype.kind in "iu" and keys.dtype.kind in "iu":
+        first = int(ids[0])
+        if int(ids[-1]) - first == len(ids) - 1 and (np.diff(ids) == 1).all():
+            positions = keys.astype(np.int64) - first
+            positions[(positions < 0) | (positions >= len(ids))] = -1
+            return positions
+    return pd.Index(ids).get_indexer(keys)
+
+
+class SalesAnalytics:
+    """The analysis notebook's reports, computed from four DataFrames.
+
+    The DataFrames need (at least) the columns in :data:`COLUMNS`; they
+    are not modified.  Every report is a ``np.bincount`` over row
+    positions resolved once, instead of merges and ``groupby`` on
+    10M-row frames.  Order items whose order is missing are ignored.
+    """
+
+    def __init__(
+        self,
+        products: pd.DataFrame,
+        customers: pd.DataFrame,
+        orders: pd.DataFrame,
+        order_items: pd.DataFrame,
+    ) -> None:
+        self.products = products
+        self.customers = customers
+        self.orders = orders
+        self.order_items = order_items
+
+    @classmethod
+    def from_connection(cls, conn: Any) -> "SalesAnalytics":
+        """Read the four tables through a DB-API *conn* (not closed here).
+
+        Works with the pooled MySQL connection, the SQLite stand-in and
+        ``django.db.connection``.
+        """
+        frames: Dict[str, pd.DataFrame] = {}
+        cursor = conn.cursor()
+        try:
+            for table, columns in COLUMNS.items():
+                cursor.execute(f"SELECT {', '.join(columns)} FROM {table}")
+                frames[table] = pd.DataFrame(list(cursor.fetchall()), columns=columns)
+        finally:
+            cursor.close()
+        frames["orders"]["order_date"] = pd.to_datetime(frames["orders"]["order_date"])
+        return cls(**frames)
+
+    # ── Shared intermediates (computed once) ─────────────────────────
+
+    @cached_property
+    def _lines(self) -> Dict[str, np.ndarray]:
+        """Per order item: ``order`` / ``product`` row positions,
+        ``quantity`` and ``line_total`` (orphans dropped)."""
+        items = self.order_items
+        order = _positions(items["order_id"], self.orders["id"])
+        keep = order >= 0
+        quantity = np.asarray(items["quantity"], dtype=np.int64)
+        lines = {
+            "order": order,
+            "product": _positions(items["product_id"], self.products["id"]),
+            "quantity": quantity,
+            "line_total": quantity * _money(items["unit_price"]),
+        }
+        if not keep.all():
+            lines = {name: values[keep] for name, values in lines.items()}
+        return lines
+
+    @property
+    def line_totals(self) -> np.ndarray:
+        """``quantity * unit_price`` for every order item."""
+        return self._lines["line_total"]
+
+    @cached_property
+    def _per_order(self) -> Dict[str, np.ndarray]:
+        """Item count and total for every row of :attr:`orders`."""
+        lines, n = self._lines, len(self.orders)
+        return {
+            "items": np.bincount(lines["order"], minlength=n),
+            "total": np.bincount(lines["order"], weights=lines["line_total"], minlength=n),
+        }
+
+    # ── Reports ──────────────────────────────────────────────────────
+
+    def total_revenue(self) -> float:
+        return float(self.line_totals.sum())
+
+    def revenue_by_month(self) -> pd.DataFrame:
+        """Columns ``year_month`` (Period), ``year_month_str``, ``total_revenue``.
+
+        Only months with at least one order item are listed.
+        """
+        per_order = self._per_order
+        months = np.asarray(self.orders["order_date"], dtype="datetime64[M]")
+        sold = (per_order["items"] > 0) & ~np.isnat(months)
+        # Months since 1970 as small ints: a bincount instead of a sort.
+        index = months[sold].astype(np.int64)
+        first = int(index.min()) if len(index) else 0
+        revenue = np.bincount(index - first, weights=per_order["total"][sold])
+        present = np.flatnonzero(np.bincount(index - first))
+        year_month = pd.PeriodIndex(
+            (present + first).astype("datetime64[M]"), freq="M"
+        )
+        revenue = revenue[present]
+        return pd.DataFrame({
+            "year_month": year_month,
+            "year_month_str": year_month.astype(str),
+            "total_revenue": revenue,
+        })
+
+    def best_sellers(self, limit: Optional[int] = None) -> pd.DataFrame:
+        """Columns ``product_id``, ``name``, ``total_qty_sold``,
+        ``total_revenue``; most units sold first.  Unsold products are
+        left out."""
+        lines, n = self._lines, len(self.products)
+        known = lines["product"] >= 0
+        product = lines["product"][known]
+        qty = np.bincount(product, weights=lines["quantity"][known], minlength=n)
+        revenue = np.bincount(product, weights=lines["line_total"][known], minlength=n)
+        sold = np.flatnonzero(qty)  # quantities are positive
+        rows = sold[np.argsort(-qty[sold], kind="stable")]
+        if limit is not None:
+            rows = rows[:limit]
+        return pd.DataFrame({
+            "product_id": np.asarray(self.products["id"])[rows],
+            "name": np.asarray(self.products["name"])[rows],
+            "total_qty_sold": qty[rows].astype(np.int64),
+            "total_revenue": revenue[rows],
+        })
+
+    def stock_by_category(self) -> pd.DataFrame:
+        """Columns ``category``, ``num_products``, ``total_stock_units``,
+        ``total_stock_value``; largest value first."""
+        products = self.products
+        units = np.asarray(products["quantity_in_stock"], dtype=np.int64)
+        frame = pd.DataFrame({
+            "category": np.asarray(products["category"].astype(str)),
+            "units": units,
+            "value": units * _money(products["price"]),
+        })
+        return (
+            frame.groupby("category", sort=False)
+            .agg(
+                num_products=("units", "size"),
+                total_stock_units=("units", "sum"),
+                total_stock_value=("value", "sum"),
+            )
+            .sort_values("total_stock_value", ascending=False, kind="stable")
+            .reset_index()
+        )
+
+    def order_totals(self) -> pd.DataFrame:
+        """Columns ``order_id``, ``order_total`` for every order with items,
+        by id."""
+        per_order = self._per_order
+        rows = np.flatnonzero(per_order["items"])
+        ids = np.asarray(self.orders["id"])[rows]
+        order = np.argsort(ids, kind="stable")
+        return pd.DataFrame({
+            "order_id": ids[order],
+            "order_total": per_order["total"][rows][order],
+        })
+
+    def order_value_stats(self) -> Dict[str, float]:
+        """``count``, ``mean``, ``median``, ``min`` and ``max`` order total."""
+        per_order = self._per_order
+        totals = per_order["total"][per_order["items"] > 0]
+        if not len(totals):
+            return {"count": 0, "mean": 0.0, "median": 0.0, "min": 0.0, "max": 0.0}
+        return {
+            "count": int(len(totals)),
+            "mean": float(totals.mean()),
+            "median": float(np.median(totals)),
+            "min": float(totals.min()),
+            "max": float(totals.max()),
+        }
+
+    def customer_spend(self) -> pd.DataFrame:
+        """Columns ``customer_id``, ``name``, ``num_orders``,
+        ``total_spent``, ``avg_order_value``; biggest spenders first.
+
+        Orders without items count towards ``num_orders`` but not the
+        average, as in the notebook.
+        """
+        per_order, n = self._per_order, len(self.customers)
+        customer = _positions(self.orders["customer_id"], self.customers["id"])
+        known = customer >= 0
+        customer = customer[known]
+        with_items = per_order["items"][known] > 0
+        num_orders = np.bincount(customer, minlength=n)
+        spent = np.bincount(customer, weights=per_order["total"][known], minlength=n)
+        priced = np.bincount(customer, weights=with_items, minlength=n)
+        rows = np.flatnonzero(num_orders)
+        rows = rows[np.argsort(-spent[rows], kind="stable")]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            average = np.where(priced[rows] > 0, spent[rows] / priced[rows], np.nan)
+        return pd.DataFrame({
+            "customer_id": np.asarray(self.customers["id"])[rows],
+            "name": np.asarray(self.customers["name"])[rows],
+            "num_orders": num_orders[rows],
+            "total_spent": spent[rows],
+            "avg_order_value": average,
+        })
@@ -1,75 +1,470 @@
 """Export MySQL data to CSV files for Pandas analysis.
 
+Rows are streamed from the server with ``fetchmany`` straight into the
+CSV writer, so memory use stays flat however large a table is.  The
+four tables are exported in parallel, each on its own pooled
+connection.  ``--format parquet|feather`` writes typed columnar files
+instead (see ``analytics/columnar.py``; needs pyarrow).
+
 Run from the smart_inventory root:
     python analytics/export_data.py
+    python analytics/export_data.py --gzip --chunk-size 20000
+    python analytics/export_data.py --format feather
+    python analytics/export_data.py --incremental [--compact]
 """
 
+import argparse
 import csv
+import gzip
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 # Add parent to path so we can import from database
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from analytics import columnar
 from database.connection import get_connection
 
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "data")
+CHUNK_SIZE = 5000
+FORMATS = ("csv", "parquet", "feather")
+
+# (table name, query, CSV headers)
+EXPORTS = [
+    (
+        "products",
+        "SELECT id, name, category, price, quantity_in_stock FROM products",
+        ["id", "name", "category", "price", "quantity_in_stock"],
+    ),
+    (
+        "customers",
+        "SELECT id, name, email FROM customers",
+        ["id", "name", "email"],
+    ),
+    (
+        "orders",
+        "SELECT id, customer_id, order_date FROM orders",
+        ["id", "customer_id", "order_date"],
+    ),
+    (
+        "order_items",
+        "SELECT id, order_id, product_id, quantity, unit_price FROM order_items",
+        ["id", "order_id", "product_id", "quantity", "unit_price"],
+    ),
+]
+
+
+@dataclass
+class ExportResult:
+    """Outcome of exporting one table."""
+
+    table: str
+    path: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
 
+def ensure_output_dir(output_dir: str = OUTPUT_DIR) -> None:
+    os.makedirs(output_dir, exist_ok=True)
 
-def ensure_output_dir() -> None:
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+def _open_output(path: str, compress: bool):
+    if compress:
+        return gzip.open(path, "wt", newline="", encoding="utf-8")
+    return open(path, "w", newline="", encoding="utf-8")
 
-def export_table(table_name: str, query: str, headers: list[str]) -> str:
-    """Export a query result set to CSV and return the file path."""
+
+class _CSVSink:
+    """CSV counterpart of :class:`columnar.ColumnarWriter`."""
+
+    def __init__(self, path: str, headers: Sequence[str], compress: bool) -> None:
+        self._file = _open_output(path, compress)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(headers)
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _filename(table_name: str, fmt: str, compress: bool) -> str:
+    if fmt != "csv":
+        return table_name + columnar.FORMATS[fmt]
+    return f"{table_name}.csv.gz" if compress else f"{table_name}.csv"
+
+
+def export_table(
+    table_name: str,
+    query: str,
+    headers: Sequence[str],
+    output_dir: str = OUTPUT_DIR,
+    compress: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    fmt: str = "csv",
+) -> ExportResult:
+    """Stream a query result set into ``<table_name>.csv[.gz]``.
+
+    At most *chunk_size* rows are held in memory at a time.  The file is
+    written under a temporary name and renamed when complete, so readers
+    never see a half-written export.
+
+    Args:
+        table_name: Base name of the output file.
+        query: SELECT producing the rows, in *headers* order.
+        headers: CSV header row.
+        output_dir: Directory to write into.
+        compress: Write gzip-compressed CSV (``.csv.gz``).
+        chunk_size: Rows fetched per ``fetchmany`` call.
+        fmt: ``"csv"``, or ``"parquet"`` / ``"feather"`` for a typed
+            ``<table_name>.parquet`` / ``.feather`` file (*compress* is
+            then ignored).
+
+    Returns:
+        An :class:`ExportResult` with the path, row count and timing.
+    """
+    filename = _filename(table_name, fmt, compress)
+    filepath = os.path.join(output_dir, filename)
+    started = time.perf_counter()
+    rows = _stream_query(query, (), headers, filepath, compress, chunk_size,
+                         table_name=table_name, fmt=fmt)
+    result = ExportResult(table_name, filepath, rows, time.perf_counter() - started)
+    print(f"  ✓ {filename}  ({rows} rows, {result.rows_per_sec:,.0f} rows/s)")
+    return result
+
+
+def _stream_query(
+    query: str,
+    params: Sequence[Any],
+    headers: Sequence[str],
+    filepath: str,
+    compress: bool,
+    chunk_size: int,
+    on_chunk: Optional[Callable[[List[Any]], List[Any]]] = None,
+    table_name: Optional[str] = None,
+    fmt: str = "csv",
+) -> int:
+    """Write a query's rows to *filepath* chunk by chunk; return rows written.
+
+    *on_chunk*, if given, maps each fetched chunk to the rows to write.
+    Columnar formats need *table_name* to pick the schema.
+    """
+    tmp_path = filepath + ".part"
+    rows = 0
     conn = get_connection()
     try:
         cursor = conn.cursor()
-        cursor.execute(query)
-        rows = cursor.fetchall()
+        try:
+            cursor.execute(query, params)
+            if fmt == "csv":
+                sink = _CSVSink(tmp_path, headers, compress)
+            else:
+                sink = columnar.ColumnarWriter(table_name, tmp_path, fmt)
+            try:
+                while True:
+                    chunk = cursor.fetchmany(chunk_size)
+                    if not chunk:
+                        break
+                    if on_chunk is not None:
+                        chunk = on_chunk(chunk)
+                    sink.write(chunk)
+                    rows += len(chunk)
+            finally:
+                sink.close()
+        finally:
+            cursor.close()
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     finally:
-        cursor.close()
         conn.close()
+    os.replace(tmp_path, filepath)
+    return rows
 
-    filepath = os.path.join(OUTPUT_DIR, f"{table_name}.csv")
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-        writer.writerows(rows)
 
-    print(f"  ✓ {table_name}.csv  ({len(rows)} rows)")
-    return filepath
+def export_all(
+    output_dir: str = OUTPUT_DIR,
+    compress: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = len(EXPORTS),
+    fmt: str = "csv",
+) -> List[ExportResult]:
+    """Export every table in :data:`EXPORTS`, *workers* tables at a time."""
+    ensure_output_dir(output_dir)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [
+            pool.submit(export_table, table, query, headers,
+                        output_dir, compress, chunk_size, fmt)
+            for table, query, headers in EXPORTS
+        ]
+        return [future.result() for future in futures]
 
 
-def main() -> None:
-    ensure_output_dir()
-    print("Exporting data to CSV …\n")
+# ── Incremental export ───────────────────────────────────────────────
+#
+# Each table has a high-water mark column.  orders and order_items are
+# append-mostly, so their ``id`` is enough; products and customers are
+# edited in place and use ``updated_at``.  A run exports only the rows
+# past the stored mark as a new numbered segment under
+# ``INCREMENTAL_DIR/<table>/`` and records the new mark in ``state.json``;
+# :func:`compact` later folds the segments into ``<table>.csv`` there.
+#
+# Deleted rows are not detected; an occasional full export covers them.
 
-    export_table(
-        "products",
-        "SELECT id, name, category, price, quantity_in_stock FROM products",
-        ["id", "name", "category", "price", "quantity_in_stock"],
-    )
+INCREMENTAL_DIR = os.path.join(OUTPUT_DIR, "incremental")
+STATE_FILE = "state.json"
 
-    export_table(
-        "customers",
-        "SELECT id, name, email FROM customers",
-        ["id", "name", "email"],
-    )
+WATERMARKS = {
+    "products": "updated_at",
+    "customers": "updated_at",
+    "orders": "id",
+    "order_items": "id",
+}
 
-    export_table(
-        "orders",
-        "SELECT id, customer_id, order_date FROM orders",
-        ["id", "customer_id", "order_date"],
-    )
 
-    export_table(
-        "order_items",
-        "SELECT id, order_id, product_id, quantity, unit_price FROM order_items",
-        ["id", "order_id", "product_id", "quantity", "unit_price"],
+@dataclass
+class Watermark:
+    """Where the previous incremental run of a table stopped.
+
+    ``updated_at`` is not unique, so the ids already exported at exactly
+    ``value`` are kept too; the next run re-reads that timestamp and skips
+    them instead of missing rows changed later in the same second.
+    """
+
+    value: Any
+    seen: List[int] = field(default_factory=list)
+
+
+def load_state(output_dir: str = INCREMENTAL_DIR) -> Dict[str, Watermark]:
+    """Return the per-table watermarks from the state file (empty if none)."""
+    path = os.path.join(output_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    state = {}
+    for table, entry in raw.items():
+        value = entry["value"]
+        if WATERMARKS.get(table) != "id":
+            value = datetime.fromisoformat(value)
+        state[table] = Watermark(value, entry.get("seen", []))
+    return state
+
+
+def save_state(state: Dict[str, Watermark], output_dir: str = INCREMENTAL_DIR) -> None:
+    """Atomically write *state* to the state file."""
+    path = os.path.join(output_dir, STATE_FILE)
+    raw = {}
+    for table, mark in state.items():
+        value = mark.value.isoformat(" ") if isinstance(mark.value, datetime) else mark.value
+        raw[table] = {"value": value, "seen": mark.seen} if mark.seen else {"value": value}
+    with open(path + ".part", "w", encoding="utf-8") as f:
+        json.dump(raw, f, indent=2, sort_keys=True)
+    os.replace(path + ".part", path)
+
+
+def _segments(table_dir: str) -> List[str]:
+    names = sorted(
+        name for name in os.listdir(table_dir)
+        if name.startswith("segment-") and not name.endswith(".part")
     )
+    return [os.path.join(table_dir, name) for name in names]
+
+
+def export_increment(
+    table_name: str,
+    headers: Sequence[str],
+    since: Optional[Watermark] = None,
+    output_dir: str = INCREMENTAL_DIR,
+    compress: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[Optional[ExportResult], Optional[Watermark]]:
+    """Export the rows of *table_name* past *since* as a new segment.
+
+    The first run (``since=None``) exports the whole table.
+
+    Returns:
+        ``(result, new_watermark)``; *result* is *None*, and no segment is
+        kept, when nothing changed.
+    """
+    column = WATERMARKS[table_name]
+    select = list(headers) + ([column] if column not in headers else [])
+    mark_at, id_at, width = select.index(column), select.index("id"), len(headers)
+    query = f"SELECT {', '.join(select)} FROM {table_name}"
+    params: Tuple[Any, ...] = ()
+    if since is not None:
+        query += f" WHERE {column} {'>' if column == 'id' else '>='} %s"
+        params = (since.value,)
+
+    table_dir = os.path.join(output_dir, table_name)
+    os.makedirs(table_dir, exist_ok=True)
+    existing = _segments(table_dir)
+    number = int(os.path.basename(existing[-1])[8:14]) + 1 if existing else 1
+    filename = f"segment-{number:06d}.csv" + (".gz" if compress else "")
+    filepath = os.path.join(table_dir, filename)
+
+    skip = set(since.seen) if since is not None else set()
+    top = Watermark(since.value, list(since.seen)) if since is not None else None
+
+    def new_rows(chunk: List[Any]) -> List[Any]:
+        nonlocal top
+        out = []
+        for row in chunk:
+            value = row[mark_at]
+            if since is not None and value == since.value and row[id_at] in skip:
+                continue
+            if top is None or value > top.value:
+                top = Watermark(value)
+            if column != "id" and value == top.value:
+                top.seen.append(row[id_at])
+            out.append(row[:width])
+        return out
+
+    started = time.perf_counter()
+    rows = _stream_query(query, params, headers, filepath, compress, chunk_size, new_rows)
+    if rows == 0:
+        os.remove(filepath)
+        return None, since
+    result = ExportResult(table_name, filepath, rows, time.perf_counter() - started)
+    print(f"  ✓ {table_name}/{filename}  ({rows} rows, {result.rows_per_sec:,.0f} rows/s)")
+    return result, top
+
+
+def export_incremental(
+    output_dir: str = INCREMENTAL_DIR,
+    compress: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = len(EXPORTS),
+) -> List[ExportResult]:
+    """Run :func:`export_increment` for every table and save the new marks.
+
+    The state file is only updated after every segment is safely written.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    state = load_state(output_dir)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            table: pool.submit(export_increment, table, headers, state.get(table),
+                               output_dir, compress, chunk_size)
+            for table, _, headers in EXPORTS
+        }
+        outcomes = {table: future.result() for table, future in futures.items()}
+    results = []
+    for table, (result, mark) in outcomes.items():
+        if result is not None:
+            results.append(result)
+            state[table] = mark
+    save_state(state, output_dir)
+    return results
+
+
+def compact(table_name: str, output_dir: str = INCREMENTAL_DIR, compress: bool = False) -> Optional[str]:
+    """Merge ``<table>.csv`` and its pending segments into a new ``<table>.csv``.
+
+    Append-only tables (``id`` watermark) are concatenated as a stream.
+    Tables tracked by ``updated_at`` keep the last version of each id,
+    which needs their rows in memory (products and customers are small).
+
+    Returns:
+        The compacted file's path, or *None* if the table has no data yet.
+    """
+    table_dir = os.path.join(output_dir, table_name)
+    segments = _segments(table_dir) if os.path.isdir(table_dir) else []
+    bases = [
+        os.path.join(output_dir, name)
+        for name in (f"{table_name}.csv", f"{table_name}.csv.gz")
+        if os.path.exists(os.path.join(output_dir, name))
+    ]
+    sources = bases + segments
+    if not sources:
+        return None
+    target = os.path.join(output_dir, f"{table_name}.csv" + (".gz" if compress else ""))
+    if not segments and bases == [target]:
+        return target
+
+    def read(path: str) -> Iterator[List[str]]:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            yield next(reader)
+            yield from reader
+
+    tmp_path = target + ".part"
+    with _open_output(tmp_path, compress) as out:
+        writer = csv.writer(out)
+        header_written = False
+        latest: Dict[str, List[str]] = {}
+        for path in sources:
+            rows = read(path)
+            header = next(rows)
+            if not header_written:
+                writer.writerow(header)
+                header_written = True
+            if WATERMARKS[table_name] == "id":
+                writer.writerows(rows)
+            else:
+                for row in rows:
+                    latest.pop(row[0], None)
+                    latest[row[0]] = row
+        writer.writerows(sorted(latest.values(), key=lambda row: int(row[0])))
+    os.replace(tmp_path, target)
+    for path in sources:
+        if path != target:
+            os.remove(path)
+    print(f"  ✓ compacted {table_name} ({len(segments)} segment(s))")
+    return target
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output-dir", default=None,
+                        help=f"default: {OUTPUT_DIR} (incremental: {INCREMENTAL_DIR})")
+    parser.add_argument("--gzip", action="store_true", help="write .csv.gz files")
+    parser.add_argument("--format", choices=FORMATS, default="csv",
+                        help="parquet/feather: typed columnar files (needs pyarrow)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=len(EXPORTS),
+                        help="tables exported in parallel")
+    parser.add_argument("--incremental", action="store_true",
+                        help="export only rows past the stored watermarks, as segments")
+    parser.add_argument("--compact", action="store_true",
+                        help="merge incremental segments into one file per table")
+    args = parser.parse_args(argv)
+    incremental = args.incremental or args.compact
+    if incremental and args.format != "csv":
+        parser.error("--incremental and --compact only write CSV")
+    output_dir = args.output_dir or (INCREMENTAL_DIR if incremental else OUTPUT_DIR)
 
-    print("\nDone! Files saved to:", OUTPUT_DIR)
+    results: List[ExportResult] = []
+    started = time.perf_counter()
+    if args.incremental:
+        print("Exporting new and changed rows …\n")
+        results = export_incremental(output_dir, args.gzip, args.chunk_size, args.workers)
+        if not results:
+            print("  (nothing new)")
+    elif not args.compact:
+        print(f"Exporting data to {args.format.upper()} …\n")
+        results = export_all(output_dir, args.gzip, args.chunk_size, args.workers, args.format)
+    if args.compact:
+        for table, _, _ in EXPORTS:
+            compact(table, output_dir, args.gzip)
+    elapsed = time.perf_counter() - started
+    total = sum(r.rows for r in results)
+    rate = total / elapsed if elapsed > 0 else total
+    print(f"\nDone! {total} rows in {elapsed:.2f}s ({rate:,.0f} rows/s). "
+          f"Files saved to: {output_dir}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+"""Benchmark the notebook's report code against analytics/engine.py.
+
+Generates synthetic products, customers, orders and order items, then
+times every report both ways: the original notebook cells (merges, a
+line total per report and the per-group lambda for best sellers) and
+:class:`SalesAnalytics`.
+
+Run from the smart_inventory root:
+    python benchmarks/bench_analytics_engine.py                # 10M order items
+    python benchmarks/bench_analytics_engine.py --items 1000000 --skip-notebook
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add parent to path so we can import from analytics
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from analytics.engine import SalesAnalytics
+
+
+def make_frames(n_items: int, n_products: int, n_customers: int, seed: int = 42):
+    rng = np.random.default_rng(seed)
+    n_orders = max(1, n_items // 4)
+    products = pd.DataFrame({
+        "id": np.arange(1, n_products + 1),
+        "name": [f"Product {i}" for i in range(n_products)],
+        "category": pd.Categorical.from_codes(
+            rng.integers(0, 8, n_products),
+            ["Electronics", "Accessories", "Audio", "Storage",
+             "Networking", "Office", "Gaming", "Cables"],
+        ),
+        "price": rng.integers(99, 99_999, n_products) / 100,
+        "quantity_in_stock": rng.integers(0, 500, n_products),
+    })
+    customers = pd.DataFrame({
+        "id": np.arange(1, n_customers + 1),
+        "name": [f"Customer {i}" for i in range(n_customers)],
+        "email": [f"customer{i}@example.com" for i in range(n_customers)],
+    })
+    start = np.datetime64("2024-01-01T00:00:00", "s")
+    orders = pd.DataFrame({
+        "id": np.arange(1, n_orders + 1),
+        "customer_id": rng.integers(1, n_customers + 1, n_orders),
+        "order_date": start + rng.integers(0, 2 * 365 * 86_400, n_orders),
+    })
+    order_items = pd.DataFrame({
+        "id": np.arange(1, n_items + 1),
+        "order_id": rng.integers(1, n_orders + 1, n_items),
+        "product_id": rng.integers(1, n_products + 1, n_items),
+        "quantity": rng.integers(1, 10, n_items),
+        "unit_price": rng.integers(99, 99_999, n_items) / 100,
+    })
+    return products, customers, orders, order_items
+
+
+def notebook_reports(products_df, customers_df, orders_df, order_items_df) -> None:
+    """The analysis notebook's cells, as they were (display calls removed)."""
+    order_items_df = order_items_df.copy()
+    products_df = products_df.copy()
+
+    items_with_dates = order_items_df.merge(orders_df[["id", "order_date"]], left_on="order_id", right_on="id", suffixes=("", "_order"))
+    items_with_dates["line_total"] = items_with_dates["quantity"] * items_with_dates["unit_price"]
+    items_with_dates["year_month"] = items_with_dates["order_date"].dt.to_period("M")
+    items_with_dates.groupby("year_month")["line_total"].sum().reset_index()
+
+    items_with_products = order_items_df.merge(
+        products_df[["id", "name", "category"]],
+        left_on="product_id", right_on="id", suffixes=("", "_product")
+    )
+    (
+        items_with_products
+        .groupby("name")
+        .agg(
+            total_qty_sold=("quantity", "sum"),
+            total_revenue=("unit_price", lambda x: np.sum(x.values * items_with_products.loc[x.index, "quantity"].values)),
+        )
+        .sort_values("total_qty_sold", ascending=False)
+        .reset_index()
+    )
+
+    products_df["stock_value"] = products_df["price"] * products_df["quantity_in_stock"]
+    products_df.groupby("category").agg(
+        num_products=("name", "count"),
+        total_stock_units=("quantity_in_stock", "sum"),
+        total_stock_value=("stock_value", "sum"),
+    )
+
+    order_items_df["line_total"] = order_items_df["quantity"] * order_items_df["unit_price"]
+    order_totals = (
+        order_items_df.groupby("order_id")["line_total"].sum()
+        .reset_index().rename(columns={"line_total": "order_total"})
+    )
+    np.mean(order_totals["order_total"].values)
+    np.median(order_totals["order_total"].values)
+
+    orders_with_customers = orders_df.merge(
+        customers_df[["id", "name"]], left_on="customer_id", right_on="id", suffixes=("", "_cust")
+    )
+    orders_with_totals = orders_with_customers.merge(order_totals, left_on="id", right_on="order_id", how="left")
+    orders_with_totals.groupby("name").agg(
+        num_orders=("id", "count"),
+        total_spent=("order_total", "sum"),
+        avg_order_value=("order_total", "mean"),
+    )
+
+
+def engine_reports(products_df, customers_df, orders_df, order_items_df) -> None:
+    engine = SalesAnalytics(products_df, customers_df, orders_df, order_items_df)
+    engine.revenue_by_month()
+    engine.best_sellers()
+    engine.stock_by_category()
+    engine.order_value_stats()
+    engine.customer_spend()
+
+
+def timed(label: str, func) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f}s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000_000)
+    parser.add_argument("--products", type=int, default=2_000)
+    parser.add_argument("--customers", type=int, default=50_000)
+    parser.add_argument("--skip-notebook", action="store_true",
+                        help="time the engine only (the lambda is slow at 10M rows)")
+    args = parser.parse_args()
+
+    frames = make_frames(args.items, args.products, args.customers)
+    print(f"All reports over {args.items:,} order items, {args.products:,} products\n")
+    t_engine = timed("analytics.engine", lambda: engine_reports(*frames))
+    if not args.skip_notebook:
+        t_notebook = timed("notebook cells", lambda: notebook_reports(*frames))
+        print(f"\n  speed-up: {t_notebook / t_engine:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Benchmark the read-only views under ASGI vs WSGI: latency and concurrency.
+
+Seeds a throw-away SQLite database with ``generate_data``, then serves
+the same mix of GET requests (dashboard, product / customer / order
+lists, product and order detail) through Django's two request handlers,
+in process and without sockets:
+
+* WSGI: ``WSGIHandler`` called from a pool of N threads, the way a
+  threaded WSGI server (gunicorn ``gthread``, mod_wsgi) runs it;
+* ASGI: ``ASGIHandler`` called from N concurrent tasks on one event
+  loop, the way an ASGI server (uvicorn, daphne) runs it.
+
+SQLite answers in microseconds, so ``--db-latency`` adds a sleep per
+query to stand in for a MySQL round trip; pass 0 to measure SQLite as is.
+
+Run from the smart_inventory root:
+    python benchmarks/bench_asgi_wsgi.py
+    python benchmarks/bench_asgi_wsgi.py --concurrency 1,16,64 --db-latency 1
+"""
+
+import argparse
+import asyncio
+import io
+import logging
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence
+
+# Add web/ to path so we can import the Django project
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "web"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+
+def percentile(ordered: Sequence[float], pct: float) -> float:
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+def report(label: str, concurrency: int, elapsed: float, latencies: List[float]) -> None:
+    latencies = sorted(latencies)
+    print(
+        f"  {label:<5} {concurrency:>5} {len(latencies) / elapsed:9,.0f} "
+        f"{percentile(latencies, 50) * 1000:9.1f} {percentile(latencies, 99) * 1000:9.1f}"
+    )
+
+
+# ── WSGI: a thread per in-flight request ─────────────────────────────
+
+def run_wsgi(urls: List[str], concurrency: int) -> List[float]:
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.test.client import RequestFactory
+
+    handler = WSGIHandler()
+    factory = RequestFactory()
+
+    def one(url: str) -> float:
+        start = time.perf_counter()
+        statuses = []
+        body = handler(factory._base_environ(PATH_INFO=url, REQUEST_METHOD="GET"),
+                       lambda status, headers, exc_info=None: statuses.append(status))
+        try:
+            b"".join(body)
+        finally:
+            body.close()
+        if not statuses[0].startswith("200"):
+            raise RuntimeError(f"GET {url} returned {statuses[0]}")
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(one, urls))
+
+
+# ── ASGI: a task per in-flight request, one event loop ───────────────
+
+def run_asgi(urls: List[str], concurrency: int) -> List[float]:
+    from django.core.handlers.asgi import ASGIHandler
+
+    handler = ASGIHandler()
+
+    async def one(url: str) -> float:
+        start = time.perf_counter()
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": "GET", "scheme": "http", "path": url, "raw_path": url.encode(),
+            "query_string": b"", "root_path": "", "headers": [(b"host", b"testserver")],
+            "client": ("127.0.0.1", 50000), "server": ("testserver", 80),
+        }
+        received = False
+        status = []
+
+        async def receive():
+            nonlocal received
+            if not received:
+                received = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await asyncio.Future()  # the client never disconnects
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                status.append(message["status"])
+
+        await handler(scope, receive, send)
+        if status[0] != 200:
+            raise RuntimeError(f"GET {url} returned {status[0]}")
+        return time.perf_counter() - start
+
+    async def main() -> List[float]:
+        limit = asyncio.Semaphore(concurrency)
+
+        async def limited(url: str) -> float:
+            async with limit:
+                return await one(url)
+
+        return await asyncio.gather(*(limited(url) for url in urls))
+
+    return asyncio.run(main())
+
+
+def timed(label: str, run: Callable[[List[str], int], List[float]], urls: List[str], concurrency: int) -> None:
+    start = time.perf_counter()
+    latencies = run(urls, concurrency)
+    report(label, concurrency, time.perf_counter() - start, latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=5_000)
+    parser.add_argument("--requests", type=int, default=400, help="requests per run")
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated in-flight request counts")
+    parser.add_argument("--db-latency", type=float, default=2.0, help="simulated ms per SQL query")
+    args = parser.parse_args()
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    import django
+    from django.conf import settings
+
+    tmpdir = tempfile.TemporaryDirectory()
+    # A file database, so every worker thread's connection sees the same data.
+    settings.DATABASES["default"]["TEST"] = {"NAME": os.path.join(tmpdir.name, "bench.sqlite3")}
+    django.setup()
+
+    from django.core.management import call_command
+    from django.db import connection as django_connection
+    from django.db.backends.signals import connection_created
+    from django.test.utils import setup_test_environment, teardown_test_environment
+    from django.urls import reverse
+
+    from inventory.models import Customer, Order, Product
+
+    def db_latency(execute, sql, params, many, context):
+        time.sleep(args.db_latency / 1000)
+        return execute(sql, params, many, context)
+
+    def add_latency(sender, connection, **kwargs) -> None:
+        if db_latency not in connection.execute_wrappers:
+            connection.execute_wrappers.append(db_latency)
+
+    # Keep the request log lines out of the output.
+    logging.disable(logging.CRITICAL)
+    setup_test_environment()
+    old_name = django_connection.creation.create_test_db(verbosity=0)
+    try:
+        call_command(
+            "generate_data", verbosity=0, stdout=io.StringIO(),
+            products=max(args.orders // 50, 10), customers=max(args.orders // 10, 10), orders=args.orders,
+        )
+        mix = [
+            reverse("dashboard"),
+            reverse("product_list"),
+            reverse("customer_list"),
+            reverse("order_list"),
+            reverse("product_detail", args=[Product.objects.order_by("id").values_list("id", flat=True)[0]]),
+            reverse("order_detail", args=[Order.objects.order_by("-id").values_list("id", flat=True)[0]]),
+        ]
+        urls = [mix[i % len(mix)] for i in range(args.requests)]
+        if args.db_latency > 0:
+            connection_created.connect(add_latency)
+        django_connection.close()
+
+        print(f"{Customer.objects.count():,} customers, {args.orders:,} orders; "
+              f"{args.requests} requests per run, {args.db_latency:g} ms per query\n")
+        print(f"  {'':<5} {'conc':>5} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9}")
+        run_wsgi(mix, 1)   # warm up URL resolving, templates and caches
+        run_asgi(mix, 1)
+        for concurrency in levels:
+            timed("WSGI", run_wsgi, urls, concurrency)
+            timed("ASGI", run_asgi, urls, concurrency)
+    finally:
+        connection_created.disconnect(add_latency)
+        django_connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+        logging.disable(logging.NOTSET)
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
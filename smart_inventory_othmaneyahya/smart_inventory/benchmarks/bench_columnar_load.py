@@ -0,0 +1,109 @@
+"""Benchmark loading the analysis tables from CSV vs. Parquet / Feather.
+
+Generates synthetic ``orders`` and ``order_items`` tables of the given
+size, writes each as CSV (what the notebook used to read), Parquet and
+Feather with the typed schema from ``analytics/columnar.py``, then times
+full and projected loads.  Needs pyarrow.
+
+Run from the smart_inventory root:
+    python benchmarks/bench_columnar_load.py --items 2000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add parent to path so we can import from analytics
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from analytics import columnar
+
+
+def make_tables(n_items: int, seed: int = 42) -> dict:
+    rng = np.random.default_rng(seed)
+    n_orders = max(1, n_items // 4)
+    start = np.datetime64("2024-01-01T00:00:00", "s")
+    orders = pd.DataFrame({
+        "id": np.arange(1, n_orders + 1, dtype=np.int32),
+        "customer_id": rng.integers(1, 5_000, n_orders, dtype=np.int32),
+        "order_date": start + rng.integers(0, 2 * 365 * 86_400, n_orders),
+    })
+    order_items = pd.DataFrame({
+        "id": np.arange(1, n_items + 1, dtype=np.int32),
+        "order_id": rng.integers(1, n_orders + 1, n_items, dtype=np.int32),
+        "product_id": rng.integers(1, 10_000, n_items, dtype=np.int32),
+        "quantity": rng.integers(1, 10, n_items, dtype=np.int32),
+        "unit_price": rng.integers(99, 99_999, n_items) / 100,
+    })
+    return {"orders": orders, "order_items": order_items}
+
+
+def write_all(tables: dict, data_dir: str) -> None:
+    pa = columnar._pyarrow()
+    for name, df in tables.items():
+        df.to_csv(os.path.join(data_dir, f"{name}.csv"), index=False)
+        table = pa.Table.from_pandas(df, preserve_index=False).cast(columnar.schema(name))
+        pa.parquet.write_table(table, os.path.join(data_dir, f"{name}.parquet"),
+                               compression="zstd")
+        with pa.ipc.new_file(os.path.join(data_dir, f"{name}.feather"), table.schema) as writer:
+            writer.write_table(table)
+
+
+def timed(label: str, func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<34} {best:8.3f}s")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2_000_000, help="order_items rows")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N loads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        tables = make_tables(args.items)
+        write_all(tables, data_dir)
+        del tables
+        print(f"Loading orders + order_items ({args.items:,} items)\n")
+        for name in ("orders", "order_items"):
+            sizes = "  ".join(
+                f"{ext[1:]} {os.path.getsize(os.path.join(data_dir, name + ext)) / 2**20:6.1f} MiB"
+                for ext in (".csv", ".parquet", ".feather")
+            )
+            print(f"  {name:<12} {sizes}")
+        print()
+
+        def csv_load() -> None:
+            pd.read_csv(os.path.join(data_dir, "orders.csv"), parse_dates=["order_date"])
+            pd.read_csv(os.path.join(data_dir, "order_items.csv"))
+
+        def columnar_load(fmt: str, columns=None):
+            return lambda: columnar.load_tables(
+                ("orders", "order_items"), columns=columns, data_dir=data_dir, fmt=fmt
+            )
+
+        projection = {"orders": ["id", "order_date"], "order_items": ["order_id", "quantity"]}
+        t_csv = timed("read_csv (all columns)", csv_load, args.repeat)
+        t_parquet = timed("parquet (all columns)", columnar_load("parquet"), args.repeat)
+        t_feather = timed("feather (all columns)", columnar_load("feather"), args.repeat)
+        t_parquet_p = timed("parquet (2 columns per table)",
+                            columnar_load("parquet", projection), args.repeat)
+        t_feather_p = timed("feather (2 columns per table)",
+                            columnar_load("feather", projection), args.repeat)
+
+        print(f"\n  parquet speed-up: {t_csv / t_parquet:6.1f}x  (projected {t_csv / t_parquet_p:6.1f}x)")
+        print(f"  feather speed-up: {t_csv / t_feather:6.1f}x  (projected {t_csv / t_feather_p:6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark model hydration: slotted from_rows vs. the old __dict__ models.
+
+Builds products and customers from database-shaped tuples both ways and
+reports time and memory (``tracemalloc``) per batch: the models as they
+were (plain classes, ``Customer.__init__`` running the email regex, fed
+``dictionary=True`` rows) against the slotted ``from_rows`` factories.
+Then times ``CustomerDAO.find_all`` on SQLite against the old
+dictionary-cursor path.
+
+Run from the smart_inventory root:
+    python benchmarks/bench_model_hydration.py                 # 1M rows
+    python benchmarks/bench_model_hydration.py --rows 200000
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add parent to path so we can import from database / core
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import Customer, Product
+from database import connection, sqlite_backend
+from database.dao import CustomerDAO
+
+
+class LegacyProduct:
+    """core.models.Product before __slots__."""
+
+    def __init__(self, id, name, category, price, quantity_in_stock=0):
+        self.id = id
+        self.name = name
+        self.category = category
+        self.price = float(price)
+        self.quantity_in_stock = int(quantity_in_stock)
+
+
+class LegacyCustomer:
+    """core.models.Customer before __slots__ and from_row."""
+
+    _EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+
+    def __init__(self, id, name, email):
+        self.id = id
+        self.name = name
+        self.email = email
+        if not self._EMAIL_REGEX.match(self.email):
+            raise ValueError(email)
+
+
+def legacy_products(rows):
+    return [LegacyProduct(id=r["id"], name=r["name"], category=r["category"],
+                          price=float(r["price"]), quantity_in_stock=r["quantity_in_stock"])
+            for r in rows]
+
+
+def legacy_customers(rows):
+    return [LegacyCustomer(id=r["id"], name=r["name"], email=r["email"]) for r in rows]
+
+
+def measured(label: str, func):
+    """Run *func* once for time and once under tracemalloc for memory."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    print(f"  {label:<34} {elapsed:8.3f}s  {size / 2**20:8.1f} MiB")
+    return elapsed, size
+
+
+def compare(title: str, legacy, slotted) -> None:
+    print(title)
+    t_old, m_old = measured("old models (dict rows)", legacy)
+    t_new, m_new = measured("slotted from_rows (tuples)", slotted)
+    print(f"  {'':<34} {t_old / t_new:7.1f}x   {m_old / m_new:7.1f}x smaller\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    n = args.rows
+
+    product_rows = [(i, f"Product {i}", "Electronics", 19.99 + i % 100, i % 500) for i in range(1, n + 1)]
+    product_dicts = [dict(zip(("id", "name", "category", "price", "quantity_in_stock"), r))
+                     for r in product_rows]
+    customer_rows = [(i, f"Customer {i}", f"customer{i}@example.com") for i in range(1, n + 1)]
+    customer_dicts = [dict(zip(("id", "name", "email"), r)) for r in customer_rows]
+
+    print(f"Hydrating {n:,} rows\n")
+    compare("Products", lambda: legacy_products(product_dicts), lambda: Product.from_rows(product_rows))
+    compare("Customers", lambda: legacy_customers(customer_dicts), lambda: Customer.from_rows(customer_rows))
+    del product_rows, product_dicts, customer_dicts
+
+    tmpdir = tempfile.TemporaryDirectory()
+    connection.set_driver(sqlite_backend.connect)
+    connection.DB_CONFIG["database"] = os.path.join(tmpdir.name, "bench.db")
+    conn = connection.get_connection()
+    sqlite_backend.create_schema(conn)
+    cursor = conn.cursor()
+    cursor.executemany("INSERT INTO customers (id, name, email) VALUES (%s, %s, %s)", customer_rows)
+    conn.commit()
+    del customer_rows
+
+    def old_find_all():
+        cur = conn.cursor(dictionary=True)
+        cur.execute("SELECT id, name, email FROM customers ORDER BY name, id")
+        return legacy_customers(cur.fetchall())
+
+    compare("CustomerDAO.find_all on SQLite", old_find_all, CustomerDAO().find_all)
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark order creation: create_order + save per order vs create_orders_batch.
+
+Creates the same orders (an EDI-style file) on a throw-away SQLite
+database, once with ``InventoryService.create_order`` and
+``OrderDAO.save`` per order and once with a single
+``InventoryService.create_orders_batch`` call persisted by
+``OrderDAO.save_many`` and ``ProductDAO.reserve_stock`` in one unit of
+work (the per-order path does not write stock, so it is favoured).
+
+Run from the smart_inventory root:
+    python benchmarks/bench_order_batch.py --orders 5000 --lines 5
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Add parent to path so we can import from database / core
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import Customer, Product
+from core.services.inventory_service import InventoryService, OrderRequest
+from database import connection, sqlite_backend
+from database.dao import CustomerDAO, OrderDAO, ProductDAO
+
+
+def timed(label: str, n_orders: int, func) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<32} {elapsed:8.3f}s  {n_orders / elapsed:10,.0f} orders/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=5_000)
+    parser.add_argument("--lines", type=int, default=5)
+    parser.add_argument("--products", type=int, default=200)
+    args = parser.parse_args()
+
+    tmpdir = tempfile.TemporaryDirectory()
+    connection.set_driver(sqlite_backend.connect)
+    connection.DB_CONFIG["database"] = os.path.join(tmpdir.name, "bench.db")
+    conn = connection.get_connection()
+    sqlite_backend.create_schema(conn)
+    conn.close()
+
+    customer = Customer(id=0, name="Bench Customer", email="bench@example.com")
+    CustomerDAO().save(customer)
+    products = []
+    for i in range(args.products):
+        product = Product(id=0, name=f"Bench {i}", category="Bench", price=9.99, quantity_in_stock=10**9)
+        ProductDAO().save(product)
+        products.append(product)
+
+    def lines(n: int):
+        return [(products[(n * args.lines + line) % len(products)], 1 + line % 3) for line in range(args.lines)]
+
+    now = datetime.now()
+    print(f"Creating {args.orders:,} orders x {args.lines} lines on SQLite\n")
+
+    def one_by_one() -> None:
+        dao = OrderDAO()
+        for n in range(args.orders):
+            dao.save(InventoryService.create_order(0, customer, lines(n), now))
+
+    def batched() -> None:
+        requests = [OrderRequest(customer, lines(n), now) for n in range(args.orders)]
+        result = InventoryService.create_orders_batch(
+            requests, order_dao=OrderDAO(), product_dao=ProductDAO()
+        )
+        assert not result.failures
+
+    t_single = timed("create_order + save per order", args.orders, one_by_one)
+    t_batch = timed("create_orders_batch", args.orders, batched)
+    print(f"\n  speed-up: {t_single / t_batch:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
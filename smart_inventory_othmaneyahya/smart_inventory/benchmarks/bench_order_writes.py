@@ -0,0 +1,89 @@
+"""Benchmark per-row vs. batched order writes through OrderDAO.
+
+Runs against a throw-away SQLite database by default, or against the
+MySQL database in *DB_CONFIG* with ``--backend mysql``.
+
+Run from the smart_inventory root:
+    python benchmarks/bench_order_writes.py --orders 200 --lines 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Add parent to path so we can import from database / core
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import Product, Customer, Order, OrderItem
+from database import connection, sqlite_backend
+from database.dao import ProductDAO, CustomerDAO, OrderDAO
+
+
+def make_orders(customer: Customer, products: list[Product], n_orders: int, n_lines: int) -> list[Order]:
+    orders = []
+    for _ in range(n_orders):
+        order = Order(id=0, customer=customer, order_date=datetime.now())
+        for line in range(n_lines):
+            # Build items directly: stock bookkeeping is not what we measure.
+            order.items.append(OrderItem(products[line % len(products)], 1))
+        orders.append(order)
+    return orders
+
+
+def timed(label: str, n_rows: int, func) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f}s  {n_rows / elapsed:12,.0f} rows/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=["sqlite", "mysql"], default="sqlite")
+    parser.add_argument("--orders", type=int, default=200)
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    if args.backend == "sqlite":
+        tmpdir = tempfile.TemporaryDirectory()
+        connection.set_driver(sqlite_backend.connect)
+        connection.DB_CONFIG["database"] = os.path.join(tmpdir.name, "bench.db")
+        conn = connection.get_connection()
+        sqlite_backend.create_schema(conn)
+        conn.close()
+
+    customer = Customer(id=0, name="Bench Customer", email=f"bench{time.time_ns()}@example.com")
+    CustomerDAO().save(customer)
+    products = []
+    for i in range(50):
+        product = Product(id=0, name=f"Bench {i}", category="Bench", price=9.99, quantity_in_stock=10**6)
+        ProductDAO().save(product)
+        products.append(product)
+
+    n_rows = args.orders * args.lines
+    print(f"Writing {args.orders} orders x {args.lines} lines ({n_rows:,} items) on {args.backend}\n")
+
+    per_row = OrderDAO(batch_size=1)
+    batched = OrderDAO(batch_size=args.batch_size)
+
+    orders = make_orders(customer, products, args.orders, args.lines)
+    t_row = timed("save() per-row", n_rows, lambda: [per_row.save(o) for o in orders])
+
+    orders = make_orders(customer, products, args.orders, args.lines)
+    t_batch = timed("save() batched", n_rows, lambda: [batched.save(o) for o in orders])
+
+    orders = make_orders(customer, products, args.orders, args.lines)
+    t_many = timed("save_many() batched", n_rows, lambda: batched.save_many(orders))
+
+    print(f"\n  batched speed-up:   {t_row / t_batch:5.1f}x")
+    print(f"  save_many speed-up: {t_row / t_many:5.1f}x")
+    print(f"\n  pool: {connection.pool_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark InventoryService catalog queries: Product lists vs ProductTable.
+
+Builds the same synthetic catalog as a list of :class:`Product` objects
+and as a columnar :class:`ProductTable`, then times stock value,
+category grouping / per-category value, the low-stock filter and a
+price-range query on both.
+
+Run from the smart_inventory root:
+    python benchmarks/bench_product_table.py                   # 1M products
+    python benchmarks/bench_product_table.py --products 200000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add parent to path so we can import from core
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import Product, ProductTable
+from core.services.inventory_service import InventoryService
+
+CATEGORIES = ["Electronics", "Accessories", "Audio", "Storage",
+              "Networking", "Office", "Gaming", "Cables"]
+
+
+def make_rows(n: int, seed: int = 42):
+    rng = np.random.default_rng(seed)
+    category = rng.integers(0, len(CATEGORIES), n).tolist()
+    price = (rng.integers(99, 99_999, n) / 100).tolist()
+    stock = rng.integers(0, 500, n).tolist()
+    return [(i + 1, f"Product {i}", CATEGORIES[category[i]], price[i], stock[i]) for i in range(n)]
+
+
+def best_of(func, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.products)
+    products = Product.from_rows(rows)
+    table = ProductTable.from_rows(rows)
+    service = InventoryService
+
+    cases = [
+        ("total_stock_value", lambda c: service.total_stock_value(c)),
+        ("stock_value_by_category", lambda c: service.stock_value_by_category(c)),
+        ("products_by_category", lambda c: service.products_by_category(c)),
+        ("low_stock(10)", lambda c: service.low_stock(c, 10)),
+        ("products_in_price_range", lambda c: service.products_in_price_range(c, 100.0, 200.0)),
+    ]
+    print(f"{args.products:,} products, best of {args.repeat}\n")
+    print(f"  {'operation':<26} {'objects':>10} {'table':>10} {'speed-up':>9}")
+    for label, func in cases:
+        t_objects = best_of(lambda: func(products), args.repeat)
+        t_table = best_of(lambda: func(table), args.repeat)
+        print(f"  {label:<26} {t_objects * 1000:8.1f}ms {t_table * 1000:8.2f}ms {t_objects / t_table:8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
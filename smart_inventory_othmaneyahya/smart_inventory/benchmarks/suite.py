@@ -0,0 +1,431 @@
+"""Regression benchmark suite for the DAO, web and analytics hot paths.
+
+Times ``ProductDAO`` / ``OrderDAO`` CRUD and ``OrderDAO.find_by_id``,
+the ``dashboard``, ``order_list`` and ``order_create`` views (through
+Django's test client) and the ``analytics.engine`` reports at several
+data sizes.  Each case records its best wall time, the number of SQL
+statements and the peak Python memory (``tracemalloc``) of one run.
+
+Everything runs on SQLite (a throw-away DAO database and Django's test
+database), seeded by ``database/datagen.py``, so no server is needed.
+Results are compared with a JSON baseline; the exit status is 1 when a
+case got slower or bigger by more than ``--threshold``, or runs more
+queries than before.  A reference ``benchmarks/baseline.json`` is
+committed; when the file is missing, the run records it instead.
+
+Run from the smart_inventory root:
+    python benchmarks/suite.py --save-baseline        # record benchmarks/baseline.json
+    python benchmarks/suite.py                        # compare, exit 1 on regression
+    python benchmarks/suite.py --groups dao,web --threshold 0.5
+    python benchmarks/suite.py --sizes 10000,100000,1000000
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+# Add parent to path so we can import from database / core / analytics
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from analytics.engine import SalesAnalytics
+from core.models import Customer, Order, OrderItem, Product
+from database import connection, datagen, sqlite_backend
+from database.dao import CustomerDAO, OrderDAO, ProductDAO
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+GROUPS = ("dao", "web", "analytics")
+THRESHOLD = 0.25        # relative slow-down / growth that counts as a regression
+MIN_SECONDS = 0.005     # ... ignored below this absolute difference (timer noise)
+MIN_KIB = 64.0          # ... and below this much extra peak memory
+
+QueryCounter = Callable[[], ContextManager[Optional[Callable[[], int]]]]
+
+
+@dataclass
+class Measurement:
+    """One benchmark case: best wall time, SQL statements, peak memory."""
+
+    name: str
+    seconds: float
+    queries: Optional[int]
+    peak_kib: float
+
+
+# ── Measuring ────────────────────────────────────────────────────────
+
+@contextmanager
+def sqlite_queries() -> Iterator[Callable[[], int]]:
+    """Count statements run through the SQLite stand-in driver."""
+    cursor_class = sqlite_backend.SQLiteCursor
+    execute, executemany = cursor_class.execute, cursor_class.executemany
+    count = [0]
+
+    def counted(method):
+        def wrapper(self, *args, **kwargs):
+            count[0] += 1
+            return method(self, *args, **kwargs)
+        return wrapper
+
+    cursor_class.execute = counted(execute)
+    cursor_class.executemany = counted(executemany)
+    try:
+        yield lambda: count[0]
+    finally:
+        cursor_class.execute, cursor_class.executemany = execute, executemany
+
+
+@contextmanager
+def django_queries() -> Iterator[Callable[[], int]]:
+    """Count queries run on Django's default connection."""
+    from django.db import connection as django_connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(django_connection) as captured:
+        yield lambda: len(captured.captured_queries)
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    queries: Optional[QueryCounter] = None,
+    repeat: int = 5,
+    setup: Optional[Callable[[], Any]] = None,
+) -> Measurement:
+    """Time *func* (best of *repeat* after a warm-up run), then run it
+    once more under ``tracemalloc`` and the *queries* counter.
+
+    *setup*, if given, runs untimed before every call.
+    """
+    times = []
+    for attempt in range(repeat + 1):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        if attempt:  # the first run warms caches and imports
+            times.append(time.perf_counter() - start)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        with (queries or nullcontext)() as counted:
+            func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return Measurement(name, min(times), counted() if counted else None, peak / 1024)
+
+
+# ── DAO group ────────────────────────────────────────────────────────
+
+def dao_cases(orders: int, repeat: int) -> List[Measurement]:
+    """ProductDAO / OrderDAO CRUD on a seeded throw-away SQLite database."""
+    tmpdir = tempfile.TemporaryDirectory()
+    saved_db = connection.DB_CONFIG["database"]
+    connection.set_driver(sqlite_backend.connect)
+    connection.DB_CONFIG["database"] = os.path.join(tmpdir.name, "suite.db")
+    try:
+        conn = connection.get_connection()
+        try:
+            sqlite_backend.create_schema(conn)
+            datagen.generate(conn, datagen.DataSpec(
+                products=max(orders // 50, 10), customers=max(orders // 10, 10), orders=orders,
+            ))
+        finally:
+            conn.close()
+
+        customer = Customer(id=0, name="Suite Customer", email="suite@example.com")
+        CustomerDAO().save(customer)
+        products = []
+        for i in range(5):
+            product = Product(id=0, name=f"Suite {i}", category="Bench", price=9.99, quantity_in_stock=10**6)
+            ProductDAO().save(product)
+            products.append(product)
+
+        def make_orders(n: int, lines: int) -> List[Order]:
+            made = []
+            for _ in range(n):
+                order = Order(id=0, customer=customer, order_date=datetime(2026, 1, 1, 12, 0))
+                for line in range(lines):
+                    order.items.append(OrderItem(products[line % len(products)], 1))
+                made.append(order)
+            return made
+
+        def product_crud() -> None:
+            dao = ProductDAO()
+            batch = [Product(id=0, name=f"CRUD {i}", category="Bench", price=1.0 + i, quantity_in_stock=10)
+                     for i in range(50)]
+            for product in batch:
+                dao.save(product)
+            for product in batch:
+                dao.find_by_id(product.id)
+                product.price += 1
+                dao.update(product)
+            for product in batch:
+                dao.delete(product.id)
+
+        def order_crud() -> None:
+            dao = OrderDAO()
+            for order in make_orders(20, 5):
+                dao.save(order)
+                dao.find_by_id(order.id)
+                dao.delete(order.id)
+
+        def order_save_many() -> None:
+            OrderDAO().save_many(make_orders(100, 5))
+
+        step = max(orders // 100, 1)
+        lookup_ids = list(range(1, orders + 1, step))[:100]
+
+        def order_find_by_id() -> None:
+            dao = OrderDAO()
+            for order_id in lookup_ids:
+                dao.find_by_id(order_id)
+
+        return [
+            measure("dao.product_crud[x50]", product_crud, sqlite_queries, repeat),
+            measure("dao.order_crud[x20]", order_crud, sqlite_queries, repeat),
+            measure("dao.order_save_many[100x5]", order_save_many, sqlite_queries, repeat),
+            measure(f"dao.order_find_by_id[x{len(lookup_ids)}]", order_find_by_id, sqlite_queries, repeat),
+        ]
+    finally:
+        connection.DB_CONFIG["database"] = saved_db
+        connection.set_driver(None)
+        tmpdir.cleanup()
+
+
+# ── Web group ────────────────────────────────────────────────────────
+
+def web_cases(orders: int, repeat: int) -> List[Measurement]:
+    """The dashboard, order list and order form through the test client,
+    on a seeded Django test database."""
+    import io
+    import logging
+
+    sys.path.insert(0, os.path.join(ROOT, "web"))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+    import django
+    django.setup()
+
+    from django.core.cache import cache
+    from django.core.management import call_command
+    from django.db import connection as django_connection
+    from django.test import Client
+    from django.test.utils import setup_test_environment, teardown_test_environment
+    from django.urls import reverse
+
+    from inventory.models import Customer as CustomerModel, Product as ProductModel
+
+    # Keep the view loggers out of debug.log.
+    logging.disable(logging.CRITICAL)
+    setup_test_environment()
+    old_name = django_connection.creation.create_test_db(verbosity=0)
+    try:
+        call_command(
+            "generate_data", verbosity=0, stdout=io.StringIO(),
+            products=max(orders // 50, 10), customers=max(orders // 10, 10), orders=orders,
+        )
+        client = Client()
+        customer = CustomerModel.objects.order_by("id").first()
+        stocked = list(ProductModel.objects.order_by("-quantity_in_stock")[:3])
+        for product in stocked:
+            product.quantity_in_stock = 10**6
+            product.save(update_fields=["quantity_in_stock"])
+        order_data = {
+            "customer": customer.pk,
+            "items-TOTAL_FORMS": len(stocked),
+            "items-INITIAL_FORMS": 0,
+            "items-MIN_NUM_FORMS": 1,
+            "items-MAX_NUM_FORMS": 1000,
+        }
+        for i, product in enumerate(stocked):
+            order_data[f"items-{i}-product"] = product.pk
+            order_data[f"items-{i}-quantity"] = 1
+
+        def get(url: str) -> Callable[[], None]:
+            def view() -> None:
+                response = client.get(url)
+                if response.status_code != 200:
+                    raise RuntimeError(f"GET {url} returned {response.status_code}")
+            return view
+
+        def order_create() -> None:
+            response = client.post(reverse("order_create"), order_data)
+            if response.status_code != 302:
+                raise RuntimeError(f"order_create returned {response.status_code}, expected a redirect")
+
+        return [
+            measure("web.dashboard (cold cache)", get(reverse("dashboard")), django_queries, repeat,
+                    setup=cache.clear),
+            measure("web.dashboard", get(reverse("dashboard")), django_queries, repeat),
+            measure("web.order_list", get(reverse("order_list")), django_queries, repeat),
+            measure("web.order_create[3 lines]", order_create, django_queries, repeat),
+        ]
+    finally:
+        django_connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+        logging.disable(logging.NOTSET)
+
+
+# ── Analytics group ──────────────────────────────────────────────────
+
+def analytics_frames(orders: int) -> Dict[str, pd.DataFrame]:
+    """The four tables as DataFrames, straight from the generator."""
+    spec = datagen.DataSpec(products=max(orders // 50, 10), customers=max(orders // 10, 10), orders=orders)
+    products, prices = datagen.product_rows(spec)
+    chunks = list(datagen.order_chunks(spec, prices))
+    rows = {
+        "products": products,
+        "customers": datagen.customer_rows(spec),
+        "orders": [row for chunk, _ in chunks for row in chunk],
+        "order_items": [row for _, chunk in chunks for row in chunk],
+    }
+    frames = {table: pd.DataFrame(rows[table], columns=datagen.COLUMNS[table]) for table in rows}
+    frames["orders"]["order_date"] = pd.to_datetime(frames["orders"]["order_date"])
+    return frames
+
+
+def analytics_cases(sizes: Sequence[int], repeat: int) -> List[Measurement]:
+    """Every ``SalesAnalytics`` report, from a fresh engine, per data size."""
+    results = []
+    for orders in sizes:
+        frames = analytics_frames(orders)
+
+        def reports(frames=frames) -> None:
+            engine = SalesAnalytics(**frames)
+            engine.total_revenue()
+            engine.revenue_by_month()
+            engine.best_sellers()
+            engine.stock_by_category()
+            engine.order_value_stats()
+            engine.customer_spend()
+
+        items = len(frames["order_items"])
+        results.append(measure(f"analytics.reports[{items:,} items]", reports, repeat=repeat))
+    return results
+
+
+# ── Baselines ────────────────────────────────────────────────────────
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, results: Sequence[Measurement], meta: Dict[str, Any]) -> None:
+    data = {"meta": meta, "results": {m.name: asdict(m) for m in results}}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def compare(
+    results: Sequence[Measurement],
+    baseline: Dict[str, Any],
+    threshold: float = THRESHOLD,
+) -> List[str]:
+    """Return one message per regression against *baseline* (``results`` section).
+
+    A case regresses when its time or peak memory grew by more than
+    *threshold* (and by more than :data:`MIN_SECONDS` / :data:`MIN_KIB`),
+    or when it runs more queries.  Cases missing from the baseline are
+    not compared.
+    """
+    regressions = []
+    for m in results:
+        base = baseline.get(m.name)
+        if base is None:
+            continue
+        if m.seconds > base["seconds"] * (1 + threshold) and m.seconds - base["seconds"] > MIN_SECONDS:
+            regressions.append(f"{m.name}: {base['seconds']:.4f}s -> {m.seconds:.4f}s")
+        if m.queries is not None and base.get("queries") is not None and m.queries > base["queries"]:
+            regressions.append(f"{m.name}: {base['queries']} -> {m.queries} queries")
+        if m.peak_kib > base["peak_kib"] * (1 + threshold) and m.peak_kib - base["peak_kib"] > MIN_KIB:
+            regressions.append(f"{m.name}: peak {base['peak_kib']:,.0f} -> {m.peak_kib:,.0f} KiB")
+    return regressions
+
+
+def report(results: Sequence[Measurement], baseline: Optional[Dict[str, Any]]) -> None:
+    print(f"  {'case':<40} {'time':>10} {'vs base':>8} {'queries':>8} {'peak KiB':>10}")
+    for m in results:
+        base = (baseline or {}).get(m.name)
+        change = f"{(m.seconds / base['seconds'] - 1) * 100:+7.1f}%" if base and base["seconds"] else "       -"
+        queries = "-" if m.queries is None else str(m.queries)
+        print(f"  {m.name:<40} {m.seconds:9.4f}s {change:>8} {queries:>8} {m.peak_kib:10,.0f}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", default=",".join(GROUPS),
+                        help=f"comma-separated subset of {', '.join(GROUPS)}")
+    parser.add_argument("--orders", type=int, default=20_000,
+                        help="orders seeded into the DAO / Django databases")
+    parser.add_argument("--sizes", default="10000,100000",
+                        help="comma-separated order counts for the analytics reports")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write the results as the new baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed relative growth in time / peak memory (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    groups = [g.strip() for g in args.groups.split(",") if g.strip()]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown group(s): {', '.join(sorted(unknown))}")
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    results: List[Measurement] = []
+    if "dao" in groups:
+        results += dao_cases(args.orders, args.repeat)
+    if "web" in groups:
+        results += web_cases(args.orders, args.repeat)
+    if "analytics" in groups:
+        results += analytics_cases(sizes, args.repeat)
+
+    meta = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "orders": args.orders,
+        "repeat": args.repeat,
+    }
+    baseline = None if args.save_baseline else load_baseline(args.baseline)
+    if baseline is None:
+        # --save-baseline, or the first run on this checkout: record it.
+        report(results, None)
+        save_baseline(args.baseline, results, meta)
+        print(f"\n  baseline saved to {args.baseline}")
+        return 0
+
+    report(results, baseline["results"])
+    if baseline["meta"].get("orders") != args.orders:
+        print(f"\n  note: baseline was seeded with {baseline['meta'].get('orders')} orders, not {args.orders}")
+    regressions = compare(results, baseline["results"], args.threshold)
+    if regressions:
+        print(f"\n  {len(regressions)} regression(s) over {args.threshold:.0%}:")
+        for message in regressions:
+            print(f"    {message}")
+        return 1
+    print("\n  no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,5 +4,6 @@ from .product import Product
 from .customer import Customer
 from .order import Order
 from .order_item import OrderItem
+from .product_table import ProductTable
 
-__all__ = ["Product", "Customer", "Order", "OrderItem"]
+__all__ = ["Product", "Customer", "Order", "OrderItem", "ProductTable"]
@@ -6,6 +6,7 @@ Includes email validation logic.
 from __future__ import annotations
 
 import re
+from typing import Any, Iterable, List, Sequence
 
 from core.exceptions import InvalidEmailException
 
@@ -19,6 +20,8 @@ class Customer:
         email: Email address (validated on creation).
     """
 
+    __slots__ = ("id", "name", "email")
+
     _EMAIL_REGEX = re.compile(
         r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
     )
@@ -29,6 +32,29 @@ class Customer:
         self.email: str = email
         self.validate_email()
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> Customer:
+        """Build a customer from a trusted ``(id, name, email)`` database
+        row: the email was validated before it was stored, so
+        ``__init__`` and its regex are skipped.
+        """
+        customer = cls.__new__(cls)
+        customer.id, customer.name, customer.email = row
+        return customer
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> List[Customer]:
+        """Build one customer per trusted row (see :meth:`from_row`)."""
+        # from_row inlined: a method call per row is a third of the cost.
+        new = cls.__new__
+        customers = []
+        append = customers.append
+        for row in rows:
+            customer = new(cls)
+            customer.id, customer.name, customer.email = row
+            append(customer)
+        return customers
+
     def validate_email(self) -> bool:
         """Validate the customer's email address.
 
@@ -23,6 +23,8 @@ class Order:
         items: List of :class:`OrderItem` objects.
     """
 
+    __slots__ = ("id", "customer", "order_date", "items")
+
     def __init__(
         self,
         id: int,
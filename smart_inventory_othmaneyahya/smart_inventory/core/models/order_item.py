@@ -18,6 +18,8 @@ class OrderItem:
         quantity: Number of units ordered (must be > 0).
     """
 
+    __slots__ = ("product", "quantity")
+
     def __init__(self, product: "Product", quantity: int) -> None:
         if quantity <= 0:
             raise InvalidQuantityException(quantity=quantity)
@@ -0,0 +1,204 @@
+"""ProductTable — the product catalog as columns (struct of arrays).
+
+Whole-catalog questions (stock value, grouping by category, low-stock
+and price-range filters) touch every product; asking them of a list of
+:class:`Product` objects costs an attribute lookup and a method call per
+product.  A :class:`ProductTable` keeps one NumPy array per field, so
+they become single array operations.
+
+Rows are kept clustered by category (the constructor sorts them
+stably by category code when they are not), so every category is a
+contiguous slice: grouping returns zero-copy views and per-category
+aggregates are one reduction per slice.
+
+Tables are read-only snapshots: build one with
+:meth:`ProductTable.from_cursor` (see ``ProductDAO.load_table``),
+:meth:`ProductTable.from_rows` or :meth:`ProductTable.from_products`,
+and turn rows back into objects with :meth:`ProductTable.to_products`.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.models.product import Product
+
+
+class ProductTable:
+    """Products as parallel arrays, row *i* of each being one product.
+
+    Attributes:
+        ids: ``int64`` product ids.
+        names: Product names (``object`` array of ``str``).
+        prices: ``float64`` unit prices.
+        stock: ``int64`` quantities in stock.
+        category_codes: ``int16`` index into *categories* per product.
+        categories: Category names, in order of first appearance.
+    """
+
+    __slots__ = ("ids", "names", "prices", "stock", "category_codes", "categories")
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        names: np.ndarray,
+        prices: np.ndarray,
+        stock: np.ndarray,
+        category_codes: np.ndarray,
+        categories: Sequence[str],
+    ) -> None:
+        if len(category_codes) > 1 and not (category_codes[1:] >= category_codes[:-1]).all():
+            order = np.argsort(category_codes, kind="stable")
+            ids, names, prices, stock, category_codes = (
+                column[order] for column in (ids, names, prices, stock, category_codes)
+            )
+        self.ids: np.ndarray = ids
+        self.names: np.ndarray = names
+        self.prices: np.ndarray = prices
+        self.stock: np.ndarray = stock
+        self.category_codes: np.ndarray = category_codes
+        self.categories: Tuple[str, ...] = tuple(categories)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> ProductTable:
+        """Build a table from ``(id, name, category, price,
+        quantity_in_stock)`` rows (the ``Product.from_row`` layout)."""
+        builder = _Builder()
+        builder.add(list(rows))
+        return builder.build(cls)
+
+    @classmethod
+    def from_cursor(cls, cursor: Any, batch_size: int = 10_000) -> ProductTable:
+        """Build a table from an executed DB-API *cursor* returning
+        ``from_rows`` rows, fetching *batch_size* rows at a time."""
+        builder = _Builder()
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            builder.add(rows)
+        return builder.build(cls)
+
+    @classmethod
+    def from_products(cls, products: Iterable[Product]) -> ProductTable:
+        return cls.from_rows(
+            (p.id, p.name, p.category, p.price, p.quantity_in_stock) for p in products
+        )
+
+    def to_products(self) -> List[Product]:
+        """Materialise the rows as :class:`Product` objects."""
+        categories = self.categories
+        return Product.from_rows(zip(
+            self.ids.tolist(), self.names.tolist(),
+            [categories[code] for code in self.category_codes.tolist()],
+            self.prices.tolist(), self.stock.tolist(),
+        ))
+
+    def take(self, selector: Union[np.ndarray, slice]) -> ProductTable:
+        """The rows picked by a boolean mask, an index array or a slice
+        (slices share memory with this table)."""
+        if isinstance(selector, np.ndarray) and selector.dtype == bool:
+            # Gathering a few positions beats five boolean scans.
+            selector = np.flatnonzero(selector)
+        return ProductTable(
+            self.ids[selector], self.names[selector], self.prices[selector],
+            self.stock[selector], self.category_codes[selector], self.categories,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __repr__(self) -> str:
+        return f"ProductTable({len(self)} products, {len(self.categories)} categories)"
+
+    # ------------------------------------------------------------------
+    # Whole-catalog operations
+    # ------------------------------------------------------------------
+
+    def stock_values(self) -> np.ndarray:
+        """``price * quantity_in_stock`` per product."""
+        return self.prices * self.stock
+
+    def total_stock_value(self) -> float:
+        return float(np.dot(self.prices, self.stock))
+
+    def category_slices(self) -> Dict[str, slice]:
+        """The rows of each category (categories without rows left out)."""
+        bounds = np.searchsorted(self.category_codes, np.arange(len(self.categories) + 1)).tolist()
+        return {
+            category: slice(bounds[code], bounds[code + 1])
+            for code, category in enumerate(self.categories)
+            if bounds[code + 1] > bounds[code]
+        }
+
+    def group_by_category(self) -> Dict[str, ProductTable]:
+        """One sub-table (a view, not a copy) per category."""
+        return {category: self.take(rows) for category, rows in self.category_slices().items()}
+
+    def category_summary(self) -> Dict[str, Dict[str, float]]:
+        """Per category: number of products, units in stock and stock value."""
+        prices, stock = self.prices, self.stock
+        return {
+            category: {
+                "num_products": rows.stop - rows.start,
+                "total_stock_units": int(stock[rows].sum()),
+                "total_stock_value": float(np.dot(prices[rows], stock[rows])),
+            }
+            for category, rows in self.category_slices().items()
+        }
+
+    def stock_value_by_category(self) -> Dict[str, float]:
+        prices, stock = self.prices, self.stock
+        return {
+            category: float(np.dot(prices[rows], stock[rows]))
+            for category, rows in self.category_slices().items()
+        }
+
+    def low_stock(self, threshold: int) -> ProductTable:
+        """Products with ``quantity_in_stock <= threshold``."""
+        return self.take(self.stock <= threshold)
+
+    def in_price_range(self, low: float, high: float) -> ProductTable:
+        """Products with ``low <= price <= high``."""
+        return self.take((self.prices >= low) & (self.prices <= high))
+
+
+class _Builder:
+    """Accumulates row batches into column chunks for :class:`ProductTable`."""
+
+    def __init__(self) -> None:
+        self.chunks: List[Tuple[np.ndarray, ...]] = []
+        self.codes: Dict[str, int] = {}
+
+    def add(self, rows: Sequence[Sequence[Any]]) -> None:
+        if not rows:
+            return
+        ids, names, categories, prices, stock = zip(*rows)
+        codes = self.codes
+        # setdefault assigns new categories the next code, in order of appearance.
+        category_codes = [codes.setdefault(c, len(codes)) for c in categories]
+        if len(codes) > np.iinfo(np.int16).max + 1:
+            raise ValueError("too many categories for int16 category codes")
+        names_array = np.empty(len(names), dtype=object)
+        names_array[:] = names
+        self.chunks.append((
+            np.array(ids, dtype=np.int64),
+            names_array,
+            np.array(prices, dtype=np.float64),  # DECIMAL columns arrive as Decimal
+            np.array(stock, dtype=np.int64),
+            np.array(category_codes, dtype=np.int16),
+        ))
+
+    def build(self, cls: type) -> ProductTable:
+        if not self.chunks:
+            empty = (np.int64, object, np.float64, np.int64, np.int16)
+            columns = [np.empty(0, dtype=dtype) for dtype in empty]
+        else:
+            columns = [np.concatenate(column) for column in zip(*self.chunks)]
+        return cls(*columns, categories=list(self.codes))
@@ -2,16 +2,47 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from core.models import Product, Customer, Order
+from core.exceptions import InvalidQuantityException, OutOfStockException
+from core.models import Product, Customer, Order, OrderItem, ProductTable
+
+Catalog = Union[List[Product], ProductTable]
+
+
+@dataclass
+class OrderRequest:
+    """One order to create in :meth:`InventoryService.create_orders_batch`."""
+
+    customer: Customer
+    items: List[Tuple[Product, int]]
+    order_date: Optional[datetime] = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of :meth:`InventoryService.create_orders_batch`.
+
+    Attributes:
+        orders: The created orders, in request order.
+        failures: Request index -> the exception that rejected it
+            (:class:`InvalidQuantityException` or
+            :class:`OutOfStockException`).
+    """
+
+    orders: List[Order] = field(default_factory=list)
+    failures: Dict[int, Exception] = field(default_factory=dict)
 
 
 class InventoryService:
     """High-level operations on the inventory.
 
     Provides façade methods used by both the DAO layer and Django views.
+    The catalog-wide queries accept a list of :class:`Product` objects or
+    a :class:`ProductTable`; with a table they run as array operations
+    and return tables (load one with ``ProductDAO.load_table``).
     """
 
     @staticmethod
@@ -37,15 +68,194 @@ class InventoryService:
             order.add_item(product, qty)
         return order
 
+    # Reservation attempts in create_orders_batch before giving up.
+    RESERVE_ATTEMPTS = 3
+
     @staticmethod
-    def total_stock_value(products: List[Product]) -> float:
+    def create_orders_batch(
+        requests: Sequence[OrderRequest],
+        order_dao: Any = None,
+        product_dao: Any = None,
+    ) -> BatchResult:
+        """Create many orders at once, deducting stock once per product.
+
+        Quantities are checked per order; stock is checked against the
+        batch's aggregated per-product demand, so products with enough
+        stock for the whole batch cost no per-order check.  Only orders
+        touching a product the batch over-demands are allocated one by
+        one, in request order (first come, first served).  A rejected
+        order is reported in :attr:`BatchResult.failures` and the rest of
+        the batch goes ahead.
+
+        Products are identified by ``id``; pass one object per product
+        (as the DAOs' loaders do).
+
+        Args:
+            requests: The orders to create.
+            order_dao: Optional DAO with ``save_many`` (``OrderDAO``): the
+                created orders are persisted in one batched write, which
+                assigns their ids, and the batch's per-product demand is
+                taken with ``product_dao.reserve_stock`` in the same unit
+                of work.  Either both are committed or neither is; the
+                products passed in are only updated after the commit.
+            product_dao: DAO with ``unit_of_work``, ``reserve_stock`` and
+                ``find_many`` (``ProductDAO``); required with *order_dao*.
+
+        If the stored stock has dropped below what the products passed in
+        say, the reservation fails and the unit of work rolls back.  The
+        stock of the batch's products is then re-read (and copied onto
+        the products), orders that no longer fit move to
+        :attr:`BatchResult.failures` and the rest are written again, up to
+        :attr:`RESERVE_ATTEMPTS` times.
+
+        Returns:
+            A :class:`BatchResult`.
+
+        Raises:
+            ValueError: If *order_dao* is given without *product_dao*.
+            OutOfStockException: If the reservation still conflicts after
+                :attr:`RESERVE_ATTEMPTS` tries, or conflicts inside an
+                enclosing unit of work (which must then roll back).
+        """
+        if order_dao is not None and product_dao is None:
+            raise ValueError("create_orders_batch needs a product_dao to persist with order_dao")
+        result = BatchResult()
+        products: Dict[int, Product] = {}
+        demands: Dict[int, Dict[int, int]] = {}  # request index -> product id -> quantity
+        for index, request in enumerate(requests):
+            demand: Dict[int, int] = {}
+            try:
+                for product, qty in request.items:
+                    if qty <= 0:
+                        raise InvalidQuantityException(quantity=qty)
+                    products.setdefault(product.id, product)
+                    demand[product.id] = demand.get(product.id, 0) + qty
+            except InvalidQuantityException as exc:
+                result.failures[index] = exc
+                continue
+            demands[index] = demand
+
+        stock = {pid: product.quantity_in_stock for pid, product in products.items()}
+        accepted, taken = InventoryService._allocate(demands, products, stock, result.failures)
+        reserved: Dict[int, Any] = {}
+        attempt = 1
+        while order_dao is not None and accepted:
+            orders = InventoryService._build_orders(requests, accepted)
+            scope = product_dao.unit_of_work()
+            try:
+                with scope as uow:
+                    order_dao.save_many(orders)
+                    product_dao.reserve_stock((pid, qty) for pid, qty in taken.items() if qty)
+                    # reserve_stock already updated the unit of work's own copies.
+                    reserved = {pid: uow.identity_map.get(("products", pid)) for pid in taken}
+            except OutOfStockException:
+                if scope is not uow or attempt >= InventoryService.RESERVE_ATTEMPTS:
+                    raise
+                attempt += 1
+                for stored in product_dao.find_many(list(taken)):
+                    products[stored.id].quantity_in_stock = stock[stored.id] = stored.quantity_in_stock
+                accepted, taken = InventoryService._allocate(
+                    {index: demands[index] for index in accepted}, products, stock, result.failures,
+                )
+                continue
+            result.orders = orders
+            break
+        else:
+            result.orders = InventoryService._build_orders(requests, accepted)
+        for product_id, qty in taken.items():
+            if reserved.get(product_id) is not products[product_id]:
+                products[product_id].quantity_in_stock -= qty
+        return result
+
+    @staticmethod
+    def _allocate(
+        demands: Dict[int, Dict[int, int]],
+        products: Dict[int, Product],
+        stock: Dict[int, int],
+        failures: Dict[int, Exception],
+    ) -> Tuple[List[int], Dict[int, int]]:
+        """Accept the orders in *demands* that *stock* covers, in order.
+
+        Rejected orders are added to *failures*.  Returns the accepted
+        request indexes and the quantity taken per product.
+        """
+        total: Dict[int, int] = {}
+        for demand in demands.values():
+            for product_id, qty in demand.items():
+                total[product_id] = total.get(product_id, 0) + qty
+        # Only over-demanded products need allocating order by order.
+        remaining = {pid: stock[pid] for pid, qty in total.items() if qty > stock[pid]}
+        taken: Dict[int, int] = dict.fromkeys(total, 0)
+        accepted: List[int] = []
+        for index, demand in demands.items():
+            if remaining:
+                short = next(
+                    (pid for pid, qty in demand.items() if pid in remaining and qty > remaining[pid]),
+                    None,
+                )
+                if short is not None:
+                    failures[index] = OutOfStockException(
+                        product_name=products[short].name,
+                        requested=demand[short],
+                        available=remaining[short],
+                    )
+                    continue
+                for pid, qty in demand.items():
+                    if pid in remaining:
+                        remaining[pid] -= qty
+            for pid, qty in demand.items():
+                taken[pid] += qty
+            accepted.append(index)
+        return accepted, taken
+
+    @staticmethod
+    def _build_orders(requests: Sequence[OrderRequest], accepted: List[int]) -> List[Order]:
+        orders: List[Order] = []
+        for index in accepted:
+            request = requests[index]
+            order = Order(id=0, customer=request.customer, order_date=request.order_date)
+            # Quantities were checked by the caller; stock is deducted per product.
+            order.items = [OrderItem(product, qty) for product, qty in request.items]
+            orders.append(order)
+        return orders
+
+    @staticmethod
+    def total_stock_value(products: Catalog) -> float:
         """Return the combined stock value of all products."""
+        if isinstance(products, ProductTable):
+            return products.total_stock_value()
         return sum(p.get_value_in_stock() for p in products)
 
     @staticmethod
-    def products_by_category(products: List[Product]) -> Dict[str, List[Product]]:
-        """Group products by category."""
+    def products_by_category(products: Catalog) -> Dict[str, Catalog]:
+        """Group products by category (a sub-table per category for a table)."""
+        if isinstance(products, ProductTable):
+            return products.group_by_category()
         result: Dict[str, List[Product]] = {}
         for p in products:
             result.setdefault(p.category, []).append(p)
         return result
+
+    @staticmethod
+    def stock_value_by_category(products: Catalog) -> Dict[str, float]:
+        """Return the stock value of each category."""
+        if isinstance(products, ProductTable):
+            return products.stock_value_by_category()
+        result: Dict[str, float] = {}
+        for p in products:
+            result[p.category] = result.get(p.category, 0.0) + p.get_value_in_stock()
+        return result
+
+    @staticmethod
+    def low_stock(products: Catalog, threshold: int = 10) -> Catalog:
+        """Return the products with at most *threshold* units in stock."""
+        if isinstance(products, ProductTable):
+            return products.low_stock(threshold)
+        return [p for p in products if p.quantity_in_stock <= threshold]
+
+    @staticmethod
+    def products_in_price_range(products: Catalog, low: float, high: float) -> Catalog:
+        """Return the products priced between *low* and *high* (inclusive)."""
+        if isinstance(products, ProductTable):
+            return products.in_price_range(low, high)
+        return [p for p in products if low <= p.price <= high]
@@ -0,0 +1,504 @@
+"""Async connections and connection pool for the async DAOs.
+
+The asyncio counterpart of :mod:`database.connection`.  Drivers are
+``async def connect(**config)`` callables returning a connection with
+
+* ``await conn.cursor(dictionary=False)`` -> cursor with ``await
+  execute / executemany / fetchone / fetchmany / fetchall / close`` and
+  ``lastrowid`` / ``rowcount`` attributes,
+* ``await conn.commit() / rollback() / close() / is_connected()``.
+
+Three drivers ship here, picked by :func:`set_driver` or else by the
+synchronous driver configured in :mod:`database.connection`:
+
+* :func:`aiomysql_connect` -- native async MySQL client, the default
+  for MySQL when aiomysql is installed (``pip install aiomysql``);
+* :func:`aiosqlite_connect` -- the default when the DAOs point at
+  :mod:`database.sqlite_backend` and aiosqlite is installed;
+* :func:`threaded` -- **fallback** for when neither package is
+  installed, or for any other synchronous DB-API driver.  It runs each
+  connection's calls on a worker thread of its own, so every open
+  connection costs a thread; install the native driver for real
+  concurrency.
+
+Pools belong to the event loop that created them; call
+:func:`close_pools` before that loop ends.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sqlite3
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from mysql.connector.errors import PoolError
+
+from database import connection, sqlite_backend
+
+AsyncConnect = Callable[..., Awaitable[Any]]
+
+
+# ── Threaded driver (fallback) ───────────────────────────────────────
+
+class ThreadedCursor:
+    """Async view of a DB-API cursor owned by a :class:`ThreadedConnection`."""
+
+    def __init__(self, conn: "ThreadedConnection", cursor: Any) -> None:
+        self._conn = conn
+        self._cursor = cursor
+
+    @property
+    def lastrowid(self) -> Optional[int]:
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    async def execute(self, sql: str, params: Any = ()) -> None:
+        await self._conn._run(self._cursor.execute, sql, params)
+
+    async def executemany(self, sql: str, seq_of_params: Any) -> None:
+        await self._conn._run(self._cursor.executemany, sql, seq_of_params)
+
+    async def fetchone(self) -> Any:
+        return await self._conn._run(self._cursor.fetchone)
+
+    async def fetchmany(self, size: int = 1) -> List[Any]:
+        return await self._conn._run(self._cursor.fetchmany, size)
+
+    async def fetchall(self) -> List[Any]:
+        return await self._conn._run(self._cursor.fetchall)
+
+    async def close(self) -> None:
+        await self._conn._run(self._cursor.close)
+
+
+class ThreadedConnection:
+    """A synchronous connection driven from asyncio through one worker thread.
+
+    Every call runs on the same thread, in order, so the underlying
+    driver never sees two threads at once.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, conn: Any) -> None:
+        self._executor = executor
+        self._conn = conn
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    @property
+    def in_transaction(self) -> bool:
+        return bool(getattr(self._conn, "in_transaction", True))
+
+    async def cursor(self, dictionary: bool = False) -> ThreadedCursor:
+        return ThreadedCursor(self, await self._run(partial(self._conn.cursor, dictionary=dictionary)))
+
+    async def commit(self) -> None:
+        await self._run(self._conn.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self._conn.rollback)
+
+    async def is_connected(self) -> bool:
+        return bool(await self._run(self._conn.is_connected))
+
+    async def close(self) -> None:
+        try:
+            await self._run(self._conn.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+
+def threaded(connect: Callable[..., Any]) -> AsyncConnect:
+    """Turn a synchronous ``connect(**config)`` into an async driver.
+
+    The fallback when no native async driver is installed: one worker
+    thread per open connection.
+    """
+
+    async def connect_async(**config: Any) -> ThreadedConnection:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="async-db")
+        loop = asyncio.get_running_loop()
+        try:
+            conn = await loop.run_in_executor(executor, partial(connect, **config))
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+        return ThreadedConnection(executor, conn)
+
+    return connect_async
+
+
+# ── aiomysql driver ───────────────────────────────────────────────────
+
+class AioMySQLConnection:
+    """Adapts an aiomysql connection to the driver interface above."""
+
+    def __init__(self, conn: Any) -> None:
+        self._conn = conn
+
+    @property
+    def in_transaction(self) -> bool:
+        return True  # not tracked by aiomysql: always roll back on return
+
+    async def cursor(self, dictionary: bool = False) -> Any:
+        import aiomysql
+
+        return await self._conn.cursor(aiomysql.DictCursor if dictionary else aiomysql.Cursor)
+
+    async def commit(self) -> None:
+        await self._conn.commit()
+
+    async def rollback(self) -> None:
+        await self._conn.rollback()
+
+    async def is_connected(self) -> bool:
+        try:
+            await self._conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    async def close(self) -> None:
+        self._conn.close()
+
+
+async def aiomysql_connect(**config: Any) -> AioMySQLConnection:
+    """Open an aiomysql connection from a *DB_CONFIG*-style mapping."""
+    try:
+        import aiomysql
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError("aiomysql_connect needs aiomysql: pip install aiomysql") from exc
+
+    config = dict(config)
+    if "database" in config:
+        config["db"] = config.pop("database")
+    return AioMySQLConnection(await aiomysql.connect(**config))
+
+
+# ── aiosqlite driver ──────────────────────────────────────────────────
+
+class AioSQLiteCursor:
+    """aiosqlite cursor with the mysql-connector semantics of
+    :class:`database.sqlite_backend.SQLiteCursor`."""
+
+    def __init__(self, cursor: Any, dictionary: bool = False) -> None:
+        self._cursor = cursor
+        self._dictionary = dictionary
+        self.lastrowid: Optional[int] = None
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    async def execute(self, sql: str, params: Any = ()) -> None:
+        await self._cursor.execute(sqlite_backend.translate(sql), tuple(params))
+        self.lastrowid = sqlite_backend.first_rowid(self._cursor.lastrowid, self._cursor.rowcount)
+
+    async def executemany(self, sql: str, seq_of_params: Any) -> None:
+        await self._cursor.executemany(sqlite_backend.translate(sql), seq_of_params)
+
+    def _convert(self, row: Any) -> Any:
+        if not self._dictionary:
+            return row
+        return sqlite_backend.as_dict(self._cursor.description, row)
+
+    async def fetchone(self) -> Any:
+        return self._convert(await self._cursor.fetchone())
+
+    async def fetchmany(self, size: int = 1) -> List[Any]:
+        return [self._convert(row) for row in await self._cursor.fetchmany(size)]
+
+    async def fetchall(self) -> List[Any]:
+        return [self._convert(row) for row in await self._cursor.fetchall()]
+
+    async def close(self) -> None:
+        await self._cursor.close()
+
+
+class AioSQLiteConnection:
+    """Adapts an aiosqlite connection to the driver interface above."""
+
+    def __init__(self, conn: Any) -> None:
+        self._conn = conn
+        self._open = True
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._conn.in_transaction
+
+    async def cursor(self, dictionary: bool = False) -> AioSQLiteCursor:
+        return AioSQLiteCursor(await self._conn.cursor(), dictionary=dictionary)
+
+    async def commit(self) -> None:
+        await self._conn.commit()
+
+    async def rollback(self) -> None:
+        await self._conn.rollback()
+
+    async def is_connected(self) -> bool:
+        return self._open
+
+    async def close(self) -> None:
+        self._open = False
+        await self._conn.close()
+
+
+async def aiosqlite_connect(**config: Any) -> AioSQLiteConnection:
+    """Open a SQLite database with aiosqlite; only *database* is used."""
+    try:
+        import aiosqlite
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError("aiosqlite_connect needs aiosqlite: pip install aiosqlite") from exc
+
+    conn = await aiosqlite.connect(
+        str(config.get("database", ":memory:")), detect_types=sqlite3.PARSE_DECLTYPES,
+    )
+    await conn.execute("PRAGMA foreign_keys = ON")
+    return AioSQLiteConnection(conn)
+
+
+# ── Pool ─────────────────────────────────────────────────────────────
+
+class AsyncConnectionPool:
+    """A bounded pool of async connections for one event loop.
+
+    Unlike :class:`database.connection.ConnectionPool`, nested
+    :meth:`acquire` calls are not folded into one connection: tasks
+    started with ``asyncio.gather`` run side by side and each needs its
+    own connection.
+
+    Attributes:
+        size: Maximum number of connections open at the same time.
+        timeout: Seconds :meth:`acquire` waits before raising ``PoolError``.
+        idle_timeout: Idle connections older than this are closed.
+        health_check: Whether idle connections are pinged on borrow.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        connect: AsyncConnect,
+        size: int = 5,
+        timeout: float = 10.0,
+        idle_timeout: float = 300.0,
+        health_check: bool = True,
+    ) -> None:
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.config: Dict[str, Any] = dict(config)
+        self.size: int = size
+        self.timeout: float = timeout
+        self.idle_timeout: float = idle_timeout
+        self.health_check: bool = health_check
+        self._connect = connect
+        self._cond = asyncio.Condition()
+        self._idle: List[Tuple[Any, float]] = []   # (conn, last_used), oldest first
+        self._open = 0
+        self._stats: Dict[str, int] = dict.fromkeys(
+            ("borrows", "waits", "timeouts", "creations", "evictions", "discards"), 0
+        )
+
+    async def acquire(self, timeout: Optional[float] = None) -> Any:
+        """Borrow a connection, waiting up to *timeout* seconds.
+
+        Raises:
+            PoolError: If no connection became available in time.
+        """
+        self._stats["borrows"] += 1
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        while True:
+            conn = await self._take_slot(deadline)
+            if conn is None:
+                return await self._create()
+            if not self.health_check or await conn.is_connected():
+                return conn
+            await self._discard(conn)
+
+    async def release(self, conn: Any) -> None:
+        """Return a connection obtained from :meth:`acquire`."""
+        try:
+            # Never hand a half-finished transaction to the next borrower.
+            if conn.in_transaction:
+                await conn.rollback()
+        except Exception:
+            await self._discard(conn)
+            return
+        async with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @asynccontextmanager
+    async def connection(self, timeout: Optional[float] = None) -> AsyncIterator[Any]:
+        """Borrow a connection for an ``async with`` block."""
+        conn = await self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            await self.release(conn)
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the pool counters."""
+        snapshot = dict(self._stats)
+        snapshot["open"] = self._open
+        snapshot["idle"] = len(self._idle)
+        snapshot["in_use"] = self._open - len(self._idle)
+        return snapshot
+
+    async def close_all(self) -> None:
+        """Close every idle connection (borrowed ones stay open)."""
+        async with self._cond:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            await self._close_quietly(conn)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _take_slot(self, deadline: float) -> Optional[Any]:
+        """Pop an idle connection, or reserve room for a new one (None)."""
+        waited = False
+        stale: List[Any] = []
+        try:
+            async with self._cond:
+                while True:
+                    stale.extend(self._evict_idle_locked())
+                    if self._idle:
+                        return self._idle.pop()[0]
+                    if self._open < self.size:
+                        self._open += 1
+                        return None
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolError(f"No connection available (pool size {self.size})")
+                    if not waited:
+                        self._stats["waits"] += 1
+                        waited = True
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            for old in stale:
+                await self._close_quietly(old)
+
+    async def _create(self) -> Any:
+        try:
+            conn = await self._connect(**self.config)
+        except BaseException:
+            async with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+        self._stats["creations"] += 1
+        return conn
+
+    async def _discard(self, conn: Any) -> None:
+        await self._close_quietly(conn)
+        async with self._cond:
+            self._open -= 1
+            self._stats["discards"] += 1
+            self._cond.notify()
+
+    def _evict_idle_locked(self) -> List[Any]:
+        """Drop idle connections past *idle_timeout*; caller holds the lock."""
+        cutoff = time.monotonic() - self.idle_timeout
+        stale: List[Any] = []
+        while self._idle and self._idle[0][1] < cutoff:
+            stale.append(self._idle.pop(0)[0])
+        if stale:
+            self._open -= len(stale)
+            self._stats["evictions"] += len(stale)
+        return stale
+
+    @staticmethod
+    async def _close_quietly(conn: Any) -> None:
+        try:
+            await conn.close()
+        except Exception:
+            pass
+
+
+# ── Shared pools ─────────────────────────────────────────────────────
+
+# Keyed by event loop, so a pool is never used from a loop it was not built on.
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Any, AsyncConnectionPool]]" = (
+    weakref.WeakKeyDictionary()
+)
+_driver: Optional[AsyncConnect] = None
+
+
+def set_driver(connect: Optional[AsyncConnect]) -> None:
+    """Use the async driver *connect* for new pools.
+
+    ``None`` (the default) follows the synchronous driver of
+    :mod:`database.connection`: aiomysql for MySQL and aiosqlite for
+    :mod:`database.sqlite_backend` when installed, otherwise that driver
+    wrapped with the :func:`threaded` fallback.  Existing pools are
+    dropped; close them first with :func:`close_pools`.
+    """
+    global _driver
+    _driver = connect
+    _pools.clear()
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def _current_driver() -> AsyncConnect:
+    if _driver is not None:
+        return _driver
+    # Read at call time so database.connection.set_driver() applies here too.
+    sync_connect = connection._driver
+    if sync_connect is None:
+        if _installed("aiomysql"):
+            return aiomysql_connect
+        import mysql.connector
+
+        sync_connect = mysql.connector.connect
+    elif sync_connect is sqlite_backend.connect and _installed("aiosqlite"):
+        return aiosqlite_connect
+    return threaded(sync_connect)
+
+
+def get_pool(**overrides: Any) -> AsyncConnectionPool:
+    """Return this event loop's pool for *DB_CONFIG* merged with *overrides*."""
+    config = {**connection.DB_CONFIG, **overrides}
+    pools = _pools.setdefault(asyncio.get_running_loop(), {})
+    key = tuple(sorted(config.items()))
+    pool = pools.get(key)
+    if pool is None:
+        pool = pools[key] = AsyncConnectionPool(config, _current_driver(), **connection.POOL_CONFIG)
+    return pool
+
+
+@asynccontextmanager
+async def pooled_connection(**overrides: Any) -> AsyncIterator[Any]:
+    """Borrow a pooled async connection for an ``async with`` block."""
+    async with get_pool(**overrides).connection() as conn:
+        yield conn
+
+
+async def close_pools() -> None:
+    """Close and forget the running event loop's pools."""
+    for pool in _pools.pop(asyncio.get_running_loop(), {}).values():
+        await pool.close_all()
+
+
+def pool_stats(**overrides: Any) -> Dict[str, int]:
+    """Return borrow / wait / creation counters for this loop's pool."""
+    return get_pool(**overrides).stats()
@@ -1,14 +1,22 @@
 """Database connection helper using mysql-connector-python.
 
-Centralises connection creation so every DAO can reuse it.
+Centralises connection creation so every DAO can reuse it.  Connections
+are borrowed from a bounded, thread-aware pool instead of being opened
+(and authenticated) from scratch on every DAO call.
 """
 
 from __future__ import annotations
 
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
 import mysql.connector
 from mysql.connector.connection import MySQLConnection
+from mysql.connector.errors import PoolError
 
-# Default connection parameters 
+# Default connection parameters
 DB_CONFIG = {
     "host": "localhost",
     "user": "root",
@@ -18,11 +26,325 @@ DB_CONFIG = {
     "autocommit": False,
 }
 
+# Default pool parameters (applied to every pool created by get_pool)
+POOL_CONFIG = {
+    "size": 5,                # max connections open at once per config
+    "timeout": 10.0,          # seconds to wait for a free connection
+    "idle_timeout": 300.0,    # close connections idle longer than this
+    "health_check": True,     # ping connections before handing them out
+}
+
+
+class ConnectionPool:
+    """A bounded pool of reusable database connections.
+
+    A thread that already holds a connection from the pool gets the
+    same connection back on a nested :meth:`acquire`, so helpers called
+    from inside a DAO method share its connection (and transaction).
+    :meth:`checkout` hands out a connection of its own instead.
+
+    Attributes:
+        size: Maximum number of connections open at the same time.
+        timeout: Seconds :meth:`acquire` waits before raising ``PoolError``.
+        idle_timeout: Idle connections older than this are closed.
+        health_check: Whether idle connections are pinged on borrow.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        size: int = 5,
+        timeout: float = 10.0,
+        idle_timeout: float = 300.0,
+        health_check: bool = True,
+        connect: Optional[Callable[..., Any]] = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.config: Dict[str, Any] = dict(config)
+        self.size: int = size
+        self.timeout: float = timeout
+        self.idle_timeout: float = idle_timeout
+        self.health_check: bool = health_check
+        self._connect = connect or mysql.connector.connect
+        self._cond = threading.Condition()
+        self._idle: List[Tuple[Any, float]] = []   # (conn, last_used), oldest first
+        self._open = 0
+        self._local = threading.local()
+        self._stats: Dict[str, int] = {
+            "borrows": 0,
+            "reuses": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "creations": 0,
+            "evictions": 0,
+            "discards": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Borrow / return
+    # ------------------------------------------------------------------
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """Borrow a connection, waiting up to *timeout* seconds.
+
+        Raises:
+            PoolError: If no connection became available in time.
+        """
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            self._local.depth += 1
+            with self._cond:
+                self._stats["reuses"] += 1
+            return held
+
+        conn = self._checkout(self.timeout if timeout is None else timeout)
+        self._local.conn = conn
+        self._local.depth = 1
+        return conn
+
+    def release(self, conn: Any) -> None:
+        """Return a connection obtained from :meth:`acquire`."""
+        if getattr(self._local, "conn", None) is not conn:
+            raise PoolError("Connection was not borrowed by this thread")
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return
+        self._local.conn = None
+        self._checkin(conn)
+
+    def checkout(self, timeout: Optional[float] = None) -> Any:
+        """Borrow a connection that no nested :meth:`acquire` will share.
+
+        Committing, rolling back or closing it never touches a
+        connection the thread holds through :meth:`acquire`.  Return it
+        with :meth:`checkin`.
+
+        Raises:
+            PoolError: If no connection became available in time.
+        """
+        return self._checkout(self.timeout if timeout is None else timeout)
+
+    def checkin(self, conn: Any) -> None:
+        """Return a connection obtained from :meth:`checkout`."""
+        if conn is getattr(self._local, "conn", None):
+            raise PoolError("Connection is held through acquire(); use release()")
+        self._checkin(conn)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Context manager that borrows a connection and always returns it."""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the pool counters."""
+        with self._cond:
+            snapshot = dict(self._stats)
+            snapshot["open"] = self._open
+            snapshot["idle"] = len(self._idle)
+            snapshot["in_use"] = self._open - len(self._idle)
+        return snapshot
+
+    def close_all(self) -> None:
+        """Close every idle connection (borrowed ones close on return)."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _checkout(self, timeout: float) -> Any:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._stats["borrows"] += 1
+        while True:
+            conn = self._take_slot(deadline)
+            if conn is None:
+                return self._create()
+            if not self.health_check or self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+
+    def _take_slot(self, deadline: float) -> Optional[Any]:
+        """Pop an idle connection, or reserve room for a new one (None)."""
+        waited = timed_out = False
+        conn: Optional[Any] = None
+        stale: List[Any] = []
+        with self._cond:
+            while True:
+                stale.extend(self._evict_idle_locked())
+                if self._idle:
+                    conn, _ = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    self._open += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    timed_out = True
+                    break
+                if not waited:
+                    self._stats["waits"] += 1
+                    waited = True
+                self._cond.wait(remaining)
+        for old in stale:
+            self._close_quietly(old)
+        if timed_out:
+            raise PoolError(f"No connection available (pool size {self.size})")
+        return conn
+
+    def _create(self) -> Any:
+        try:
+            conn = self._connect(**self.config)
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["creations"] += 1
+        return conn
+
+    def _checkin(self, conn: Any) -> None:
+        try:
+            # Never hand a half-finished transaction to the next borrower.
+            if getattr(conn, "in_transaction", False):
+                conn.rollback()
+        except Exception:
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
 
-def get_connection(**overrides) -> MySQLConnection:
-    """Return a new MySQL connection.
+    def _discard(self, conn: Any) -> None:
+        self._close_quietly(conn)
+        with self._cond:
+            self._open -= 1
+            self._stats["discards"] += 1
+            self._cond.notify()
 
-    Any keyword argument overrides the defaults in *DB_CONFIG*.
+    def _evict_idle_locked(self) -> List[Any]:
+        """Drop idle connections past *idle_timeout*; caller holds the lock."""
+        cutoff = time.monotonic() - self.idle_timeout
+        stale: List[Any] = []
+        while self._idle and self._idle[0][1] < cutoff:
+            stale.append(self._idle.pop(0)[0])
+        if stale:
+            self._open -= len(stale)
+            self._stats["evictions"] += len(stale)
+        return stale
+
+    @staticmethod
+    def _is_healthy(conn: Any) -> bool:
+        try:
+            return bool(conn.is_connected())
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+class PooledConnection:
+    """Connection proxy whose :meth:`close` checks it back into its pool."""
+
+    def __init__(self, pool: ConnectionPool, conn: Any) -> None:
+        self._pool = pool
+        self._conn = conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool.checkin(conn)
+
+    def __getattr__(self, name: str) -> Any:
+        if self._conn is None:
+            raise PoolError("Connection has already been returned to the pool")
+        return getattr(self._conn, name)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+_pools: Dict[Tuple[Tuple[str, Any], ...], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+_driver: Optional[Callable[..., Any]] = None
+
+
+def set_driver(connect: Optional[Callable[..., Any]]) -> None:
+    """Use *connect* instead of ``mysql.connector.connect`` for new pools.
+
+    Existing pools are closed and dropped.  Passing ``None`` restores the
+    MySQL driver.  Used to run the DAOs against
+    :mod:`database.sqlite_backend` in tests and benchmarks.
     """
+    global _driver
+    with _pools_lock:
+        _driver = connect
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
+
+
+def get_pool(**overrides) -> ConnectionPool:
+    """Return the shared pool for *DB_CONFIG* merged with *overrides*."""
     config = {**DB_CONFIG, **overrides}
-    return mysql.connector.connect(**config)
+    key = tuple(sorted(config.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(config, connect=_driver, **POOL_CONFIG)
+            _pools[key] = pool
+        return pool
+
+
+@contextmanager
+def pooled_connection(**overrides) -> Iterator[MySQLConnection]:
+    """Borrow a pooled connection for the duration of a ``with`` block.
+
+    Nested blocks on the same thread share the connection (and its
+    transaction); this is how the DAOs and ``UnitOfWork`` borrow.
+    """
+    with get_pool(**overrides).connection() as conn:
+        yield conn
+
+
+def get_connection(**overrides) -> PooledConnection:
+    """Return a pooled MySQL connection of the caller's own.
+
+    Any keyword argument overrides the defaults in *DB_CONFIG*.  The
+    connection is never shared with :func:`pooled_connection` or another
+    ``get_connection()`` call, so its commits, rollbacks and ``close()``
+    affect nobody else; ``close()`` returns it to the pool.  It takes a
+    pool slot apart from the one the thread's DAO calls borrow.
+    """
+    pool = get_pool(**overrides)
+    return PooledConnection(pool, pool.checkout())
+
+
+def pool_stats(**overrides) -> Dict[str, int]:
+    """Return borrow / wait / creation counters for a pool."""
+    return get_pool(**overrides).stats()
@@ -3,5 +3,11 @@
 from .product_dao import ProductDAO
 from .customer_dao import CustomerDAO
 from .order_dao import OrderDAO
+from .async_product_dao import AsyncProductDAO
+from .async_customer_dao import AsyncCustomerDAO
+from .async_order_dao import AsyncOrderDAO
 
-__all__ = ["ProductDAO", "CustomerDAO", "OrderDAO"]
+__all__ = [
+    "ProductDAO", "CustomerDAO", "OrderDAO",
+    "AsyncProductDAO", "AsyncCustomerDAO", "AsyncOrderDAO",
+]
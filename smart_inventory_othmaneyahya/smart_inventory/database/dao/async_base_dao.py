@@ -0,0 +1,167 @@
+"""Abstract base for the asyncio Data Access Objects."""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Sequence, TypeVar
+
+from database.async_connection import pooled_connection
+from database.cache import TTLCache
+
+T = TypeVar("T")
+
+
+class AsyncBaseDAO(ABC):
+    """``async def`` counterpart of :class:`~database.dao.base_dao.BaseDAO`.
+
+    Every call borrows its own connection from
+    :mod:`database.async_connection`, so calls on one DAO can run side
+    by side under ``asyncio.gather``.  Unit-of-work transactions are
+    thread-bound and not available here: each write commits on its own.
+
+    Args:
+        cache: Optional shared :class:`TTLCache` for ``find_by_id`` rows.
+    """
+
+    def __init__(self, cache: Optional[TTLCache] = None) -> None:
+        self.cache: Optional[TTLCache] = cache
+
+    @abstractmethod
+    async def save(self, entity: Any) -> None:
+        """Persist *entity* in the database."""
+
+    @abstractmethod
+    async def update(self, entity: Any) -> None:
+        """Update an existing record."""
+
+    @abstractmethod
+    async def delete(self, entity_id: int) -> None:
+        """Delete a record by primary key."""
+
+    @abstractmethod
+    async def find_by_id(self, entity_id: int) -> Optional[Any]:
+        """Return the entity with the given id, or None."""
+
+    # ------------------------------------------------------------------
+    # Cache helpers
+    # ------------------------------------------------------------------
+
+    async def _find_cached(
+        self,
+        table: str,
+        entity_id: int,
+        load_row: Callable[[int], Awaitable[Optional[Any]]],
+        build: Callable[[Any], Any],
+    ) -> Optional[Any]:
+        """Resolve *entity_id* via the cache, then *load_row*."""
+        key = (table, entity_id)
+        row = self.cache.get(key) if self.cache is not None else None
+        if row is None:
+            row = await load_row(entity_id)
+            if row is None:
+                return None
+            if self.cache is not None:
+                self.cache.set(key, row)
+        return build(row)
+
+    def _evict(self, table: str, entity_id: int) -> None:
+        """Forget a written row."""
+        if self.cache is not None:
+            self.cache.invalidate((table, entity_id))
+
+    # ------------------------------------------------------------------
+    # Cursor helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    @asynccontextmanager
+    async def _write_cursor() -> AsyncIterator[Any]:
+        """Yield a cursor for a write and commit it afterwards."""
+        async with pooled_connection() as conn:
+            cursor = await conn.cursor()
+            try:
+                yield cursor
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+            finally:
+                await cursor.close()
+
+    @staticmethod
+    @asynccontextmanager
+    async def _read_cursor(dictionary: bool = False) -> AsyncIterator[Any]:
+        """Yield a cursor for a read; rows are tuples unless *dictionary*."""
+        async with pooled_connection() as conn:
+            cursor = await conn.cursor(dictionary=dictionary)
+            try:
+                yield cursor
+            finally:
+                await cursor.close()
+
+    @staticmethod
+    async def _insert_rows(
+        cursor: Any,
+        table: str,
+        columns: Sequence[str],
+        rows: Sequence[Sequence[Any]],
+        batch_size: int,
+    ) -> List[int]:
+        """INSERT *rows* using multi-row VALUES, *batch_size* rows per statement.
+
+        Returns:
+            The auto-generated id of the first row of every statement.
+        """
+        placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+        prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        first_ids: List[int] = []
+        for start in range(0, len(rows), batch_size):
+            chunk = rows[start:start + batch_size]
+            await cursor.execute(
+                prefix + ", ".join([placeholders] * len(chunk)),
+                [value for row in chunk for value in row],
+            )
+            first_ids.append(cursor.lastrowid)
+        return first_ids
+
+    @staticmethod
+    async def _iter_pages(
+        find_page: Callable[..., Awaitable[List[Any]]],
+        page_key: Callable[[Any], Any],
+        batch_size: int,
+    ) -> AsyncIterator[Any]:
+        """Yield every row of a keyset-paginated query, page by page.
+
+        Same contract as :meth:`BaseDAO._iter_pages`, for ``async for``.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        after = None
+        while True:
+            page = await find_page(after=after, limit=batch_size)
+            for row in page:
+                yield row
+            if len(page) < batch_size:
+                return
+            after = page_key(page[-1])
+
+    @staticmethod
+    async def _gather_chunks(
+        ids: Sequence[int],
+        fetch_chunk: Callable[[List[int]], Awaitable[List[T]]],
+        chunk_size: int,
+    ) -> List[T]:
+        """Run *fetch_chunk* over *chunk_size* slices of *ids* concurrently.
+
+        Each chunk is one ``IN`` query on its own pooled connection, so at
+        most ``POOL_CONFIG["size"]`` of them are in flight at once.
+        Results are concatenated in chunk order.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        ids = list(dict.fromkeys(ids))
+        chunks = [ids[pos:pos + chunk_size] for pos in range(0, len(ids), chunk_size)]
+        pages = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+        return [entity for page in pages for entity in page]
@@ -0,0 +1,82 @@
+"""Async Data Access Object for the Customer entity."""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+
+from database.dao.async_base_dao import AsyncBaseDAO
+from database.dao.customer_dao import CustomerDAO
+from core.models import Customer
+
+
+class AsyncCustomerDAO(AsyncBaseDAO):
+    """``async def`` CRUD operations for the *customers* table."""
+
+    _SELECT = CustomerDAO._SELECT
+
+    async def save(self, customer: Customer) -> None:
+        async with self._write_cursor() as cursor:
+            await cursor.execute(
+                "INSERT INTO customers (name, email) VALUES (%s, %s)",
+                (customer.name, customer.email),
+            )
+            customer.id = cursor.lastrowid
+        self._evict("customers", customer.id)
+
+    async def find_by_id(self, customer_id: int) -> Optional[Customer]:
+        return await self._find_cached("customers", customer_id, self._load_row, Customer.from_row)
+
+    async def _load_row(self, customer_id: int) -> Optional[tuple]:
+        async with self._read_cursor() as cursor:
+            await cursor.execute(self._SELECT + " WHERE id = %s", (customer_id,))
+            return await cursor.fetchone()
+
+    async def find_all(self) -> List[Customer]:
+        async with self._read_cursor() as cursor:
+            await cursor.execute(self._SELECT + " ORDER BY name, id")
+            return Customer.from_rows(await cursor.fetchall())
+
+    async def find_many(self, customer_ids: Sequence[int], chunk_size: int = 500) -> List[Customer]:
+        """Return the customers with the given ids, ordered by id.
+
+        Chunks of *chunk_size* ids are fetched concurrently; unknown ids
+        are skipped.
+        """
+        customers = await self._gather_chunks(customer_ids, self._find_chunk, chunk_size)
+        return sorted(customers, key=lambda c: c.id)
+
+    async def _find_chunk(self, ids: List[int]) -> List[Customer]:
+        async with self._read_cursor() as cursor:
+            await cursor.execute(
+                self._SELECT + f" WHERE id IN ({', '.join(['%s'] * len(ids))})", ids
+            )
+            return Customer.from_rows(await cursor.fetchall())
+
+    async def find_page(
+        self, after: Optional[Tuple[str, int]] = None, limit: int = 50
+    ) -> List[Customer]:
+        """Return up to *limit* customers ordered by ``(name, id)``."""
+        sql, params = self._SELECT, []
+        if after is not None:
+            sql += " WHERE name > %s OR (name = %s AND id > %s)"
+            params = [after[0], after[0], after[1]]
+        async with self._read_cursor() as cursor:
+            await cursor.execute(sql + " ORDER BY name, id LIMIT %s", params + [limit])
+            return Customer.from_rows(await cursor.fetchall())
+
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Customer]:
+        """Stream every customer with ``async for``, *batch_size* rows per query."""
+        return self._iter_pages(self.find_page, lambda c: (c.name, c.id), batch_size)
+
+    async def update(self, customer: Customer) -> None:
+        async with self._write_cursor() as cursor:
+            await cursor.execute(
+                "UPDATE customers SET name = %s, email = %s WHERE id = %s",
+                (customer.name, customer.email, customer.id),
+            )
+        self._evict("customers", customer.id)
+
+    async def delete(self, customer_id: int) -> None:
+        async with self._write_cursor() as cursor:
+            await cursor.execute("DELETE FROM customers WHERE id = %s", (customer_id,))
+        self._evict("customers", customer_id)
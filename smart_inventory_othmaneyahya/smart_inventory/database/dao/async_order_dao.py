@@ -0,0 +1,162 @@
+"""Async Data Access Object for Order (with OrderItems)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from database.cache import TTLCache
+from database.dao.async_base_dao import AsyncBaseDAO
+from database.dao.order_dao import OrderDAO
+from core.models import Order, Product
+
+
+class AsyncOrderDAO(AsyncBaseDAO):
+    """``async def`` CRUD operations for the *orders* and *order_items* tables.
+
+    Mirrors :class:`OrderDAO`: an order's header and items are written in
+    one transaction, and reads share one Customer / Product per id.
+    Item lookups for many orders run as concurrent ``IN`` queries.
+    """
+
+    HEADER_COLUMNS = OrderDAO.HEADER_COLUMNS
+    ITEM_COLUMNS = OrderDAO.ITEM_COLUMNS
+    _HEADER_SELECT = OrderDAO._HEADER_SELECT
+    _NEWEST_FIRST = OrderDAO._NEWEST_FIRST
+
+    def __init__(self, batch_size: int = 500, cache: Optional[TTLCache] = None) -> None:
+        """Create the DAO.
+
+        Args:
+            batch_size: Max rows per multi-row INSERT and max ids per
+                item query.
+            cache: Passed to :class:`AsyncBaseDAO` (orders are not cached).
+        """
+        super().__init__(cache)
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size: int = batch_size
+
+    # ── CREATE ────────────────────────────────────────────────
+
+    async def save(self, order: Order) -> None:
+        """Persist an order **and** all its items in one transaction."""
+        async with self._write_cursor() as cursor:
+            await cursor.execute(
+                "INSERT INTO orders (customer_id, order_date) VALUES (%s, %s)",
+                (order.customer.id, order.order_date),
+            )
+            order.id = cursor.lastrowid
+            await self._insert_items(cursor, [order])
+
+    async def save_many(self, orders: List[Order]) -> None:
+        """Persist many orders and their items in one transaction.
+
+        Same batching and id assignment (stepped by
+        ``@@auto_increment_increment``) as :meth:`OrderDAO.save_many`.
+        """
+        if not orders:
+            return
+        async with self._write_cursor() as cursor:
+            await cursor.execute(OrderDAO._AUTO_INCREMENT_STEP_SQL)
+            step = int((await cursor.fetchone())[0])
+            first_ids = await self._insert_rows(
+                cursor, "orders", self.HEADER_COLUMNS, OrderDAO._header_rows(orders), self.batch_size,
+            )
+            OrderDAO._assign_ids(orders, first_ids, self.batch_size, step)
+            await self._insert_items(cursor, orders)
+
+    async def _insert_items(self, cursor: Any, orders: List[Order]) -> None:
+        await self._insert_rows(
+            cursor, "order_items", self.ITEM_COLUMNS, OrderDAO._item_rows(orders), self.batch_size
+        )
+
+    # ── READ ──────────────────────────────────────────────────
+
+    async def find_by_id(self, order_id: int) -> Optional[Order]:
+        orders = await self.find_many(order_ids=[order_id])
+        return orders[0] if orders else None
+
+    async def find_all(self, with_items: bool = False) -> List[Order]:
+        """Return all orders, newest first, optionally with their items."""
+        return await self._find(
+            self._HEADER_SELECT + self._NEWEST_FIRST, [], with_items
+        )
+
+    async def find_page(
+        self,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 50,
+        with_items: bool = False,
+    ) -> List[Order]:
+        """Return up to *limit* orders, newest first (``order_date, id`` DESC).
+
+        *after* is the ``(order_date, id)`` of the last order of the
+        previous page, or *None* for the first page.
+        """
+        sql, params = OrderDAO._page_query(after, limit)
+        return await self._find(sql, params, with_items)
+
+    def iter_all(self, batch_size: int = 500, with_items: bool = False) -> AsyncIterator[Order]:
+        """Stream every order with ``async for``, newest first."""
+        return self._iter_pages(
+            lambda after, limit: self.find_page(after, limit, with_items),
+            lambda o: (o.order_date, o.id),
+            batch_size,
+        )
+
+    async def find_many(
+        self,
+        order_ids: Optional[List[int]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[Order]:
+        """Return fully loaded orders by id and/or ``start <= order_date < end``.
+
+        One header query, then one item query per *batch_size* orders,
+        the item queries running concurrently.
+        """
+        if order_ids is not None and not order_ids:
+            return []
+        sql, params = OrderDAO._many_query(order_ids, start, end)
+        return await self._find(sql, params, with_items=True)
+
+    async def _find(self, sql: str, params: List[Any], with_items: bool) -> List[Order]:
+        async with self._read_cursor() as cursor:
+            await cursor.execute(sql, params)
+            orders = OrderDAO._build_orders(await cursor.fetchall())
+        # The header connection is back in the pool before items are read.
+        if with_items and orders:
+            await self._load_items(orders)
+        return orders
+
+    async def _load_items(self, orders: List[Order]) -> None:
+        """Attach items to *orders*, sharing one Product per id."""
+        by_id = {order.id: order for order in orders}
+        products: Dict[int, Product] = {}
+
+        async def fetch_chunk(chunk: List[int]) -> List[tuple]:
+            async with self._read_cursor() as cursor:
+                await cursor.execute(OrderDAO._items_sql(len(chunk)), chunk)
+                return await cursor.fetchall()
+
+        rows = await self._gather_chunks(list(by_id), fetch_chunk, self.batch_size)
+        OrderDAO._attach_items(by_id, rows, products)
+
+    # ── UPDATE ────────────────────────────────────────────────
+
+    async def update(self, order: Order) -> None:
+        """Update order date and re-write all items."""
+        async with self._write_cursor() as cursor:
+            await cursor.execute(
+                "UPDATE orders SET order_date = %s WHERE id = %s",
+                (order.order_date, order.id),
+            )
+            await cursor.execute("DELETE FROM order_items WHERE order_id = %s", (order.id,))
+            await self._insert_items(cursor, [order])
+
+    # ── DELETE ────────────────────────────────────────────────
+
+    async def delete(self, order_id: int) -> None:
+        async with self._write_cursor() as cursor:
+            await cursor.execute("DELETE FROM orders WHERE id = %s", (order_id,))
@@ -0,0 +1,110 @@
+"""Async Data Access Object for the Product entity."""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+
+from database.dao.async_base_dao import AsyncBaseDAO
+from database.dao.product_dao import ProductDAO
+from core.models import Product
+
+
+class AsyncProductDAO(AsyncBaseDAO):
+    """``async def`` CRUD operations for the *products* table.
+
+    Mirrors :class:`ProductDAO` and runs the same SQL.
+    """
+
+    _SELECT = ProductDAO._SELECT
+
+    # ── CREATE ────────────────────────────────────────────────
+
+    async def save(self, product: Product) -> None:
+        """Insert a new product row and set its *id*."""
+        async with self._write_cursor() as cursor:
+            await cursor.execute(
+                """
+                INSERT INTO products (name, category, price, quantity_in_stock)
+                VALUES (%s, %s, %s, %s)
+                """,
+                (product.name, product.category, product.price, product.quantity_in_stock),
+            )
+            product.id = cursor.lastrowid
+        self._evict("products", product.id)
+
+    # ── READ ──────────────────────────────────────────────────
+
+    async def find_by_id(self, product_id: int) -> Optional[Product]:
+        """Return a :class:`Product` or *None*."""
+        return await self._find_cached("products", product_id, self._load_row, Product.from_row)
+
+    async def _load_row(self, product_id: int) -> Optional[tuple]:
+        async with self._read_cursor() as cursor:
+            await cursor.execute(self._SELECT + " WHERE id = %s", (product_id,))
+            return await cursor.fetchone()
+
+    async def find_all(self) -> List[Product]:
+        """Return every product."""
+        async with self._read_cursor() as cursor:
+            await cursor.execute(self._SELECT + " ORDER BY name, id")
+            return Product.from_rows(await cursor.fetchall())
+
+    async def find_many(self, product_ids: Sequence[int], chunk_size: int = 500) -> List[Product]:
+        """Return the products with the given ids, ordered by id.
+
+        Ids are looked up *chunk_size* at a time, the chunks concurrently.
+        Unknown ids are skipped.
+        """
+        products = await self._gather_chunks(product_ids, self._find_chunk, chunk_size)
+        return sorted(products, key=lambda p: p.id)
+
+    async def _find_chunk(self, ids: List[int]) -> List[Product]:
+        async with self._read_cursor() as cursor:
+            await cursor.execute(
+                self._SELECT + f" WHERE id IN ({', '.join(['%s'] * len(ids))})", ids
+            )
+            return Product.from_rows(await cursor.fetchall())
+
+    async def find_page(
+        self, after: Optional[Tuple[str, int]] = None, limit: int = 50
+    ) -> List[Product]:
+        """Return up to *limit* products ordered by ``(name, id)``.
+
+        *after* is the ``(name, id)`` of the last product of the previous
+        page, or *None* for the first page.
+        """
+        sql, params = self._SELECT, []
+        if after is not None:
+            sql += " WHERE name > %s OR (name = %s AND id > %s)"
+            params = [after[0], after[0], after[1]]
+        async with self._read_cursor() as cursor:
+            await cursor.execute(sql + " ORDER BY name, id LIMIT %s", params + [limit])
+            return Product.from_rows(await cursor.fetchall())
+
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Product]:
+        """Stream every product with ``async for``, *batch_size* rows per query."""
+        return self._iter_pages(self.find_page, lambda p: (p.name, p.id), batch_size)
+
+    # ── UPDATE ────────────────────────────────────────────────
+
+    async def update(self, product: Product) -> None:
+        """Update an existing product row."""
+        async with self._write_cursor() as cursor:
+            await cursor.execute(
+                """
+                UPDATE products
+                   SET name = %s, category = %s, price = %s, quantity_in_stock = %s
+                 WHERE id = %s
+                """,
+                (product.name, product.category, product.price,
+                 product.quantity_in_stock, product.id),
+            )
+        self._evict("products", product.id)
+
+    # ── DELETE ────────────────────────────────────────────────
+
+    async def delete(self, product_id: int) -> None:
+        """Delete a product by id."""
+        async with self._write_cursor() as cursor:
+            await cursor.execute("DELETE FROM products WHERE id = %s", (product_id,))
+        self._evict("products", product_id)
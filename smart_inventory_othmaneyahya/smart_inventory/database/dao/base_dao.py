@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+from database.cache import TTLCache
+from database.connection import pooled_connection
+from database.unit_of_work import UnitOfWork
 
 
 class BaseDAO(ABC):
-    """Interface every DAO must implement."""
+    """Interface every DAO must implement.
+
+    Args:
+        cache: Optional shared :class:`TTLCache` for ``find_by_id`` rows.
+    """
+
+    def __init__(self, cache: Optional[TTLCache] = None) -> None:
+        self.cache: Optional[TTLCache] = cache
 
     @abstractmethod
     def save(self, entity: Any) -> None:
@@ -24,3 +36,163 @@ class BaseDAO(ABC):
     @abstractmethod
     def find_by_id(self, entity_id: int) -> Optional[Any]:
         """Return the entity with the given id, or None."""
+
+    # ------------------------------------------------------------------
+    # Identity map / cache helpers
+    # ------------------------------------------------------------------
+
+    def _find_cached(
+        self,
+        table: str,
+        entity_id: int,
+        load_row: Callable[[int], Optional[Any]],
+        build: Callable[[Any], Any],
+    ) -> Optional[Any]:
+        """Resolve *entity_id* via identity map, then cache, then *load_row*.
+
+        Inside a :class:`UnitOfWork` the shared cache is bypassed (its rows
+        may predate this transaction's own writes) and the built entity is
+        recorded in the identity map instead.
+        """
+        key = (table, entity_id)
+        uow = UnitOfWork.current()
+        if uow is not None:
+            entity = uow.identity_map.get(key)
+            if entity is None:
+                row = load_row(entity_id)
+                if row is None:
+                    return None
+                entity = uow.identity_map[key] = build(row)
+            return entity
+
+        row = self.cache.get(key) if self.cache is not None else None
+        if row is None:
+            row = load_row(entity_id)
+            if row is None:
+                return None
+            if self.cache is not None:
+                self.cache.set(key, row)
+        return build(row)
+
+    def _evict(self, table: str, entity_id: int, entity: Any = None) -> None:
+        """Forget a written row; *entity* becomes its identity-map entry."""
+        key = (table, entity_id)
+        uow = UnitOfWork.current()
+        if uow is not None:
+            if entity is None:
+                uow.identity_map.pop(key, None)
+            else:
+                uow.identity_map[key] = entity
+        if self.cache is not None:
+            cache = self.cache
+            cache.invalidate(key)
+            if uow is not None:
+                # Readers on other threads may re-cache the old row before
+                # we commit, so drop it again once the transaction ends.
+                uow.on_finish(lambda: cache.invalidate(key))
+
+    @staticmethod
+    def unit_of_work(**overrides: Any) -> UnitOfWork:
+        """Return a :class:`UnitOfWork` for DAO calls that must commit together.
+
+        Lets callers outside the database package (the services) open
+        one without importing it.
+        """
+        return UnitOfWork(**overrides)
+
+    # ------------------------------------------------------------------
+    # Cursor helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    @contextmanager
+    def _write_cursor() -> Iterator[Any]:
+        """Yield a cursor for a write and commit it afterwards.
+
+        Inside an active :class:`UnitOfWork` the shared cursor is used
+        and committing (or rolling back) is left to the unit of work.
+        """
+        uow = UnitOfWork.current()
+        if uow is not None:
+            yield uow.cursor()
+            return
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    @staticmethod
+    @contextmanager
+    def _read_cursor(dictionary: bool = False) -> Iterator[Any]:
+        """Yield a cursor for a read, shared with the active unit of work.
+
+        DAOs read plain tuples (cheaper than ``dictionary=True`` rows) and
+        build entities with the models' ``from_row`` factories.
+        """
+        uow = UnitOfWork.current()
+        if uow is not None:
+            yield uow.cursor(dictionary=dictionary)
+            return
+        with pooled_connection() as conn:
+            cursor = conn.cursor(dictionary=dictionary)
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _insert_rows(
+        cursor: Any,
+        table: str,
+        columns: Sequence[str],
+        rows: Sequence[Sequence[Any]],
+        batch_size: int,
+    ) -> List[int]:
+        """INSERT *rows* using multi-row VALUES, *batch_size* rows per statement.
+
+        Keeping each statement bounded keeps it under MySQL's
+        ``max_allowed_packet``.
+
+        Returns:
+            The auto-generated id of the first row of every statement.
+        """
+        placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+        prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        first_ids: List[int] = []
+        for start in range(0, len(rows), batch_size):
+            chunk = rows[start:start + batch_size]
+            cursor.execute(
+                prefix + ", ".join([placeholders] * len(chunk)),
+                [value for row in chunk for value in row],
+            )
+            first_ids.append(cursor.lastrowid)
+        return first_ids
+
+    @staticmethod
+    def _iter_pages(
+        find_page: Callable[..., List[Any]],
+        page_key: Callable[[Any], Any],
+        batch_size: int,
+    ) -> Iterator[Any]:
+        """Yield every row of a keyset-paginated query, page by page.
+
+        *find_page(after=..., limit=...)* fetches one page; *page_key*
+        turns the last entity of a page into the next ``after`` key.
+        Only one page is held in memory, and no connection is held
+        between pages.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        after = None
+        while True:
+            page = find_page(after=after, limit=batch_size)
+            yield from page
+            if len(page) < batch_size:
+                return
+            after = page_key(page[-1])
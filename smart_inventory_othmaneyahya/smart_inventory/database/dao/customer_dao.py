@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
-from database.connection import get_connection
 from database.dao.base_dao import BaseDAO
 from core.models import Customer
 
@@ -12,74 +11,62 @@ from core.models import Customer
 class CustomerDAO(BaseDAO):
     """CRUD operations for the *customers* table."""
 
+    # Column order matches Customer.from_row.
+    _SELECT = "SELECT id, name, email FROM customers"
+
     def save(self, customer: Customer) -> None:
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with self._write_cursor() as cursor:
             cursor.execute(
                 "INSERT INTO customers (name, email) VALUES (%s, %s)",
                 (customer.name, customer.email),
             )
             customer.id = cursor.lastrowid
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            cursor.close()
-            conn.close()
+        self._evict("customers", customer.id, customer)
 
     def find_by_id(self, customer_id: int) -> Optional[Customer]:
-        conn = get_connection()
-        try:
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT * FROM customers WHERE id = %s", (customer_id,))
-            row = cursor.fetchone()
-            if row is None:
-                return None
-            return Customer(id=row["id"], name=row["name"], email=row["email"])
-        finally:
-            cursor.close()
-            conn.close()
+        return self._find_cached("customers", customer_id, self._load_row, Customer.from_row)
+
+    def _load_row(self, customer_id: int) -> Optional[tuple]:
+        with self._read_cursor() as cursor:
+            cursor.execute(self._SELECT + " WHERE id = %s", (customer_id,))
+            return cursor.fetchone()
 
     def find_all(self) -> List[Customer]:
-        conn = get_connection()
-        try:
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT * FROM customers ORDER BY name")
-            return [
-                Customer(id=r["id"], name=r["name"], email=r["email"])
-                for r in cursor.fetchall()
-            ]
-        finally:
-            cursor.close()
-            conn.close()
+        with self._read_cursor() as cursor:
+            cursor.execute(self._SELECT + " ORDER BY name, id")
+            return Customer.from_rows(cursor.fetchall())
+
+    def find_page(
+        self, after: Optional[Tuple[str, int]] = None, limit: int = 50
+    ) -> List[Customer]:
+        """Return up to *limit* customers ordered by ``(name, id)``.
+
+        *after* is the ``(name, id)`` of the last customer of the
+        previous page, or *None* for the first page.
+        """
+        sql, params = self._SELECT, []
+        if after is not None:
+            sql += " WHERE name > %s OR (name = %s AND id > %s)"
+            params = [after[0], after[0], after[1]]
+        with self._read_cursor() as cursor:
+            cursor.execute(sql + " ORDER BY name, id LIMIT %s", params + [limit])
+            return Customer.from_rows(cursor.fetchall())
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Customer]:
+        """Stream every customer, fetching *batch_size* rows per query."""
+        return self._iter_pages(
+            self.find_page, lambda c: (c.name, c.id), batch_size
+        )
 
     def update(self, customer: Customer) -> None:
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with self._write_cursor() as cursor:
             cursor.execute(
                 "UPDATE customers SET name = %s, email = %s WHERE id = %s",
                 (customer.name, customer.email, customer.id),
             )
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            cursor.close()
-            conn.close()
+        self._evict("customers", customer.id, customer)
 
     def delete(self, customer_id: int) -> None:
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with self._write_cursor() as cursor:
             cursor.execute("DELETE FROM customers WHERE id = %s", (customer_id,))
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            cursor.close()
-            conn.close()
+        self._evict("customers", customer_id)
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from database.connection import get_connection
+from database.cache import TTLCache
 from database.dao.base_dao import BaseDAO
 from core.models import Product, Customer, Order, OrderItem
 
@@ -14,165 +14,264 @@ class OrderDAO(BaseDAO):
     """CRUD operations for the *orders* and *order_items* tables.
 
     All writes use a single transaction so that either the entire
-    order (header + items) is committed, or nothing is.
+    order (header + items) is committed, or nothing is.  Inside a
+    :class:`~database.unit_of_work.UnitOfWork` that transaction is the
+    unit of work's.
     """
 
+    HEADER_COLUMNS = ("customer_id", "order_date")
+    ITEM_COLUMNS = ("order_id", "product_id", "quantity", "unit_price")
+    _AUTO_INCREMENT_STEP_SQL = "SELECT @@auto_increment_increment"
+
+    def __init__(self, batch_size: int = 500, cache: Optional[TTLCache] = None) -> None:
+        """Create the DAO.
+
+        Args:
+            batch_size: Max rows per multi-row INSERT; lower it if
+                statements hit the server's ``max_allowed_packet``.
+            cache: Passed to :class:`BaseDAO` (orders are not cached).
+        """
+        super().__init__(cache)
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size: int = batch_size
+
     # ── CREATE ────────────────────────────────────────────────
 
     def save(self, order: Order) -> None:
         """Persist an order **and** all its items in one transaction."""
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with self._write_cursor() as cursor:
             cursor.execute(
                 "INSERT INTO orders (customer_id, order_date) VALUES (%s, %s)",
                 (order.customer.id, order.order_date),
             )
             order.id = cursor.lastrowid
+            self._insert_items(cursor, [order])
+
+    def save_many(self, orders: List[Order]) -> None:
+        """Persist many orders and their items in one transaction.
+
+        Headers and items are each written with chunked multi-row
+        INSERTs, so the statement count grows with
+        ``len(orders) / batch_size`` instead of with the line count.
+
+        Order ids are derived from the first id of each header chunk.
+        This assumes the server gives the rows of one multi-row INSERT
+        consecutive auto-increment values, ``@@auto_increment_increment``
+        apart (read before writing and used as the step).  A single
+        InnoDB server does this for simple INSERTs; multi-writer
+        clusters that interleave allocation between nodes are not
+        supported.
+        """
+        if not orders:
+            return
+        with self._write_cursor() as cursor:
+            cursor.execute(self._AUTO_INCREMENT_STEP_SQL)
+            step = int(cursor.fetchone()[0])
+            first_ids = self._insert_rows(
+                cursor, "orders", self.HEADER_COLUMNS, self._header_rows(orders), self.batch_size,
+            )
+            self._assign_ids(orders, first_ids, self.batch_size, step)
+            self._insert_items(cursor, orders)
+
+    @staticmethod
+    def _header_rows(orders: List[Order]) -> List[tuple]:
+        return [(o.customer.id, o.order_date) for o in orders]
+
+    @staticmethod
+    def _item_rows(orders: List[Order]) -> List[tuple]:
+        return [
+            (order.id, item.product.id, item.quantity, item.product.price)
+            for order in orders
+            for item in order.items
+        ]
 
-            for item in order.items:
-                cursor.execute(
-                    """
-                    INSERT INTO order_items (order_id, product_id, quantity, unit_price)
-                    VALUES (%s, %s, %s, %s)
-                    """,
-                    (order.id, item.product.id, item.quantity, item.product.price),
-                )
-
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            cursor.close()
-            conn.close()
+    @staticmethod
+    def _assign_ids(orders: List[Order], first_ids: List[int], batch_size: int, step: int) -> None:
+        """Give *orders* their ids from the first id of each INSERT chunk."""
+        if step < 1:
+            raise ValueError(f"Unexpected auto_increment_increment: {step}")
+        for chunk_no, first_id in enumerate(first_ids):
+            start = chunk_no * batch_size
+            for offset, order in enumerate(orders[start:start + batch_size]):
+                order.id = first_id + offset * step
+
+    def _insert_items(self, cursor, orders: List[Order]) -> None:
+        """Write the items of *orders* with batched multi-row INSERTs."""
+        self._insert_rows(
+            cursor, "order_items", self.ITEM_COLUMNS, self._item_rows(orders), self.batch_size
+        )
 
     # ── READ ──────────────────────────────────────────────────
 
+    # Tuple rows: (order id, order_date, *Customer.from_row columns).
+    _HEADER_SELECT = """
+        SELECT o.id, o.order_date, c.id, c.name, c.email
+          FROM orders o
+          JOIN customers c ON o.customer_id = c.id
+    """
+    _NEWEST_FIRST = " ORDER BY o.order_date DESC, o.id DESC"
+
     def find_by_id(self, order_id: int) -> Optional[Order]:
-        conn = get_connection()
-        try:
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(
-                """
-                SELECT o.*, c.name AS customer_name, c.email AS customer_email
-                  FROM orders o
-                  JOIN customers c ON o.customer_id = c.id
-                 WHERE o.id = %s
-                """,
-                (order_id,),
-            )
-            row = cursor.fetchone()
-            if row is None:
-                return None
-
-            customer = Customer(
-                id=row["customer_id"],
-                name=row["customer_name"],
-                email=row["customer_email"],
-            )
-            order = Order(
-                id=row["id"],
-                customer=customer,
-                order_date=row["order_date"],
-            )
+        orders = self.find_many(order_ids=[order_id])
+        return orders[0] if orders else None
 
-            cursor.execute(
-                """
-                SELECT oi.*, p.name AS product_name, p.category, p.price AS product_price,
-                       p.quantity_in_stock
-                  FROM order_items oi
-                  JOIN products p ON oi.product_id = p.id
-                 WHERE oi.order_id = %s
-                """,
-                (order_id,),
-            )
-            for ir in cursor.fetchall():
-                product = Product(
-                    id=ir["product_id"],
-                    name=ir["product_name"],
-                    category=ir["category"],
-                    price=float(ir["product_price"]),
-                    quantity_in_stock=ir["quantity_in_stock"],
-                )
-                order.items.append(OrderItem(product, ir["quantity"]))
-
-            return order
-        finally:
-            cursor.close()
-            conn.close()
-
-    def find_all(self) -> List[Order]:
-        """Return all orders (header only, no items loaded for speed)."""
-        conn = get_connection()
-        try:
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(
-                """
-                SELECT o.*, c.name AS customer_name, c.email AS customer_email
-                  FROM orders o
-                  JOIN customers c ON o.customer_id = c.id
-                 ORDER BY o.order_date DESC
-                """
-            )
-            orders: List[Order] = []
-            for row in cursor.fetchall():
-                customer = Customer(
-                    id=row["customer_id"],
-                    name=row["customer_name"],
-                    email=row["customer_email"],
-                )
-                orders.append(
-                    Order(
-                        id=row["id"],
-                        customer=customer,
-                        order_date=row["order_date"],
-                    )
-                )
+    def find_all(self, with_items: bool = False) -> List[Order]:
+        """Return all orders, newest first.
+
+        Only headers are loaded unless *with_items* is true, in which
+        case every order's items are fetched in batched ``IN`` queries.
+        """
+        with self._read_cursor() as cursor:
+            cursor.execute(self._HEADER_SELECT + self._NEWEST_FIRST)
+            orders = self._build_orders(cursor.fetchall())
+            if with_items:
+                self._load_items(cursor, orders)
+            return orders
+
+    def find_page(
+        self,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 50,
+        with_items: bool = False,
+    ) -> List[Order]:
+        """Return up to *limit* orders, newest first (``order_date, id`` DESC).
+
+        Args:
+            after: ``(order_date, id)`` of the last order of the previous
+                page, or *None* for the first page.
+            limit: Page size.
+            with_items: Also load the items of the orders on this page.
+        """
+        with self._read_cursor() as cursor:
+            cursor.execute(*self._page_query(after, limit))
+            orders = self._build_orders(cursor.fetchall())
+            if with_items:
+                self._load_items(cursor, orders)
+            return orders
+
+    @classmethod
+    def _page_query(cls, after: Optional[Tuple[datetime, int]], limit: int) -> Tuple[str, List[Any]]:
+        """SQL and parameters of :meth:`find_page`."""
+        sql, params = cls._HEADER_SELECT, []
+        if after is not None:
+            sql += " WHERE o.order_date < %s OR (o.order_date = %s AND o.id < %s)"
+            params = [after[0], after[0], after[1]]
+        return sql + cls._NEWEST_FIRST + " LIMIT %s", params + [limit]
+
+    def iter_all(self, batch_size: int = 500, with_items: bool = False) -> Iterator[Order]:
+        """Stream every order, newest first, *batch_size* orders per query."""
+        return self._iter_pages(
+            lambda after, limit: self.find_page(after, limit, with_items),
+            lambda o: (o.order_date, o.id),
+            batch_size,
+        )
+
+    def find_many(
+        self,
+        order_ids: Optional[List[int]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[Order]:
+        """Return fully loaded orders by id and/or ``start <= order_date < end``.
+
+        Costs one header query plus one item query per *batch_size*
+        orders, however many orders match.  Each customer and product is
+        built once and shared by every order / item that references it.
+        """
+        if order_ids is not None and not order_ids:
+            return []
+        with self._read_cursor() as cursor:
+            cursor.execute(*self._many_query(order_ids, start, end))
+            orders = self._build_orders(cursor.fetchall())
+            self._load_items(cursor, orders)
             return orders
-        finally:
-            cursor.close()
-            conn.close()
+
+    @classmethod
+    def _many_query(
+        cls,
+        order_ids: Optional[List[int]],
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> Tuple[str, List[Any]]:
+        """SQL and parameters of :meth:`find_many` (*order_ids* not empty)."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if order_ids is not None:
+            clauses.append(f"o.id IN ({', '.join(['%s'] * len(order_ids))})")
+            params.extend(order_ids)
+        if start is not None:
+            clauses.append("o.order_date >= %s")
+            params.append(start)
+        if end is not None:
+            clauses.append("o.order_date < %s")
+            params.append(end)
+        sql = cls._HEADER_SELECT
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        return sql + cls._NEWEST_FIRST, params
+
+    @staticmethod
+    def _build_orders(rows: List[tuple]) -> List[Order]:
+        """Turn header rows into orders, sharing one Customer per id."""
+        customers: Dict[int, Customer] = {}
+        orders: List[Order] = []
+        for row in rows:
+            customer = customers.get(row[2])
+            if customer is None:
+                customer = customers[row[2]] = Customer.from_row(row[2:])
+            orders.append(Order(id=row[0], customer=customer, order_date=row[1]))
+        return orders
+
+    # Rows: (order_id, quantity, *Product.from_row columns).
+    _ITEMS_SELECT = """
+        SELECT oi.order_id, oi.quantity,
+               p.id, p.name, p.category, p.price, p.quantity_in_stock
+          FROM order_items oi
+          JOIN products p ON oi.product_id = p.id
+         WHERE oi.order_id IN ({ids})
+         ORDER BY oi.order_id, oi.id
+    """
+
+    @classmethod
+    def _items_sql(cls, n_ids: int) -> str:
+        return cls._ITEMS_SELECT.format(ids=", ".join(["%s"] * n_ids))
+
+    def _load_items(self, cursor, orders: List[Order]) -> None:
+        """Attach items to *orders*, sharing one Product per id."""
+        by_id = {order.id: order for order in orders}
+        ids = list(by_id)
+        products: Dict[int, Product] = {}
+        for pos in range(0, len(ids), self.batch_size):
+            chunk = ids[pos:pos + self.batch_size]
+            cursor.execute(self._items_sql(len(chunk)), chunk)
+            self._attach_items(by_id, cursor.fetchall(), products)
+
+    @staticmethod
+    def _attach_items(
+        by_id: Dict[int, Order], rows: List[tuple], products: Dict[int, Product]
+    ) -> None:
+        """Append item *rows* to their orders, reusing Products from *products*."""
+        for row in rows:
+            product = products.get(row[2])
+            if product is None:
+                product = products[row[2]] = Product.from_row(row[2:])
+            by_id[row[0]].items.append(OrderItem(product, row[1]))
 
     # ── UPDATE ────────────────────────────────────────────────
 
     def update(self, order: Order) -> None:
         """Update order date and re-write all items."""
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with self._write_cursor() as cursor:
             cursor.execute(
                 "UPDATE orders SET order_date = %s WHERE id = %s",
                 (order.order_date, order.id),
             )
             cursor.execute("DELETE FROM order_items WHERE order_id = %s", (order.id,))
-            for item in order.items:
-                cursor.execute(
-                    """
-                    INSERT INTO order_items (order_id, product_id, quantity, unit_price)
-                    VALUES (%s, %s, %s, %s)
-                    """,
-                    (order.id, item.product.id, item.quantity, item.product.price),
-                )
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            cursor.close()
-            conn.close()
+            self._insert_items(cursor, [order])
 
     # ── DELETE ────────────────────────────────────────────────
 
     def delete(self, order_id: int) -> None:
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with self._write_cursor() as cursor:
             cursor.execute("DELETE FROM orders WHERE id = %s", (order_id,))
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            cursor.close()
-            conn.close()
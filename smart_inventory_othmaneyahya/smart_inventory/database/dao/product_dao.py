@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from database.connection import get_connection
 from database.dao.base_dao import BaseDAO
-from core.models import Product
+from database.unit_of_work import UnitOfWork
+from core.exceptions import InvalidQuantityException, OutOfStockException
+from core.models import Product, ProductTable
 
 
 class ProductDAO(BaseDAO):
@@ -20,9 +21,7 @@ class ProductDAO(BaseDAO):
         After a successful insert the product's *id* attribute is updated
         with the auto-generated primary key.
         """
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with self._write_cursor() as cursor:
             cursor.execute(
                 """
                 INSERT INTO products (name, category, price, quantity_in_stock)
@@ -31,63 +30,88 @@ class ProductDAO(BaseDAO):
                 (product.name, product.category, product.price, product.quantity_in_stock),
             )
             product.id = cursor.lastrowid
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            cursor.close()
-            conn.close()
+        self._evict("products", product.id, product)
 
     # ── READ ──────────────────────────────────────────────────
 
+    # Column order matches Product.from_row.
+    _SELECT = "SELECT id, name, category, price, quantity_in_stock FROM products"
+
     def find_by_id(self, product_id: int) -> Optional[Product]:
-        """Return a :class:`Product` or *None*."""
-        conn = get_connection()
-        try:
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT * FROM products WHERE id = %s", (product_id,))
-            row = cursor.fetchone()
-            if row is None:
-                return None
-            return Product(
-                id=row["id"],
-                name=row["name"],
-                category=row["category"],
-                price=float(row["price"]),
-                quantity_in_stock=row["quantity_in_stock"],
-            )
-        finally:
-            cursor.close()
-            conn.close()
+        """Return a :class:`Product` or *None*.
+
+        Served from the unit of work's identity map or the DAO's cache
+        when possible.
+        """
+        return self._find_cached("products", product_id, self._load_row, Product.from_row)
+
+    def _load_row(self, product_id: int) -> Optional[tuple]:
+        with self._read_cursor() as cursor:
+            cursor.execute(self._SELECT + " WHERE id = %s", (product_id,))
+            return cursor.fetchone()
+
+    def find_many(self, product_ids: Sequence[int], chunk_size: int = 500) -> List[Product]:
+        """Return the products with the given ids, ordered by id.
+
+        One ``IN`` query per *chunk_size* ids; unknown ids are skipped.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        ids = list(dict.fromkeys(product_ids))
+        products: List[Product] = []
+        with self._read_cursor() as cursor:
+            for pos in range(0, len(ids), chunk_size):
+                chunk = ids[pos:pos + chunk_size]
+                cursor.execute(self._SELECT + f" WHERE id IN ({', '.join(['%s'] * len(chunk))})", chunk)
+                products.extend(Product.from_rows(cursor.fetchall()))
+        return sorted(products, key=lambda p: p.id)
 
     def find_all(self) -> List[Product]:
         """Return every product."""
-        conn = get_connection()
-        try:
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT * FROM products ORDER BY name")
-            return [
-                Product(
-                    id=r["id"],
-                    name=r["name"],
-                    category=r["category"],
-                    price=float(r["price"]),
-                    quantity_in_stock=r["quantity_in_stock"],
-                )
-                for r in cursor.fetchall()
-            ]
-        finally:
-            cursor.close()
-            conn.close()
+        with self._read_cursor() as cursor:
+            cursor.execute(self._SELECT + " ORDER BY name, id")
+            return Product.from_rows(cursor.fetchall())
+
+    def load_table(self, batch_size: int = 10_000) -> ProductTable:
+        """Return every product as a columnar :class:`ProductTable`,
+        without building a ``Product`` per row.
+
+        Rows are read in id order; the table clusters them by category
+        (in order of first appearance), so they end up ordered by id
+        within each category, not by id overall."""
+        with self._read_cursor() as cursor:
+            cursor.execute(self._SELECT + " ORDER BY id")
+            return ProductTable.from_cursor(cursor, batch_size)
+
+    def find_page(
+        self, after: Optional[Tuple[str, int]] = None, limit: int = 50
+    ) -> List[Product]:
+        """Return up to *limit* products ordered by ``(name, id)``.
+
+        Args:
+            after: ``(name, id)`` of the last product of the previous
+                page, or *None* for the first page.
+            limit: Page size.
+        """
+        sql, params = self._SELECT, []
+        if after is not None:
+            sql += " WHERE name > %s OR (name = %s AND id > %s)"
+            params = [after[0], after[0], after[1]]
+        with self._read_cursor() as cursor:
+            cursor.execute(sql + " ORDER BY name, id LIMIT %s", params + [limit])
+            return Product.from_rows(cursor.fetchall())
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Product]:
+        """Stream every product, fetching *batch_size* rows per query."""
+        return self._iter_pages(
+            self.find_page, lambda p: (p.name, p.id), batch_size
+        )
 
     # ── UPDATE ────────────────────────────────────────────────
 
     def update(self, product: Product) -> None:
         """Update an existing product row."""
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with self._write_cursor() as cursor:
             cursor.execute(
                 """
                 UPDATE products
@@ -97,26 +121,66 @@ class ProductDAO(BaseDAO):
                 (product.name, product.category, product.price,
                  product.quantity_in_stock, product.id),
             )
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            cursor.close()
-            conn.close()
+        self._evict("products", product.id, product)
+
+    # ── STOCK ─────────────────────────────────────────────────
+
+    def reserve_stock(self, lines: Iterable[Tuple[int, int]]) -> None:
+        """Atomically take stock for every ``(product_id, quantity)`` line.
+
+        Each product is decremented by a conditional ``UPDATE`` that only
+        matches while enough stock is left, so concurrent checkouts can
+        never oversell.  Lines for the same product are merged and applied
+        in ascending id order, which gives every transaction the same row
+        lock order and so cannot deadlock against another reservation.
+
+        Either every line is reserved or none is (inside a
+        :class:`UnitOfWork` the rollback is left to the unit of work).
+
+        Raises:
+            InvalidQuantityException: If a quantity is not positive.
+            OutOfStockException: If a product is missing or short of stock.
+        """
+        wanted: Dict[int, int] = {}
+        for product_id, quantity in lines:
+            if quantity <= 0:
+                raise InvalidQuantityException(quantity=quantity)
+            wanted[product_id] = wanted.get(product_id, 0) + quantity
+
+        with self._write_cursor() as cursor:
+            for product_id in sorted(wanted):
+                quantity = wanted[product_id]
+                cursor.execute(
+                    """
+                    UPDATE products
+                       SET quantity_in_stock = quantity_in_stock - %s
+                     WHERE id = %s AND quantity_in_stock >= %s
+                    """,
+                    (quantity, product_id, quantity),
+                )
+                if cursor.rowcount == 0:
+                    cursor.execute(
+                        "SELECT name, quantity_in_stock FROM products WHERE id = %s",
+                        (product_id,),
+                    )
+                    row = cursor.fetchone()
+                    name, available = row if row else (f"#{product_id}", 0)
+                    raise OutOfStockException(
+                        product_name=name, requested=quantity, available=available
+                    )
+        # Keep the unit of work's instances (one object per id) in step
+        # with the rows; only the shared cache entry is dropped.
+        uow = UnitOfWork.current()
+        for product_id, quantity in wanted.items():
+            product = uow.identity_map.get(("products", product_id)) if uow is not None else None
+            if product is not None:
+                product.quantity_in_stock -= quantity
+            self._evict("products", product_id, product)
 
     # ── DELETE ────────────────────────────────────────────────
 
     def delete(self, product_id: int) -> None:
         """Delete a product by id."""
-        conn = get_connection()
-        try:
-            cursor = conn.cursor()
+        with self._write_cursor() as cursor:
             cursor.execute("DELETE FROM products WHERE id = %s", (product_id,))
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            cursor.close()
-            conn.close()
+        self._evict("products", product_id)
@@ -0,0 +1,397 @@
+"""Deterministic synthetic data for load tests and benchmarks.
+
+Generates products, customers, orders and order items with the skew of
+a real shop rather than uniform noise:
+
+* product popularity follows a Zipf law (a few best sellers, a long
+  tail), and so, more gently, does customer activity;
+* order dates follow a seasonal curve: year-on-year growth, a
+  November/December peak, busier weekends and evenings;
+* basket sizes are geometric (mostly 1-3 lines, occasionally dozens),
+  with small quantities and the odd discounted line.
+
+Everything is drawn from NumPy generators keyed on ``(seed, stream,
+chunk)``, so the same :class:`DataSpec` always produces the same rows,
+whatever the insert batch size.  Rows are appended after the current
+``MAX(id)`` of each table with explicit ids and bulk-loaded with
+multi-row ``INSERT`` statements (or ``LOAD DATA LOCAL INFILE`` on
+MySQL), one transaction per chunk of orders.
+
+Run from the smart_inventory root:
+    python database/datagen.py --database /tmp/big.db --orders 2500000   # ~10M items
+    python database/datagen.py --backend mysql --orders 100000 --load-data
+
+or, against the Django database, ``python manage.py generate_data``.
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Add parent to path so we can import from database when run as a script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from database import connection, sqlite_backend
+
+CATEGORIES = {
+    # category -> (share of the catalog, median price)
+    "Electronics": (0.18, 350.0),
+    "Accessories": (0.24, 35.0),
+    "Audio": (0.12, 90.0),
+    "Storage": (0.10, 110.0),
+    "Components": (0.12, 180.0),
+    "Office": (0.14, 45.0),
+    "Networking": (0.10, 70.0),
+}
+ADJECTIVES = ["Pro", "Ultra", "Compact", "Wireless", "Smart", "Classic", "Portable", "Max"]
+NOUNS = {
+    "Electronics": ["Laptop", "Monitor", "Tablet", "Webcam", "Projector"],
+    "Accessories": ["Mouse", "Keyboard", "USB-C Hub", "Laptop Stand", "Mouse Pad"],
+    "Audio": ["Headphones", "Speaker", "Microphone", "Earbuds", "Soundbar"],
+    "Storage": ["External SSD", "USB Drive", "NAS", "Memory Card", "Hard Drive"],
+    "Components": ["Graphics Card", "RAM Kit", "CPU Cooler", "Power Supply", "Motherboard"],
+    "Office": ["Desk Lamp", "Chair", "Whiteboard", "Desk Organizer", "Power Strip"],
+    "Networking": ["Router", "Switch", "Access Point", "Ethernet Cable", "Mesh Node"],
+}
+FIRST_NAMES = ["Alice", "Bob", "Carol", "David", "Emma", "Frank", "Grace", "Henry",
+               "Ines", "Jamal", "Karim", "Laura", "Mehdi", "Nora", "Omar", "Sara"]
+LAST_NAMES = ["Martin", "Johnson", "Williams", "Brown", "Wilson", "Garcia", "Benali",
+              "Dubois", "Nguyen", "Kowalski", "Rossi", "Haddad", "Schmidt", "Lopez"]
+
+# Weekly (Mon..Sun) and hourly (00..23) order-time weights.
+WEEKDAY_WEIGHTS = np.array([1.0, 0.95, 0.95, 1.0, 1.1, 1.3, 1.2])
+HOUR_WEIGHTS = np.array([1, 1, 1, 1, 1, 2, 3, 5, 7, 8, 9, 10,
+                         11, 10, 9, 9, 10, 12, 14, 15, 14, 11, 6, 3], dtype=float)
+
+CHUNK_ORDERS = 50_000   # orders generated (and committed) per chunk
+MAX_BASKET = 40
+MAX_QUANTITY = 10
+
+# table -> inserted columns
+COLUMNS = {
+    "products": ("id", "name", "category", "price", "quantity_in_stock",
+                 "created_at", "updated_at"),
+    "customers": ("id", "name", "email", "created_at", "updated_at"),
+    "orders": ("id", "customer_id", "order_date", "created_at"),
+    "order_items": ("id", "order_id", "product_id", "quantity", "unit_price"),
+}
+
+Rows = List[Tuple[Any, ...]]
+
+
+@dataclass
+class DataSpec:
+    """What to generate; the same spec (and seed) gives the same rows."""
+
+    products: int = 1_000
+    customers: int = 10_000
+    orders: int = 100_000
+    seed: int = 42
+    start: date = date(2024, 1, 1)
+    days: int = 730
+    zipf: float = 1.1            # product popularity exponent
+    customer_zipf: float = 0.6   # customer activity exponent
+    mean_basket: float = 4.0     # average lines per order
+
+
+@dataclass
+class GenerateResult:
+    """Rows inserted per table, and the elapsed time."""
+
+    counts: Dict[str, int]
+    seconds: float
+
+    @property
+    def rows_per_sec(self) -> float:
+        total = sum(self.counts.values())
+        return total / self.seconds if self.seconds > 0 else float(total)
+
+
+def _rng(spec: DataSpec, stream: int, chunk: int = 0) -> np.random.Generator:
+    return np.random.default_rng([spec.seed, stream, chunk])
+
+
+def _zipf_weights(rng: np.random.Generator, n: int, exponent: float) -> np.ndarray:
+    """Zipf probabilities over *n* items, ranks shuffled so that
+    popularity does not follow the id."""
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    rng.shuffle(weights)
+    return weights / weights.sum()
+
+
+def _timestamps(seconds: np.ndarray) -> List[str]:
+    """Epoch seconds -> ``'YYYY-MM-DD HH:MM:SS'`` (portable DATETIME literals)."""
+    text = np.datetime_as_string(seconds.astype("datetime64[s]"), unit="s")
+    return [value.replace("T", " ") for value in text.tolist()]
+
+
+def _epoch(day: date) -> int:
+    return int(np.datetime64(day, "s").astype(np.int64))
+
+
+def product_rows(spec: DataSpec, first_id: int = 1) -> Tuple[Rows, np.ndarray]:
+    """Return the product rows and their prices (for order line prices)."""
+    rng = _rng(spec, 1)
+    n = spec.products
+    names = list(CATEGORIES)
+    shares = np.array([CATEGORIES[c][0] for c in names])
+    category = rng.choice(len(names), n, p=shares / shares.sum())
+    median = np.array([CATEGORIES[c][1] for c in names])[category]
+    price = np.round(np.maximum(median * rng.lognormal(0.0, 0.5, n), 0.99), 2)
+    stock = rng.integers(0, 500, n)
+    low = rng.random(n) < 0.05  # some products are running out
+    stock[low] = rng.integers(0, 10, int(low.sum()))
+    adjective = rng.integers(0, len(ADJECTIVES), n)
+    noun = rng.integers(0, 5, n)
+    created = _epoch(spec.start) - rng.integers(0, 365 * 86_400, n)
+    stamps = _timestamps(created)
+    rows = [
+        (first_id + i, f"{ADJECTIVES[adjective[i]]} {NOUNS[names[category[i]]][noun[i]]} {first_id + i}",
+         names[category[i]], float(price[i]), int(stock[i]), stamps[i], stamps[i])
+        for i in range(n)
+    ]
+    return rows, price
+
+
+def customer_rows(spec: DataSpec, first_id: int = 1) -> Rows:
+    rng = _rng(spec, 2)
+    n = spec.customers
+    first = rng.integers(0, len(FIRST_NAMES), n)
+    last = rng.integers(0, len(LAST_NAMES), n)
+    created = _epoch(spec.start) - rng.integers(0, 365 * 86_400, n)
+    stamps = _timestamps(created)
+    rows = []
+    for i in range(n):
+        given, family = FIRST_NAMES[first[i]], LAST_NAMES[last[i]]
+        cid = first_id + i
+        rows.append((cid, f"{given} {family}", f"{given}.{family}.{cid}@example.com".lower(),
+                     stamps[i], stamps[i]))
+    return rows
+
+
+def _day_weights(spec: DataSpec) -> np.ndarray:
+    days = np.arange(spec.days)
+    dates = np.datetime64(spec.start) + days
+    day_of_year = (dates - dates.astype("datetime64[Y]")).astype(int)
+    weekday = (dates.astype("datetime64[D]").astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+    growth = 1.0 + 0.5 * days / max(spec.days, 1)
+    season = 1.0 + 0.35 * np.cos(2 * np.pi * (day_of_year - 340) / 365.25)
+    weights = growth * season * WEEKDAY_WEIGHTS[weekday]
+    return weights / weights.sum()
+
+
+def order_chunks(
+    spec: DataSpec,
+    prices: np.ndarray,
+    first_product: int = 1,
+    first_customer: int = 1,
+    first_order: int = 1,
+    first_item: int = 1,
+) -> Iterator[Tuple[Rows, Rows]]:
+    """Yield ``(order rows, order item rows)`` for up to
+    :data:`CHUNK_ORDERS` orders at a time, in date (and id) order.
+
+    *prices* are the product prices from :func:`product_rows`, indexed
+    by ``product_id - first_product``.
+    """
+    setup = _rng(spec, 3)
+    per_day = setup.multinomial(spec.orders, _day_weights(spec))
+    order_day = np.repeat(np.arange(spec.days), per_day)
+    product_p = _zipf_weights(setup, len(prices), spec.zipf)
+    customer_p = _zipf_weights(setup, spec.customers, spec.customer_zipf)
+    hour_p = HOUR_WEIGHTS / HOUR_WEIGHTS.sum()
+    start = _epoch(spec.start)
+
+    order_id, item_id = first_order, first_item
+    for chunk, offset in enumerate(range(0, spec.orders, CHUNK_ORDERS)):
+        rng = _rng(spec, 4, chunk)
+        days = order_day[offset:offset + CHUNK_ORDERS]
+        n = len(days)
+        seconds = (start + days.astype(np.int64) * 86_400
+                   + rng.choice(24, n, p=hour_p) * 3_600 + rng.integers(0, 3_600, n))
+        seconds.sort()
+        customers = first_customer + rng.choice(spec.customers, n, p=customer_p)
+        ids = np.arange(order_id, order_id + n)
+        stamps = _timestamps(seconds)
+        orders = list(zip(ids.tolist(), customers.tolist(), stamps, stamps))
+
+        basket = np.minimum(rng.geometric(1.0 / spec.mean_basket, n), MAX_BASKET)
+        m = int(basket.sum())
+        product = rng.choice(len(prices), m, p=product_p)
+        quantity = np.minimum(rng.geometric(0.65, m), MAX_QUANTITY)
+        discount = np.where(rng.random(m) < 0.1, rng.uniform(0.05, 0.2, m), 0.0)
+        unit_price = np.round(prices[product] * (1.0 - discount), 2)
+        items = list(zip(
+            range(item_id, item_id + m), np.repeat(ids, basket).tolist(),
+            (product + first_product).tolist(), quantity.tolist(), unit_price.tolist(),
+        ))
+        order_id += n
+        item_id += m
+        yield orders, items
+
+
+# ── Loading ──────────────────────────────────────────────────────────
+
+def _next_id(cursor: Any, table: str) -> int:
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+    return int(cursor.fetchone()[0]) + 1
+
+
+def insert_rows(cursor: Any, table: str, rows: Rows, batch_size: int = 1_000) -> None:
+    """Insert *rows* with multi-row ``INSERT ... VALUES (...), (...)``.
+
+    Batches are capped so a statement stays under SQLite's 32766
+    bound-parameter limit.
+    """
+    columns = COLUMNS[table]
+    batch_size = max(1, min(batch_size, 32_000 // len(columns)))
+    group = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    head = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+    full_sql = head + ", ".join([group] * batch_size)
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        sql = full_sql if len(batch) == batch_size else head + ", ".join([group] * len(batch))
+        cursor.execute(sql, [value for row in batch for value in row])
+
+
+def load_data_rows(cursor: Any, table: str, rows: Rows, batch_size: int = 0) -> None:
+    """Bulk-load *rows* through a temporary CSV and ``LOAD DATA LOCAL INFILE``.
+
+    MySQL only; the connection needs ``allow_local_infile=True`` and the
+    server ``local_infile=ON``.
+    """
+    columns = COLUMNS[table]
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f, lineterminator="\n").writerows(rows)
+        cursor.execute(
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+            f"LINES TERMINATED BY '\\n' ({', '.join(columns)})",
+            (path,),
+        )
+    finally:
+        os.remove(path)
+
+
+def generate(
+    conn: Any,
+    spec: DataSpec,
+    batch_size: int = 1_000,
+    loader: Callable[[Any, str, Rows, int], None] = insert_rows,
+    progress: Optional[Callable[[Dict[str, int]], None]] = None,
+) -> GenerateResult:
+    """Generate *spec* and load it through the DB-API connection *conn*.
+
+    Commits after the products and customers and after every chunk of
+    orders; *progress*, if given, is called with the running counts.
+    """
+    started = time.perf_counter()
+    counts = dict.fromkeys(COLUMNS, 0)
+    cursor = conn.cursor()
+    try:
+        first = {table: _next_id(cursor, table) for table in COLUMNS}
+        products, prices = product_rows(spec, first["products"])
+        loader(cursor, "products", products, batch_size)
+        loader(cursor, "customers", customer_rows(spec, first["customers"]), batch_size)
+        conn.commit()
+        counts["products"], counts["customers"] = spec.products, spec.customers
+        del products
+
+        for orders, items in order_chunks(spec, prices, first["products"], first["customers"],
+                                          first["orders"], first["order_items"]):
+            loader(cursor, "orders", orders, batch_size)
+            loader(cursor, "order_items", items, batch_size)
+            conn.commit()
+            counts["orders"] += len(orders)
+            counts["order_items"] += len(items)
+            if progress is not None:
+                progress(counts)
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return GenerateResult(counts, time.perf_counter() - started)
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the :class:`DataSpec` options (shared with ``manage.py generate_data``)."""
+    defaults = DataSpec()
+    parser.add_argument("--products", type=int, default=defaults.products)
+    parser.add_argument("--customers", type=int, default=defaults.customers)
+    parser.add_argument("--orders", type=int, default=defaults.orders,
+                        help=f"about {defaults.mean_basket:g} order items each")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--start", type=date.fromisoformat, default=defaults.start,
+                        help="first order date (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, default=defaults.days)
+    parser.add_argument("--zipf", type=float, default=defaults.zipf,
+                        help="product popularity exponent")
+    parser.add_argument("--customer-zipf", type=float, default=defaults.customer_zipf,
+                        help="customer activity exponent")
+    parser.add_argument("--mean-basket", type=float, default=defaults.mean_basket)
+    parser.add_argument("--batch-size", type=int, default=1_000, help="rows per INSERT")
+
+
+def spec_from_options(options: Dict[str, Any]) -> DataSpec:
+    """Build a :class:`DataSpec` from parsed :func:`add_spec_arguments` options."""
+    return DataSpec(
+        products=options["products"], customers=options["customers"],
+        orders=options["orders"], seed=options["seed"], start=options["start"],
+        days=options["days"], zipf=options["zipf"], customer_zipf=options["customer_zipf"],
+        mean_basket=options["mean_basket"],
+    )
+
+
+def format_progress(counts: Dict[str, int]) -> str:
+    return ", ".join(f"{counts[table]:,} {table}" for table in COLUMNS)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=["sqlite", "mysql"], default="sqlite")
+    parser.add_argument("--database", default="smart_inventory_synthetic.db",
+                        help="SQLite file (created with the schema if needed)")
+    parser.add_argument("--load-data", action="store_true",
+                        help="MySQL: use LOAD DATA LOCAL INFILE instead of INSERTs")
+    add_spec_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.load_data and args.backend != "mysql":
+        parser.error("--load-data needs --backend mysql")
+
+    overrides: Dict[str, Any] = {}
+    if args.backend == "sqlite":
+        connection.set_driver(sqlite_backend.connect)
+        overrides["database"] = args.database
+    elif args.load_data:
+        overrides["allow_local_infile"] = True
+    conn = connection.get_connection(**overrides)
+    try:
+        if args.backend == "sqlite":
+            sqlite_backend.create_schema(conn)
+        spec = spec_from_options(vars(args))
+        print(f"Generating {spec.products:,} products, {spec.customers:,} customers, "
+              f"{spec.orders:,} orders (seed {spec.seed}) on {args.backend} …")
+        result = generate(
+            conn, spec, args.batch_size,
+            loader=load_data_rows if args.load_data else insert_rows,
+            progress=lambda counts: print(f"  {format_progress(counts)}", flush=True),
+        )
+    finally:
+        conn.close()
+    print(f"\nDone! {format_progress(result.counts)} in {result.seconds:.1f}s "
+          f"({result.rows_per_sec:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,10 @@ CREATE TABLE IF NOT EXISTS products (
     price       DECIMAL(10, 2) NOT NULL CHECK (price >= 0),
     quantity_in_stock INT      NOT NULL DEFAULT 0 CHECK (quantity_in_stock >= 0),
     created_at  DATETIME       NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    updated_at  DATETIME       NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    updated_at  DATETIME       NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX products_name_idx (name),
+    INDEX products_category_name_idx (category, name),
+    INDEX products_stock_idx (quantity_in_stock)
 ) ENGINE=InnoDB;
 
 -- ── Customers ────────────────────────────────────────────────
@@ -37,6 +40,8 @@ CREATE TABLE IF NOT EXISTS orders (
     customer_id INT            NOT NULL,
     order_date  DATETIME       NOT NULL DEFAULT CURRENT_TIMESTAMP,
     created_at  DATETIME       NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX orders_date_id_idx (order_date, id),
+    INDEX orders_customer_date_idx (customer_id, order_date),
     CONSTRAINT fk_orders_customer
         FOREIGN KEY (customer_id) REFERENCES customers(id)
         ON DELETE CASCADE
@@ -50,6 +55,8 @@ CREATE TABLE IF NOT EXISTS order_items (
     product_id  INT            NOT NULL,
     quantity    INT            NOT NULL CHECK (quantity > 0),
     unit_price  DECIMAL(10, 2) NOT NULL,
+    -- Covers per-product sales totals without reading the rows.
+    INDEX order_items_product_cover_idx (product_id, quantity, unit_price),
     CONSTRAINT fk_items_order
         FOREIGN KEY (order_id) REFERENCES orders(id)
         ON DELETE CASCADE,
@@ -57,3 +64,17 @@ CREATE TABLE IF NOT EXISTS order_items (
         FOREIGN KEY (product_id) REFERENCES products(id)
         ON DELETE RESTRICT
 ) ENGINE=InnoDB;
+
+-- ── Upgrading an existing database ───────────────────────────
+-- The CREATE TABLE statements above are skipped for tables that already
+-- exist; add the lookup indexes to them with:
+--
+-- ALTER TABLE products
+--     ADD INDEX products_name_idx (name),
+--     ADD INDEX products_category_name_idx (category, name),
+--     ADD INDEX products_stock_idx (quantity_in_stock);
+-- ALTER TABLE orders
+--     ADD INDEX orders_date_id_idx (order_date, id),
+--     ADD INDEX orders_customer_date_idx (customer_id, order_date);
+-- ALTER TABLE order_items
+--     ADD INDEX order_items_product_cover_idx (product_id, quantity, unit_price);
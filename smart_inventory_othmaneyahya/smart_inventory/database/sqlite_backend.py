@@ -0,0 +1,188 @@
+"""SQLite stand-in for the MySQL driver (tests and offline benchmarks).
+
+Exposes a ``connect(**config)`` with the same shape as
+``mysql.connector.connect`` so it can be plugged into the pool with
+:func:`database.connection.set_driver`::
+
+    from database import connection, sqlite_backend
+    connection.set_driver(sqlite_backend.connect)
+    conn = connection.get_connection(database="/tmp/bench.db")
+    sqlite_backend.create_schema(conn)
+
+Only the pieces of the mysql-connector API used by the DAOs are
+emulated: ``%s`` placeholders, ``cursor(dictionary=True)`` rows, a
+``lastrowid`` that points at the *first* row of a multi-row INSERT and
+``@@auto_increment_increment`` (always 1).  :func:`translate`,
+:func:`first_rowid` and :func:`as_dict` are shared with the aiosqlite
+driver in :mod:`database.async_connection`.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Sequence
+
+# Round-trip DATETIME columns as datetime objects, like mysql-connector.
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter(
+    "DATETIME", lambda raw: datetime.fromisoformat(raw.decode())
+)
+
+# Same tables as schema.sql, in SQLite dialect.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id                INTEGER PRIMARY KEY AUTOINCREMENT,
+    name              VARCHAR(200)   NOT NULL,
+    category          VARCHAR(100)   NOT NULL,
+    price             DECIMAL(10, 2) NOT NULL CHECK (price >= 0),
+    quantity_in_stock INT            NOT NULL DEFAULT 0 CHECK (quantity_in_stock >= 0),
+    created_at        DATETIME       NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at        DATETIME       NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS customers (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    name        VARCHAR(200) NOT NULL,
+    email       VARCHAR(254) NOT NULL UNIQUE,
+    created_at  DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at  DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS orders (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    customer_id INT      NOT NULL REFERENCES customers(id) ON DELETE CASCADE,
+    order_date  DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at  DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS order_items (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id    INT            NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
+    product_id  INT            NOT NULL REFERENCES products(id) ON DELETE RESTRICT,
+    quantity    INT            NOT NULL CHECK (quantity > 0),
+    unit_price  DECIMAL(10, 2) NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS products_name_idx ON products (name);
+CREATE INDEX IF NOT EXISTS products_category_name_idx ON products (category, name);
+CREATE INDEX IF NOT EXISTS products_stock_idx ON products (quantity_in_stock);
+CREATE INDEX IF NOT EXISTS orders_date_id_idx ON orders (order_date, id);
+CREATE INDEX IF NOT EXISTS orders_customer_date_idx ON orders (customer_id, order_date);
+-- MySQL indexes foreign keys implicitly, SQLite needs it spelled out.
+CREATE INDEX IF NOT EXISTS order_items_order_idx ON order_items (order_id);
+CREATE INDEX IF NOT EXISTS order_items_product_cover_idx
+    ON order_items (product_id, quantity, unit_price);
+"""
+
+
+def translate(sql: str) -> str:
+    """Rewrite the DAOs' MySQL-flavoured SQL for SQLite."""
+    # SQLite's AUTOINCREMENT always steps by one.
+    return sql.replace("@@auto_increment_increment", "1").replace("%s", "?")
+
+
+def first_rowid(lastrowid: Optional[int], rowcount: int) -> Optional[int]:
+    """MySQL's ``lastrowid``: the id of the *first* row of a multi-row INSERT."""
+    if lastrowid and rowcount > 1:
+        return lastrowid - rowcount + 1
+    return lastrowid
+
+
+def as_dict(description: Any, row: Optional[tuple]) -> Optional[dict]:
+    """A ``cursor(dictionary=True)`` row."""
+    if row is None:
+        return None
+    return dict(zip([col[0] for col in description], row))
+
+
+class SQLiteCursor:
+    """Cursor with mysql-connector semantics on top of ``sqlite3``."""
+
+    def __init__(self, cursor: sqlite3.Cursor, dictionary: bool = False) -> None:
+        self._cursor = cursor
+        self._dictionary = dictionary
+        self.lastrowid: Optional[int] = None
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def description(self) -> Any:
+        return self._cursor.description
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+        self._cursor.execute(translate(sql), tuple(params))
+        self.lastrowid = first_rowid(self._cursor.lastrowid, self._cursor.rowcount)
+
+    def executemany(self, sql: str, seq_of_params: Sequence[Sequence[Any]]) -> None:
+        self._cursor.executemany(translate(sql), seq_of_params)
+
+    def _convert(self, row: Optional[tuple]) -> Any:
+        if not self._dictionary:
+            return row
+        return as_dict(self._cursor.description, row)
+
+    def fetchone(self) -> Any:
+        return self._convert(self._cursor.fetchone())
+
+    def fetchmany(self, size: int = 1) -> List[Any]:
+        return [self._convert(r) for r in self._cursor.fetchmany(size)]
+
+    def fetchall(self) -> List[Any]:
+        return [self._convert(r) for r in self._cursor.fetchall()]
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self._convert(r) for r in self._cursor)
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """Connection with the subset of the MySQLConnection API the DAOs use."""
+
+    def __init__(self, database: str) -> None:
+        self._conn = sqlite3.connect(
+            database, check_same_thread=False, detect_types=sqlite3.PARSE_DECLTYPES,
+        )
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._open = True
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._conn.in_transaction
+
+    def cursor(self, buffered: bool = False, dictionary: bool = False) -> SQLiteCursor:
+        return SQLiteCursor(self._conn.cursor(), dictionary=dictionary)
+
+    def is_connected(self) -> bool:
+        return self._open
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def rollback(self) -> None:
+        self._conn.rollback()
+
+    def close(self) -> None:
+        self._open = False
+        self._conn.close()
+
+
+def connect(**config: Any) -> SQLiteConnection:
+    """Open a SQLite database; only the *database* key (a path) is used."""
+    return SQLiteConnection(str(config.get("database", ":memory:")))
+
+
+def create_schema(conn: Any) -> None:
+    """Create the four inventory tables and their indexes on a SQLite connection."""
+    cursor = conn.cursor()
+    try:
+        for statement in SCHEMA.split(";"):
+            if statement.strip():
+                cursor.execute(statement)
+        conn.commit()
+    finally:
+        cursor.close()
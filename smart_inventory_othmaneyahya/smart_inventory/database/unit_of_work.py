@@ -0,0 +1,111 @@
+"""Unit of work — one connection and one transaction across many DAO calls.
+
+Usage::
+
+    with UnitOfWork():
+        ProductDAO().update(product)
+        OrderDAO().save(order)      # both committed together, or neither
+
+DAO methods called inside the ``with`` block enlist in the active unit
+of work: they reuse its connection and cursor and leave the commit (or
+rollback) to the unit of work itself.  ``find_by_id`` lookups are also
+recorded in the unit of work's identity map, so the same id resolves to
+the same object for the whole block.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from database.connection import ConnectionPool, get_pool
+
+_active = threading.local()
+
+
+class UnitOfWork:
+    """Shared transaction scope for ProductDAO, CustomerDAO and OrderDAO.
+
+    Nested ``with UnitOfWork()`` blocks on the same thread join the
+    outermost one; only the outermost block commits or rolls back.
+
+    Attributes:
+        connection: The borrowed connection while the block is active.
+        identity_map: Entities loaded or written in this unit of work,
+            keyed by ``(table, id)``.
+    """
+
+    def __init__(self, **overrides) -> None:
+        self._overrides = overrides
+        self._pool: Optional[ConnectionPool] = None
+        self._cursors: Dict[bool, Any] = {}
+        self._outer: Optional["UnitOfWork"] = None
+        self._on_finish: List[Callable[[], None]] = []
+        self.connection: Any = None
+        self.identity_map: Dict[Hashable, Any] = {}
+
+    @staticmethod
+    def current() -> Optional["UnitOfWork"]:
+        """Return the unit of work active on this thread, if any."""
+        return getattr(_active, "uow", None)
+
+    # ------------------------------------------------------------------
+    # Context manager
+    # ------------------------------------------------------------------
+
+    def __enter__(self) -> "UnitOfWork":
+        outer = self.current()
+        if outer is not None:
+            self._outer = outer
+            return outer
+        self._pool = get_pool(**self._overrides)
+        self.connection = self._pool.acquire()
+        _active.uow = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._outer is not None:
+            self._outer = None
+            return
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            for cursor in self._cursors.values():
+                cursor.close()
+            self._cursors.clear()
+            _active.uow = None
+            self._pool.release(self.connection)
+            self.connection = None
+            self.identity_map.clear()
+            callbacks, self._on_finish = self._on_finish, []
+            for callback in callbacks:
+                callback()
+
+    # ------------------------------------------------------------------
+    # Shared resources
+    # ------------------------------------------------------------------
+
+    def cursor(self, dictionary: bool = False) -> Any:
+        """Return the shared (buffered) cursor of the requested kind."""
+        if self.connection is None:
+            raise RuntimeError("UnitOfWork is not active")
+        cursor = self._cursors.get(dictionary)
+        if cursor is None:
+            cursor = self.connection.cursor(buffered=True, dictionary=dictionary)
+            self._cursors[dictionary] = cursor
+        return cursor
+
+    def on_finish(self, callback: Callable[[], None]) -> None:
+        """Run *callback* once this unit of work has committed or rolled back."""
+        self._on_finish.append(callback)
+
+    def commit(self) -> None:
+        """Commit everything done so far in this unit of work."""
+        self.connection.commit()
+
+    def rollback(self) -> None:
+        """Discard everything done so far in this unit of work."""
+        self.connection.rollback()
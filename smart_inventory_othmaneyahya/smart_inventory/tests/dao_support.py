@@ -0,0 +1,54 @@
+"""Shared fixtures for DAO tests that run on the SQLite stand-in driver."""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from core.models import Product, Customer, Order, OrderItem
+from database import connection, sqlite_backend
+from database.dao import ProductDAO, CustomerDAO
+
+
+class SQLiteDAOTestCase(unittest.TestCase):
+    """Points the DAOs at a fresh SQLite database for every test."""
+
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        connection.set_driver(sqlite_backend.connect)
+        self.addCleanup(connection.set_driver, None)
+        self.db = {"database": os.path.join(tmpdir.name, "test.db")}
+        self._saved_db = connection.DB_CONFIG["database"]
+        connection.DB_CONFIG["database"] = self.db["database"]
+        self.addCleanup(connection.DB_CONFIG.__setitem__, "database", self._saved_db)
+
+        conn = connection.get_connection()
+        sqlite_backend.create_schema(conn)
+        conn.close()
+
+        self.customer = Customer(id=0, name="Alice", email="alice@example.com")
+        CustomerDAO().save(self.customer)
+        self.products = []
+        for i in range(3):
+            product = Product(
+                id=0, name=f"Product {i}", category="Test",
+                price=10.0 + i, quantity_in_stock=100,
+            )
+            ProductDAO().save(product)
+            self.products.append(product)
+
+    def make_order(self, n_lines: int) -> Order:
+        order = Order(id=0, customer=self.customer, order_date=datetime(2026, 1, 1, 12, 0))
+        for i in range(n_lines):
+            order.items.append(OrderItem(self.products[i % 3], i + 1))
+        return order
+
+    def count(self, table: str) -> int:
+        conn = connection.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            return cursor.fetchone()[0]
+        finally:
+            conn.close()
@@ -0,0 +1,133 @@
+"""Tests for the vectorised reports in analytics/engine.py."""
+
+import sys
+import os
+import unittest
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from analytics.engine import SalesAnalytics
+from database import connection
+from database.dao import OrderDAO
+from tests.dao_support import SQLiteDAOTestCase
+
+
+def sample_frames(seed: int = 7):
+    rng = np.random.default_rng(seed)
+    products = pd.DataFrame({
+        "id": np.arange(1, 31),
+        "name": [f"Product {i}" for i in range(30)],
+        "category": pd.Categorical(rng.choice(["Audio", "Storage", "Accessories"], 30)),
+        "price": [Decimal(int(c)) / 100 for c in rng.integers(100, 10_000, 30)],
+        "quantity_in_stock": rng.integers(0, 100, 30),
+    })
+    customers = pd.DataFrame({
+        "id": np.arange(1, 9),
+        "name": [f"Customer {i}" for i in range(8)],
+        "email": [f"c{i}@example.com" for i in range(8)],
+    })
+    orders = pd.DataFrame({
+        "id": np.arange(1, 61),
+        "customer_id": rng.integers(1, 9, 60),
+        "order_date": pd.Timestamp("2025-09-01")
+        + pd.to_timedelta(rng.integers(0, 180 * 86_400, 60), "s"),
+    })
+    order_items = pd.DataFrame({
+        "id": np.arange(1, 301),
+        # orders 59 and 60 have no items
+        "order_id": rng.integers(1, 59, 300),
+        "product_id": rng.integers(1, 31, 300),
+        "quantity": rng.integers(1, 6, 300),
+        "unit_price": [Decimal(int(c)) / 100 for c in rng.integers(100, 10_000, 300)],
+    })
+    return products, customers, orders, order_items
+
+
+class TestSalesAnalytics(unittest.TestCase):
+    """The engine agrees with the notebook's original merge/lambda code."""
+
+    def setUp(self) -> None:
+        self.products, self.customers, self.orders, self.items = sample_frames()
+        self.engine = SalesAnalytics(self.products, self.customers, self.orders, self.items)
+        items = self.items.assign(unit_price=self.items["unit_price"].astype(float))
+        items["line_total"] = items["quantity"] * items["unit_price"]
+        self.reference = items
+
+    def test_revenue_by_month(self) -> None:
+        merged = self.reference.merge(self.orders[["id", "order_date"]],
+                                      left_on="order_id", right_on="id", suffixes=("", "_order"))
+        expected = merged.groupby(merged["order_date"].dt.to_period("M"))["line_total"].sum()
+        monthly = self.engine.revenue_by_month()
+        self.assertEqual(list(monthly["year_month_str"]), [str(p) for p in expected.index])
+        np.testing.assert_allclose(monthly["total_revenue"], expected.values)
+        self.assertAlmostEqual(self.engine.total_revenue(), self.reference["line_total"].sum())
+
+    def test_best_sellers(self) -> None:
+        merged = self.reference.merge(self.products[["id", "name"]],
+                                      left_on="product_id", right_on="id", suffixes=("", "_product"))
+        expected = merged.groupby("name").agg(
+            qty=("quantity", "sum"), revenue=("line_total", "sum"),
+        )
+        best = self.engine.best_sellers()
+        self.assertTrue(best["total_qty_sold"].is_monotonic_decreasing)
+        got = best.set_index("name").loc[expected.index]
+        np.testing.assert_array_equal(got["total_qty_sold"], expected["qty"])
+        np.testing.assert_allclose(got["total_revenue"], expected["revenue"])
+        self.assertEqual(len(self.engine.best_sellers(limit=5)), 5)
+
+    def test_stock_by_category(self) -> None:
+        value = self.products["price"].astype(float) * self.products["quantity_in_stock"]
+        expected = value.groupby(self.products["category"].astype(str)).sum()
+        stock = self.engine.stock_by_category().set_index("category")
+        np.testing.assert_allclose(stock.loc[expected.index, "total_stock_value"], expected.values)
+        self.assertEqual(stock["num_products"].sum(), 30)
+
+    def test_order_value_stats_and_customer_spend(self) -> None:
+        totals = self.reference.groupby("order_id")["line_total"].sum()
+        stats = self.engine.order_value_stats()
+        self.assertEqual(stats["count"], len(totals))
+        self.assertAlmostEqual(stats["mean"], totals.mean())
+        self.assertAlmostEqual(stats["median"], totals.median())
+
+        spend = self.engine.customer_spend()
+        self.assertEqual(spend["num_orders"].sum(), 60)
+        self.assertAlmostEqual(spend["total_spent"].sum(), totals.sum())
+        self.assertTrue(spend["total_spent"].is_monotonic_decreasing)
+
+    def test_line_totals_are_computed_once(self) -> None:
+        self.assertIs(self.engine.line_totals, self.engine.line_totals)
+
+    def test_empty_tables(self) -> None:
+        empty = SalesAnalytics(*(frame.iloc[:0] for frame in sample_frames()))
+        self.assertEqual(empty.order_value_stats()["count"], 0)
+        self.assertEqual(len(empty.revenue_by_month()), 0)
+        self.assertEqual(len(empty.customer_spend()), 0)
+
+
+class TestFromConnection(SQLiteDAOTestCase):
+    """SalesAnalytics.from_connection on the SQLite driver."""
+
+    def test_reads_tables(self) -> None:
+        OrderDAO().save_many([self.make_order(3) for _ in range(4)])
+        conn = connection.get_connection()
+        try:
+            engine = SalesAnalytics.from_connection(conn)
+        finally:
+            conn.close()
+        self.assertEqual(engine.order_value_stats()["count"], 4)
+        # 1 x 10 + 2 x 11 + 3 x 12 per order
+        self.assertAlmostEqual(engine.total_revenue(), 4 * 68.0)
+        best = engine.best_sellers()
+        self.assertEqual(best["name"].iloc[0], self.products[2].name)
+        self.assertEqual(engine.customer_spend()["num_orders"].iloc[0], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
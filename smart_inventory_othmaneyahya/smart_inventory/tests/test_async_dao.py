@@ -0,0 +1,301 @@
+"""Tests for the async connection pool and the async DAOs."""
+
+import sys
+import os
+import asyncio
+import unittest
+from datetime import datetime
+from unittest import mock
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from mysql.connector.errors import PoolError
+
+from core.models import Customer, Order, OrderItem, Product
+from database import async_connection, connection, sqlite_backend
+from database.async_connection import AioMySQLConnection, AioSQLiteConnection, AsyncConnectionPool
+from database.cache import TTLCache
+from database.dao import AsyncCustomerDAO, AsyncOrderDAO, AsyncProductDAO, OrderDAO
+from tests.dao_support import SQLiteDAOTestCase
+
+
+class FakeAsyncConnection:
+    """Minimal stand-in for an async driver connection."""
+
+    def __init__(self, **config) -> None:
+        self.config = config
+        self.connected = True
+        self.in_transaction = False
+        self.rollbacks = 0
+
+    async def is_connected(self) -> bool:
+        return self.connected
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+async def fake_connect(**config) -> FakeAsyncConnection:
+    return FakeAsyncConnection(**config)
+
+
+def make_pool(**kwargs) -> AsyncConnectionPool:
+    return AsyncConnectionPool({"database": "test"}, connect=fake_connect, **kwargs)
+
+
+# ── AsyncConnectionPool Tests ─────────────────────────────────────────
+
+class TestAsyncConnectionPool(unittest.IsolatedAsyncioTestCase):
+
+    async def test_connection_is_reused(self) -> None:
+        pool = make_pool(size=2)
+        async with pool.connection() as first:
+            pass
+        async with pool.connection() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(pool.stats()["creations"], 1)
+
+    async def test_nested_acquire_gets_distinct_connections(self) -> None:
+        pool = make_pool(size=2)
+        async with pool.connection() as outer:
+            async with pool.connection() as inner:
+                self.assertIsNot(outer, inner)
+        self.assertEqual(pool.stats()["idle"], 2)
+
+    async def test_waiter_gets_released_connection(self) -> None:
+        pool = make_pool(size=1)
+        conn = await pool.acquire()
+        waiter = asyncio.ensure_future(pool.acquire(timeout=1.0))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        await pool.release(conn)
+        self.assertIs(await waiter, conn)
+        self.assertEqual(pool.stats()["waits"], 1)
+
+    async def test_timeout_raises_pool_error(self) -> None:
+        pool = make_pool(size=1)
+        await pool.acquire()
+        with self.assertRaises(PoolError):
+            await pool.acquire(timeout=0.01)
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    async def test_open_transaction_rolled_back_on_release(self) -> None:
+        pool = make_pool()
+        async with pool.connection() as conn:
+            conn.in_transaction = True
+        self.assertEqual(conn.rollbacks, 1)
+
+    async def test_dead_connection_replaced(self) -> None:
+        pool = make_pool(size=1)
+        async with pool.connection() as first:
+            pass
+        first.connected = False
+        async with pool.connection() as second:
+            self.assertIsNot(first, second)
+        self.assertEqual(pool.stats()["discards"], 1)
+        self.assertEqual(pool.stats()["open"], 1)
+
+    async def test_failed_connect_frees_slot(self) -> None:
+        async def broken(**config):
+            raise ConnectionError("down")
+
+        pool = AsyncConnectionPool({}, connect=broken, size=1)
+        with self.assertRaises(ConnectionError):
+            await pool.acquire()
+        self.assertEqual(pool.stats()["open"], 0)
+
+
+# ── Driver selection ─────────────────────────────────────────────────
+
+class TestDriverSelection(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.addCleanup(connection.set_driver, None)
+
+    def driver(self, *installed: str):
+        with mock.patch.object(async_connection, "_installed", lambda name: name in installed):
+            return async_connection._current_driver()
+
+    def test_native_drivers_are_the_default(self) -> None:
+        self.assertIs(self.driver("aiomysql", "aiosqlite"), async_connection.aiomysql_connect)
+        connection.set_driver(sqlite_backend.connect)
+        self.assertIs(self.driver("aiomysql", "aiosqlite"), async_connection.aiosqlite_connect)
+
+    def test_threaded_fallback_without_native_drivers(self) -> None:
+        self.assertEqual(self.driver().__qualname__, "threaded.<locals>.connect_async")
+        connection.set_driver(sqlite_backend.connect)
+        self.assertEqual(self.driver("aiomysql").__qualname__, "threaded.<locals>.connect_async")
+
+    def test_set_driver_wins(self) -> None:
+        async_connection.set_driver(fake_connect)
+        self.addCleanup(async_connection.set_driver, None)
+        self.assertIs(self.driver("aiomysql"), fake_connect)
+
+
+@unittest.skipUnless(async_connection._installed("aiomysql"), "aiomysql not installed")
+class TestAioMySQLConnection(unittest.IsolatedAsyncioTestCase):
+
+    async def test_adapter(self) -> None:
+        import aiomysql
+
+        raw = mock.Mock()
+        raw.cursor = mock.AsyncMock(side_effect=lambda cls: cls)
+        raw.ping = mock.AsyncMock(side_effect=ConnectionError)
+        conn = AioMySQLConnection(raw)
+        self.assertIs(await conn.cursor(dictionary=True), aiomysql.DictCursor)
+        self.assertIs(await conn.cursor(), aiomysql.Cursor)
+        self.assertFalse(await conn.is_connected())
+        self.assertTrue(conn.in_transaction)
+
+
+# ── Async DAO Tests (SQLite) ──────────────────────────────────────────
+
+class AsyncSQLiteTestCase(SQLiteDAOTestCase, unittest.IsolatedAsyncioTestCase):
+    """Runs on the default async driver for SQLite unless *driver* is set."""
+
+    driver = None
+
+    def setUp(self) -> None:
+        super().setUp()
+        if self.driver is not None:
+            async_connection.set_driver(self.driver)
+            self.addCleanup(async_connection.set_driver, None)
+
+    async def asyncTearDown(self) -> None:
+        await async_connection.close_pools()
+
+
+class TestAsyncProductDAO(AsyncSQLiteTestCase):
+
+    async def test_crud_round_trip(self) -> None:
+        dao = AsyncProductDAO()
+        product = Product(id=0, name="Async", category="Misc", price=3.5, quantity_in_stock=7)
+        await dao.save(product)
+        self.assertEqual((await dao.find_by_id(product.id)).name, "Async")
+        product.quantity_in_stock = 2
+        await dao.update(product)
+        self.assertEqual((await dao.find_by_id(product.id)).quantity_in_stock, 2)
+        await dao.delete(product.id)
+        self.assertIsNone(await dao.find_by_id(product.id))
+
+    async def test_find_many_gathers_chunks(self) -> None:
+        ids = [p.id for p in self.products]
+        found = await AsyncProductDAO().find_many(ids[::-1] + [999], chunk_size=1)
+        self.assertEqual([p.id for p in found], ids)
+        self.assertGreater(async_connection.pool_stats()["creations"], 1)
+
+    async def test_gathered_lookups(self) -> None:
+        dao = AsyncProductDAO()
+        found = await asyncio.gather(*(dao.find_by_id(p.id) for p in self.products))
+        self.assertEqual([p.name for p in found], [p.name for p in self.products])
+
+    async def test_iter_all(self) -> None:
+        names = [p.name async for p in AsyncProductDAO().iter_all(batch_size=2)]
+        self.assertEqual(names, ["Product 0", "Product 1", "Product 2"])
+
+    async def test_cache_evicted_on_update(self) -> None:
+        dao = AsyncProductDAO(cache=TTLCache())
+        product = await dao.find_by_id(self.products[0].id)
+        product.price = 99.0
+        await dao.update(product)
+        self.assertEqual((await dao.find_by_id(product.id)).price, 99.0)
+
+
+class TestAsyncCustomerDAO(AsyncSQLiteTestCase):
+
+    async def test_save_and_find_many(self) -> None:
+        dao = AsyncCustomerDAO()
+        bob = Customer(id=0, name="Bob", email="bob@example.com")
+        await dao.save(bob)
+        found = await dao.find_many([bob.id, self.customer.id])
+        self.assertEqual([c.name for c in found], ["Alice", "Bob"])
+        self.assertEqual([c.name for c in await dao.find_page(after=("Alice", self.customer.id))], ["Bob"])
+
+
+class TestAsyncOrderDAO(AsyncSQLiteTestCase):
+
+    async def test_save_and_load_matches_sync_dao(self) -> None:
+        order = self.make_order(3)
+        await AsyncOrderDAO().save(order)
+        loaded = await AsyncOrderDAO().find_by_id(order.id)
+        expected = OrderDAO().find_by_id(order.id)
+        self.assertEqual(
+            [(i.product.id, i.quantity) for i in loaded.items],
+            [(i.product.id, i.quantity) for i in expected.items],
+        )
+        self.assertEqual(loaded.customer.email, "alice@example.com")
+
+    async def test_save_many_and_concurrent_item_loading(self) -> None:
+        orders = [self.make_order(2) for _ in range(7)]
+        await AsyncOrderDAO(batch_size=3).save_many(orders)
+        self.assertEqual(self.count("order_items"), 14)
+        loaded = await AsyncOrderDAO(batch_size=2).find_all(with_items=True)
+        self.assertEqual(len(loaded), 7)
+        self.assertTrue(all(len(o.items) == 2 for o in loaded))
+        # One Product object per id across all orders.
+        self.assertIs(loaded[0].items[0].product, loaded[-1].items[0].product)
+        self.assertEqual(sorted(o.id for o in orders), sorted(o.id for o in loaded))
+
+    async def test_save_many_steps_ids_like_sync_dao(self) -> None:
+        with mock.patch.object(OrderDAO, "_assign_ids", wraps=OrderDAO._assign_ids) as assign:
+            await AsyncOrderDAO(batch_size=2).save_many([self.make_order(1) for _ in range(3)])
+        self.assertEqual(assign.call_args.args[2:], (2, 1))  # batch size, SQLite's step
+
+    async def test_find_many_by_date(self) -> None:
+        early = Order(id=0, customer=self.customer, order_date=datetime(2025, 1, 1))
+        early.items.append(OrderItem(self.products[0], 1))
+        await AsyncOrderDAO().save_many([early, self.make_order(1)])
+        found = await AsyncOrderDAO().find_many(start=datetime(2026, 1, 1))
+        self.assertEqual(len(found), 1)
+        self.assertEqual(found[0].order_date, datetime(2026, 1, 1, 12, 0))
+
+    async def test_failed_write_rolls_back(self) -> None:
+        order = self.make_order(1)
+        order.items[0].product = Product(id=999, name="Ghost", category="X", price=1.0, quantity_in_stock=1)
+        with self.assertRaises(Exception):
+            await AsyncOrderDAO().save(order)
+        self.assertEqual(self.count("orders"), 0)
+
+
+
+# The same DAO tests on each SQLite driver.
+
+@unittest.skipUnless(async_connection._installed("aiosqlite"), "aiosqlite not installed")
+class AioSQLiteDriverMixin:
+    driver = staticmethod(async_connection.aiosqlite_connect)
+
+    async def test_pool_uses_aiosqlite(self) -> None:
+        async with async_connection.pooled_connection() as conn:
+            self.assertIsInstance(conn, AioSQLiteConnection)
+
+
+class ThreadedDriverMixin:
+    driver = staticmethod(async_connection.threaded(sqlite_backend.connect))
+
+
+class TestAsyncProductDAOAioSQLite(AioSQLiteDriverMixin, TestAsyncProductDAO):
+    pass
+
+
+class TestAsyncOrderDAOAioSQLite(AioSQLiteDriverMixin, TestAsyncOrderDAO):
+    pass
+
+
+class TestAsyncProductDAOThreaded(ThreadedDriverMixin, TestAsyncProductDAO):
+    pass
+
+
+class TestAsyncOrderDAOThreaded(ThreadedDriverMixin, TestAsyncOrderDAO):
+    pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Tests for the measuring and baseline logic of benchmarks/suite.py."""
+
+import sys
+import os
+import tempfile
+import unittest
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from benchmarks import suite
+from benchmarks.suite import Measurement
+from database.dao import ProductDAO, OrderDAO
+from tests.dao_support import SQLiteDAOTestCase
+
+BASE = {"case": {"name": "case", "seconds": 0.100, "queries": 10, "peak_kib": 1000.0}}
+
+
+class TestCompare(unittest.TestCase):
+
+    def test_within_threshold_passes(self):
+        result = Measurement("case", 0.120, 10, 1200.0)
+        self.assertEqual(suite.compare([result], BASE, threshold=0.25), [])
+
+    def test_slower_than_threshold_fails(self):
+        regressions = suite.compare([Measurement("case", 0.130, 10, 1000.0)], BASE, threshold=0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("0.1000s -> 0.1300s", regressions[0])
+
+    def test_tiny_absolute_slowdown_is_noise(self):
+        base = {"case": dict(BASE["case"], seconds=0.001)}
+        self.assertEqual(suite.compare([Measurement("case", 0.003, 10, 1000.0)], base), [])
+
+    def test_any_extra_query_fails(self):
+        regressions = suite.compare([Measurement("case", 0.100, 11, 1000.0)], BASE)
+        self.assertEqual(regressions, ["case: 10 -> 11 queries"])
+
+    def test_memory_growth_fails(self):
+        regressions = suite.compare([Measurement("case", 0.100, 10, 2000.0)], BASE)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("peak", regressions[0])
+
+    def test_new_cases_are_not_compared(self):
+        self.assertEqual(suite.compare([Measurement("new", 9.0, 99, 1e6)], BASE), [])
+
+    def test_baseline_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            self.assertIsNone(suite.load_baseline(path))
+            suite.save_baseline(path, [Measurement("case", 0.1, 10, 1000.0)], {"orders": 5})
+            data = suite.load_baseline(path)
+        self.assertEqual(data["meta"], {"orders": 5})
+        self.assertEqual(data["results"], BASE)
+
+
+class TestMeasure(SQLiteDAOTestCase):
+
+    def test_counts_sqlite_queries(self):
+        product_id = self.products[0].id
+        result = suite.measure("find", lambda: ProductDAO().find_by_id(product_id),
+                               suite.sqlite_queries, repeat=2)
+        self.assertEqual(result.name, "find")
+        self.assertEqual(result.queries, 1)
+        self.assertGreater(result.seconds, 0)
+        self.assertGreater(result.peak_kib, 0)
+
+    def test_counter_is_removed_afterwards(self):
+        order = self.make_order(3)
+        OrderDAO().save(order)
+        with suite.sqlite_queries() as counted:
+            OrderDAO().find_by_id(order.id)
+        seen = counted()
+        OrderDAO().find_by_id(order.id)
+        self.assertEqual(counted(), seen)
+
+    def test_setup_runs_before_every_call(self):
+        calls = []
+        result = suite.measure("noop", lambda: calls.append("run"), repeat=3,
+                               setup=lambda: calls.append("setup"))
+        self.assertEqual(calls, ["setup", "run"] * 5)
+        self.assertIsNone(result.queries)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Tests for TTLCache and the DAO read-through cache / identity map."""
+
+import sys
+import os
+import unittest
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from database.cache import TTLCache
+from database.dao import ProductDAO, CustomerDAO
+from database.unit_of_work import UnitOfWork
+from tests.dao_support import SQLiteDAOTestCase
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ── TTLCache Tests ────────────────────────────────────────────────────
+
+class TestTTLCache(unittest.TestCase):
+    """Tests for TTLCache."""
+
+    def test_hit_and_miss(self) -> None:
+        cache = TTLCache()
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_lru_eviction(self) -> None:
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self) -> None:
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9.9
+        self.assertEqual(cache.get("a"), 1)
+        clock.now = 10.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_invalidate(self) -> None:
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["invalidations"], 1)
+
+
+# ── DAO cache / identity map Tests ────────────────────────────────────
+
+class TestDAOCache(SQLiteDAOTestCase):
+    """find_by_id goes through the cache and identity map."""
+
+    def test_read_through(self) -> None:
+        cache = TTLCache()
+        dao = ProductDAO(cache=cache)
+        pid = self.products[0].id
+        first = dao.find_by_id(pid)
+        second = dao.find_by_id(pid)
+        self.assertEqual(first.name, second.name)
+        self.assertIsNot(first, second)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_own_writes_invalidate(self) -> None:
+        dao = ProductDAO(cache=TTLCache())
+        product = dao.find_by_id(self.products[0].id)
+        product.price = 42.0
+        dao.update(product)
+        self.assertEqual(dao.find_by_id(product.id).price, 42.0)
+        dao.delete(self.products[2].id)
+        self.assertIsNone(dao.find_by_id(self.products[2].id))
+
+    def test_cache_shared_between_dao_instances(self) -> None:
+        cache = TTLCache()
+        cid = self.customer.id
+        CustomerDAO(cache=cache).find_by_id(cid)
+        customer = CustomerDAO(cache=cache).find_by_id(cid)
+        self.assertEqual(customer.email, "alice@example.com")
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_identity_map_within_unit_of_work(self) -> None:
+        dao = ProductDAO(cache=TTLCache())
+        pid = self.products[1].id
+        with UnitOfWork():
+            first = dao.find_by_id(pid)
+            first.quantity_in_stock -= 5
+            dao.update(first)
+            self.assertIs(ProductDAO().find_by_id(pid), first)
+        self.assertIsNot(dao.find_by_id(pid), first)
+        self.assertEqual(dao.find_by_id(pid).quantity_in_stock, 95)
+
+    def test_identity_map_survives_stock_reservation(self) -> None:
+        dao = ProductDAO(cache=TTLCache())
+        pid = self.products[0].id
+        with UnitOfWork():
+            product = dao.find_by_id(pid)
+            dao.reserve_stock([(pid, 4)])
+            self.assertIs(dao.find_by_id(pid), product)
+            self.assertEqual(product.quantity_in_stock, 96)
+        self.assertEqual(dao.find_by_id(pid).quantity_in_stock, 96)
+
+    def test_identity_map_forgets_deleted(self) -> None:
+        dao = CustomerDAO()
+        with UnitOfWork():
+            self.assertIsNotNone(dao.find_by_id(self.customer.id))
+            dao.delete(self.customer.id)
+            self.assertIsNone(dao.find_by_id(self.customer.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""Unit tests for the pooled connection manager."""
+
+import sys
+import os
+import threading
+import time
+import unittest
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from mysql.connector.errors import PoolError
+
+from database.connection import ConnectionPool, PooledConnection
+
+
+class FakeConnection:
+    """Minimal stand-in for a MySQL connection."""
+
+    def __init__(self, **config) -> None:
+        self.config = config
+        self.connected = True
+        self.in_transaction = False
+        self.rollbacks = 0
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def close(self) -> None:
+        self.connected = False
+
+
+def make_pool(**kwargs) -> ConnectionPool:
+    return ConnectionPool({"database": "test"}, connect=FakeConnection, **kwargs)
+
+
+# ── ConnectionPool Tests ──────────────────────────────────────────────
+
+class TestConnectionPool(unittest.TestCase):
+    """Tests for ConnectionPool."""
+
+    def test_connection_is_reused(self) -> None:
+        pool = make_pool(size=2)
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+        self.assertIs(first, second)
+        stats = pool.stats()
+        self.assertEqual(stats["borrows"], 2)
+        self.assertEqual(stats["creations"], 1)
+        self.assertEqual(stats["idle"], 1)
+
+    def test_nested_acquire_shares_thread_connection(self) -> None:
+        pool = make_pool(size=1)
+        with pool.connection() as outer:
+            with pool.connection(timeout=0) as inner:
+                self.assertIs(outer, inner)
+            self.assertEqual(pool.stats()["in_use"], 1)
+        self.assertEqual(pool.stats()["in_use"], 0)
+        self.assertEqual(pool.stats()["reuses"], 1)
+
+    def test_checkout_timeout(self) -> None:
+        pool = make_pool(size=1)
+        held = threading.Event()
+        done = threading.Event()
+
+        def hold() -> None:
+            with pool.connection():
+                held.set()
+                done.wait(2)
+
+        worker = threading.Thread(target=hold)
+        worker.start()
+        held.wait(2)
+        with self.assertRaises(PoolError):
+            pool.acquire(timeout=0.05)
+        done.set()
+        worker.join()
+        stats = pool.stats()
+        self.assertEqual(stats["waits"], 1)
+        self.assertEqual(stats["timeouts"], 1)
+
+    def test_waiter_gets_released_connection(self) -> None:
+        pool = make_pool(size=1)
+        conn = pool.acquire()
+        result = []
+
+        def borrow() -> None:
+            with pool.connection(timeout=2) as c:
+                result.append(c)
+
+        worker = threading.Thread(target=borrow)
+        worker.start()
+        time.sleep(0.05)
+        pool.release(conn)
+        worker.join()
+        self.assertEqual(result, [conn])
+        self.assertEqual(pool.stats()["creations"], 1)
+
+    def test_unhealthy_connection_is_replaced(self) -> None:
+        pool = make_pool(size=1)
+        with pool.connection() as first:
+            pass
+        first.connected = False
+        with pool.connection() as second:
+            self.assertIsNot(first, second)
+        self.assertEqual(pool.stats()["discards"], 1)
+
+    def test_idle_connections_are_evicted(self) -> None:
+        pool = make_pool(size=2, idle_timeout=0)
+        with pool.connection() as first:
+            pass
+        time.sleep(0.01)
+        with pool.connection() as second:
+            self.assertIsNot(first, second)
+        self.assertFalse(first.connected)
+        self.assertEqual(pool.stats()["evictions"], 1)
+
+    def test_open_transaction_rolled_back_on_return(self) -> None:
+        pool = make_pool()
+        with pool.connection() as conn:
+            conn.in_transaction = True
+        self.assertEqual(conn.rollbacks, 1)
+
+    def test_pooled_connection_close_returns_to_pool(self) -> None:
+        pool = make_pool(size=1)
+        proxy = PooledConnection(pool, pool.checkout())
+        self.assertTrue(proxy.is_connected())
+        proxy.close()
+        proxy.close()
+        self.assertEqual(pool.stats()["idle"], 1)
+        with self.assertRaises(PoolError):
+            proxy.is_connected()
+
+    def test_checkout_is_not_shared_with_acquire(self) -> None:
+        pool = make_pool(size=2)
+        with pool.connection() as held:
+            own = pool.checkout()
+            self.assertIsNot(own, held)
+            with pool.connection() as nested:
+                self.assertIs(nested, held)
+            own.in_transaction = True
+            pool.checkin(own)
+            self.assertEqual((own.rollbacks, held.rollbacks), (1, 0))
+            with self.assertRaises(PoolError):
+                pool.checkin(held)
+        self.assertEqual(pool.stats()["idle"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for keyset pagination (find_page / iter_all) on every DAO."""
+
+import sys
+import os
+import unittest
+from datetime import datetime
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from core.models import Product, Customer
+from database.dao import ProductDAO, CustomerDAO, OrderDAO
+from tests.dao_support import SQLiteDAOTestCase
+
+
+class TestKeysetPagination(SQLiteDAOTestCase):
+    """find_page walks the same rows, in the same order, as find_all."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Duplicate names exercise the id tie-breaker.
+        for i in range(8):
+            ProductDAO().save(Product(
+                id=0, name=f"Dup {i % 3}", category="Test",
+                price=1.0, quantity_in_stock=1,
+            ))
+            CustomerDAO().save(Customer(
+                id=0, name=f"Dup {i % 3}", email=f"dup{i}@example.com",
+            ))
+        orders = [self.make_order(1) for _ in range(7)]
+        for i, order in enumerate(orders):
+            order.order_date = datetime(2026, 1, 1 + i % 3)
+        OrderDAO().save_many(orders)
+
+    def test_products(self) -> None:
+        dao = ProductDAO()
+        expected = [p.id for p in dao.find_all()]
+        self.assertEqual([p.id for p in dao.iter_all(batch_size=3)], expected)
+        first = dao.find_page(limit=4)
+        second = dao.find_page(after=(first[-1].name, first[-1].id), limit=4)
+        self.assertEqual([p.id for p in first + second], expected[:8])
+
+    def test_customers(self) -> None:
+        dao = CustomerDAO()
+        expected = [c.id for c in dao.find_all()]
+        self.assertEqual(len(expected), 9)
+        self.assertEqual([c.id for c in dao.iter_all(batch_size=2)], expected)
+
+    def test_orders(self) -> None:
+        dao = OrderDAO()
+        expected = [o.id for o in dao.find_all()]
+        streamed = list(dao.iter_all(batch_size=3, with_items=True))
+        self.assertEqual([o.id for o in streamed], expected)
+        self.assertTrue(all(len(o.items) == 1 for o in streamed))
+
+    def test_exact_multiple_of_batch_size(self) -> None:
+        dao = OrderDAO()
+        self.assertEqual(len(list(dao.iter_all(batch_size=7))), 7)
+
+    def test_invalid_batch_size(self) -> None:
+        with self.assertRaises(ValueError):
+            list(ProductDAO().iter_all(batch_size=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
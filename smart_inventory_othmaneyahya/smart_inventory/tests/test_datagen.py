@@ -0,0 +1,94 @@
+"""Tests for the synthetic data generator in database/datagen.py."""
+
+import argparse
+import sys
+import os
+import unittest
+from collections import Counter
+from datetime import date
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from database import connection, datagen
+from tests.dao_support import SQLiteDAOTestCase
+
+SPEC = datagen.DataSpec(products=50, customers=40, orders=3_000, seed=7,
+                        start=date(2024, 1, 1), days=366)
+
+
+class TestGeneration(unittest.TestCase):
+    """Row generation is deterministic and skewed."""
+
+    def generate(self, spec: datagen.DataSpec):
+        products, prices = datagen.product_rows(spec)
+        chunks = list(datagen.order_chunks(spec, prices))
+        orders = [row for chunk, _ in chunks for row in chunk]
+        items = [row for _, chunk in chunks for row in chunk]
+        return products, datagen.customer_rows(spec), orders, items
+
+    def test_same_seed_same_rows(self) -> None:
+        self.assertEqual(self.generate(SPEC), self.generate(SPEC))
+        other = datagen.DataSpec(**{**vars(SPEC), "seed": 8})
+        self.assertNotEqual(self.generate(SPEC)[3], self.generate(other)[3])
+
+    def test_distributions(self) -> None:
+        products, customers, orders, items = self.generate(SPEC)
+        self.assertEqual((len(products), len(customers), len(orders)), (50, 40, 3_000))
+        self.assertEqual(len({c[2] for c in customers}), 40)  # unique emails
+
+        # Zipf: the ten most popular of 50 products take over 40% of the lines.
+        popularity = Counter(item[2] for item in items)
+        top = sum(n for _, n in popularity.most_common(10))
+        self.assertGreater(top / len(items), 0.4)
+
+        # Ids follow the date, and December outsells May.
+        dates = [order[2] for order in orders]
+        self.assertEqual(dates, sorted(dates))
+        months = Counter(d[5:7] for d in dates)
+        self.assertGreater(months["12"], months["05"] * 1.3)
+
+        baskets = Counter(item[1] for item in items)
+        self.assertEqual(set(baskets), {order[0] for order in orders})
+        self.assertAlmostEqual(len(items) / len(orders), SPEC.mean_basket, delta=0.5)
+        self.assertGreater(max(baskets.values()), 10)
+
+    def test_options_cover_the_spec(self) -> None:
+        parser = argparse.ArgumentParser()
+        datagen.add_spec_arguments(parser)
+        options = vars(parser.parse_args(["--zipf", "1.3", "--customer-zipf", "0.9"]))
+        spec = datagen.spec_from_options(options)
+        self.assertEqual((spec.zipf, spec.customer_zipf), (1.3, 0.9))
+        self.assertEqual(datagen.spec_from_options(vars(parser.parse_args([]))), datagen.DataSpec())
+
+
+class TestLoad(SQLiteDAOTestCase):
+    """generate() appends after the existing rows on the SQLite driver."""
+
+    def test_bulk_load(self) -> None:
+        conn = connection.get_connection()
+        try:
+            result = datagen.generate(conn, SPEC, batch_size=500)
+        finally:
+            conn.close()
+        self.assertEqual(self.count("products"), 3 + 50)
+        self.assertEqual(self.count("customers"), 1 + 40)
+        self.assertEqual(self.count("orders"), 3_000)
+        self.assertEqual(self.count("order_items"), result.counts["order_items"])
+
+        conn = connection.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) FROM order_items i JOIN products p ON p.id = i.product_id"
+                " WHERE p.id > 3 AND i.unit_price <= p.price"
+            )
+            self.assertEqual(cursor.fetchone()[0], result.counts["order_items"])
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+"""Tests for the streaming CSV and columnar exports in analytics/export_data.py."""
+
+import sys
+import os
+import csv
+import gzip
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from decimal import Decimal
+from unittest import mock
+
+try:
+    import pyarrow
+except ImportError:  # optional: only the columnar export needs it
+    pyarrow = None
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from analytics import columnar, export_data
+from database import connection, sqlite_backend
+from database.dao import OrderDAO
+from tests.dao_support import SQLiteDAOTestCase
+
+
+class ExportTestCase(SQLiteDAOTestCase):
+    """Five orders of three lines each, and a scratch output directory."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        OrderDAO().save_many([self.make_order(3) for _ in range(5)])
+        out = tempfile.TemporaryDirectory()
+        self.addCleanup(out.cleanup)
+        self.out = out.name
+        # Streaming must never materialise the whole result set.
+        patcher = mock.patch.object(
+            sqlite_backend.SQLiteCursor, "fetchall",
+            side_effect=AssertionError("fetchall() used"),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read_csv(self, path: str):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", newline="", encoding="utf-8") as f:
+            return list(csv.reader(f))
+
+
+class TestExportData(ExportTestCase):
+    """Tests for export_table / export_all on the SQLite driver."""
+
+    def test_streams_in_chunks(self) -> None:
+        table, query, headers = export_data.EXPORTS[3]
+        with redirect_stdout(io.StringIO()):
+            result = export_data.export_table(
+                table, query, headers, output_dir=self.out, chunk_size=4,
+            )
+        rows = self.read_csv(result.path)
+        self.assertEqual(rows[0], headers)
+        self.assertEqual(len(rows) - 1, 15)
+        self.assertEqual(result.rows, 15)
+        self.assertGreater(result.rows_per_sec, 0)
+        self.assertEqual(os.listdir(self.out), ["order_items.csv"])
+
+    def test_export_all_in_parallel_with_gzip(self) -> None:
+        with redirect_stdout(io.StringIO()) as output:
+            export_data.main(["--output-dir", self.out, "--gzip", "--chunk-size", "2"])
+        self.assertIn("rows/s", output.getvalue())
+        self.assertEqual(
+            sorted(os.listdir(self.out)),
+            ["customers.csv.gz", "order_items.csv.gz", "orders.csv.gz", "products.csv.gz"],
+        )
+        counts = {
+            name: len(self.read_csv(os.path.join(self.out, name))) - 1
+            for name in os.listdir(self.out)
+        }
+        self.assertEqual(counts["products.csv.gz"], 3)
+        self.assertEqual(counts["orders.csv.gz"], 5)
+        self.assertEqual(counts["order_items.csv.gz"], 15)
+
+    def test_failed_export_leaves_no_partial_file(self) -> None:
+        with self.assertRaises(Exception):
+            export_data.export_table(
+                "broken", "SELECT * FROM missing_table", ["x"], output_dir=self.out,
+            )
+        self.assertEqual(os.listdir(self.out), [])
+
+
+class TestIncrementalExport(ExportTestCase):
+    """Tests for the watermark-based incremental mode and compaction."""
+
+    def run_export(self, *extra: str) -> None:
+        with redirect_stdout(io.StringIO()):
+            export_data.main(["--output-dir", self.out, "--incremental", *extra])
+
+    def segments(self, table: str):
+        return sorted(os.listdir(os.path.join(self.out, table)))
+
+    def execute(self, sql: str, params=()) -> None:
+        conn = connection.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def test_only_new_and_changed_rows_are_exported(self) -> None:
+        self.run_export()
+        state = export_data.load_state(self.out)
+        self.assertEqual(state["order_items"].value, 15)
+        self.assertEqual(len(state["products"].seen), 3)
+
+        self.run_export()  # nothing changed
+        self.assertEqual(self.segments("order_items"), ["segment-000001.csv"])
+        self.assertEqual(self.segments("products"), ["segment-000001.csv"])
+
+        OrderDAO().save_many([self.make_order(2)])
+        self.execute(
+            "UPDATE products SET price = 99, updated_at = %s WHERE id = %s",
+            (datetime(2099, 1, 1), self.products[1].id),
+        )
+        self.run_export()
+        self.assertEqual(self.segments("order_items"), ["segment-000001.csv", "segment-000002.csv"])
+        items = self.read_csv(os.path.join(self.out, "order_items", "segment-000002.csv"))
+        self.assertEqual([row[0] for row in items[1:]], ["16", "17"])
+        changed = self.read_csv(os.path.join(self.out, "products", "segment-000002.csv"))
+        self.assertEqual([row[0] for row in changed[1:]], [str(self.products[1].id)])
+        self.assertEqual(self.segments("customers"), ["segment-000001.csv"])
+
+    def test_compaction_merges_segments(self) -> None:
+        self.run_export()
+        OrderDAO().save_many([self.make_order(2)])
+        self.execute(
+            "UPDATE products SET price = 99, updated_at = %s WHERE id = %s",
+            (datetime(2099, 1, 1), self.products[1].id),
+        )
+        self.run_export("--compact")
+
+        self.assertEqual(self.segments("order_items"), [])
+        items = self.read_csv(os.path.join(self.out, "order_items.csv"))
+        self.assertEqual([int(row[0]) for row in items[1:]], list(range(1, 18)))
+        products = self.read_csv(os.path.join(self.out, "products.csv"))
+        self.assertEqual(len(products) - 1, 3)
+        self.assertEqual(products[2][3], "99")
+
+        OrderDAO().save_many([self.make_order(1)])
+        self.run_export("--compact")
+        items = self.read_csv(os.path.join(self.out, "order_items.csv"))
+        self.assertEqual(len(items) - 1, 18)
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestColumnarExport(ExportTestCase):
+    """Tests for --format parquet/feather and columnar.load_table."""
+
+    def export(self, fmt: str) -> None:
+        with redirect_stdout(io.StringIO()):
+            export_data.main(["--output-dir", self.out, "--format", fmt, "--chunk-size", "1"])
+
+    def test_typed_round_trip(self) -> None:
+        conn = connection.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("UPDATE products SET category = 'Other' WHERE id = %s",
+                           (self.products[1].id,))
+            conn.commit()
+        finally:
+            conn.close()
+        for fmt in ("parquet", "feather"):
+            with self.subTest(fmt=fmt):
+                self.export(fmt)
+                products = columnar.load_table("products", data_dir=self.out, fmt=fmt)
+                self.assertEqual(str(products["category"].dtype), "category")
+                self.assertEqual(list(products["category"]), ["Test", "Other", "Test"])
+                self.assertEqual(products["price"].iloc[1], Decimal("11.00"))
+
+                orders = columnar.load_table("orders", data_dir=self.out, fmt=fmt)
+                self.assertEqual(orders["order_date"].dtype.kind, "M")
+
+                items = columnar.load_table("order_items", data_dir=self.out, fmt=fmt,
+                                            exact_decimals=False)
+                self.assertEqual(len(items), 15)
+                self.assertEqual((items["quantity"] * items["unit_price"]).sum(), 5 * 68.0)
+
+    def test_projection(self) -> None:
+        self.export("feather")
+        items = columnar.load_table("order_items", columns=["order_id", "quantity"],
+                                    data_dir=self.out)
+        self.assertEqual(list(items.columns), ["order_id", "quantity"])
+
+    def test_missing_export(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            columnar.load_table("orders", data_dir=self.out)
+
+    def test_incremental_rejects_columnar(self) -> None:
+        with self.assertRaises(SystemExit), mock.patch("sys.stderr", io.StringIO()):
+            export_data.main(["--incremental", "--format", "parquet"])
+
+
+if __name__ == "__main__":
+    unittest.main()
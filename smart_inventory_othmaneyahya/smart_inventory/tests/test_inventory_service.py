@@ -0,0 +1,148 @@
+"""Tests for InventoryService.create_orders_batch."""
+
+import sys
+import os
+import unittest
+from datetime import datetime
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from core.exceptions import InvalidQuantityException, OutOfStockException
+from core.models import Customer, Product
+from core.services.inventory_service import InventoryService, OrderRequest
+from database.dao import OrderDAO, ProductDAO
+from tests.dao_support import SQLiteDAOTestCase
+
+
+class TestCreateOrdersBatch(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.alice = Customer(id=1, name="Alice", email="alice@example.com")
+        self.mouse = Product(id=1, name="Mouse", category="Accessories", price=25.0, quantity_in_stock=5)
+        self.cable = Product(id=2, name="Cable", category="Cables", price=5.0, quantity_in_stock=100)
+
+    def test_all_orders_fit(self) -> None:
+        result = InventoryService.create_orders_batch([
+            OrderRequest(self.alice, [(self.mouse, 2), (self.cable, 10)]),
+            OrderRequest(self.alice, [(self.mouse, 3)], order_date=datetime(2026, 1, 1)),
+        ])
+        self.assertEqual(result.failures, {})
+        self.assertEqual(len(result.orders), 2)
+        self.assertEqual(result.orders[0].calculate_total(), 100.0)
+        self.assertEqual(result.orders[1].order_date, datetime(2026, 1, 1))
+        self.assertEqual((self.mouse.quantity_in_stock, self.cable.quantity_in_stock), (0, 90))
+
+    def test_contended_product_first_come_first_served(self) -> None:
+        result = InventoryService.create_orders_batch([
+            OrderRequest(self.alice, [(self.mouse, 3)]),
+            OrderRequest(self.alice, [(self.mouse, 3), (self.cable, 1)]),  # only 2 mice left
+            OrderRequest(self.alice, [(self.mouse, 2)]),
+            OrderRequest(self.alice, [(self.cable, 1)]),
+        ])
+        self.assertEqual(list(result.failures), [1])
+        error = result.failures[1]
+        self.assertIsInstance(error, OutOfStockException)
+        self.assertEqual((error.requested, error.available), (3, 2))
+        self.assertEqual(len(result.orders), 3)
+        self.assertEqual((self.mouse.quantity_in_stock, self.cable.quantity_in_stock), (0, 99))
+
+    def test_repeated_lines_count_together(self) -> None:
+        result = InventoryService.create_orders_batch([
+            OrderRequest(self.alice, [(self.mouse, 3), (self.mouse, 3)]),
+        ])
+        self.assertIsInstance(result.failures[0], OutOfStockException)
+        self.assertEqual(self.mouse.quantity_in_stock, 5)
+
+    def test_invalid_quantity_rejects_only_that_order(self) -> None:
+        result = InventoryService.create_orders_batch([
+            OrderRequest(self.alice, [(self.cable, 1), (self.mouse, 0)]),
+            OrderRequest(self.alice, [(self.cable, 1)]),
+        ])
+        self.assertIsInstance(result.failures[0], InvalidQuantityException)
+        self.assertEqual(len(result.orders), 1)
+        self.assertEqual(self.cable.quantity_in_stock, 99)
+
+
+class TestCreateOrdersBatchPersistence(SQLiteDAOTestCase):
+
+    def test_orders_saved_in_one_batch(self) -> None:
+        p0, p1, _ = self.products
+        requests = [OrderRequest(self.customer, [(p0, 1), (p1, 2)]) for _ in range(30)]
+        requests.append(OrderRequest(self.customer, [(p0, 500)]))
+        result = InventoryService.create_orders_batch(requests, order_dao=OrderDAO(), product_dao=ProductDAO())
+        self.assertEqual(list(result.failures), [30])
+        self.assertEqual(self.count("orders"), 30)
+        self.assertEqual(self.count("order_items"), 60)
+        loaded = OrderDAO().find_by_id(result.orders[-1].id)
+        self.assertEqual([(i.product.id, i.quantity) for i in loaded.items], [(p0.id, 1), (p1.id, 2)])
+        self.assertEqual(p0.quantity_in_stock, 70)
+
+    def test_stock_is_written(self) -> None:
+        p0, p1, _ = self.products
+        requests = [OrderRequest(self.customer, [(p0, 1), (p1, 2)]) for _ in range(10)]
+        InventoryService.create_orders_batch(requests, order_dao=OrderDAO(), product_dao=ProductDAO())
+        stored = {p.id: p.quantity_in_stock for p in ProductDAO().find_all()}
+        self.assertEqual((stored[p0.id], stored[p1.id]), (90, 80))
+        self.assertEqual((p0.quantity_in_stock, p1.quantity_in_stock), (90, 80))
+
+    def take_stock(self, product, left: int) -> None:
+        """Another writer leaves *left* units of *product* after it was loaded."""
+        stale = ProductDAO().find_by_id(product.id)
+        stale.quantity_in_stock = left
+        ProductDAO().update(stale)
+
+    def test_reservation_conflict_fails_only_affected_orders(self) -> None:
+        p0, p1, _ = self.products
+        self.take_stock(p1, 1)
+        # p0 is reserved first (ascending id); the first attempt is rolled
+        # back when p1 comes up short, then the order that fits is retried.
+        result = InventoryService.create_orders_batch([
+            OrderRequest(self.customer, [(p0, 5), (p1, 5)]),
+            OrderRequest(self.customer, [(p0, 3)]),
+        ], order_dao=OrderDAO(), product_dao=ProductDAO())
+        self.assertIsInstance(result.failures[0], OutOfStockException)
+        self.assertEqual(result.failures[0].available, 1)
+        self.assertEqual([o.id for o in result.orders], [o.id for o in OrderDAO().find_all()])
+        self.assertEqual((self.count("orders"), self.count("order_items")), (1, 1))
+        stored = {p.id: p.quantity_in_stock for p in ProductDAO().find_all()}
+        self.assertEqual((stored[p0.id], stored[p1.id]), (97, 1))
+        self.assertEqual((p0.quantity_in_stock, p1.quantity_in_stock), (97, 1))
+
+    def test_conflict_inside_enclosing_unit_of_work_is_raised(self) -> None:
+        p0, p1, _ = self.products
+        self.take_stock(p1, 1)
+        with self.assertRaises(OutOfStockException):
+            with ProductDAO.unit_of_work():
+                InventoryService.create_orders_batch(
+                    [OrderRequest(self.customer, [(p0, 5), (p1, 5)])],
+                    order_dao=OrderDAO(), product_dao=ProductDAO(),
+                )
+        self.assertEqual((self.count("orders"), self.count("order_items")), (0, 0))
+        self.assertEqual(ProductDAO().find_by_id(p0.id).quantity_in_stock, 100)
+        self.assertEqual(p0.quantity_in_stock, 100)
+
+    def test_product_dao_required_to_persist(self) -> None:
+        with self.assertRaises(ValueError):
+            InventoryService.create_orders_batch(
+                [OrderRequest(self.customer, [(self.products[0], 1)])], order_dao=OrderDAO(),
+            )
+
+    def test_failed_write_leaves_stock_alone(self) -> None:
+        class FailingDAO:
+            def save_many(self, orders):
+                raise RuntimeError("database down")
+
+        p0 = self.products[0]
+        with self.assertRaises(RuntimeError):
+            InventoryService.create_orders_batch(
+                [OrderRequest(self.customer, [(p0, 1)])], order_dao=FailingDAO(), product_dao=ProductDAO(),
+            )
+        self.assertEqual(p0.quantity_in_stock, 100)
+        self.assertEqual(ProductDAO().find_by_id(p0.id).quantity_in_stock, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import sys
 import os
 import unittest
 from datetime import datetime
+from decimal import Decimal
 
 # Ensure the smart_inventory package is on the path
 sys.path.insert(
@@ -155,5 +156,40 @@ class TestOrder(unittest.TestCase):
         self.assertIn("TOTAL", text)
 
 
+# ── Slots & trusted hydration ─────────────────────────────────────────
+
+class TestTrustedHydration(unittest.TestCase):
+    """from_row / from_rows build models from database rows."""
+
+    def test_models_have_no_instance_dict(self) -> None:
+        product = Product(id=1, name="Mouse", category="Accessories", price=25.0)
+        customer = Customer(id=1, name="Alice", email="alice@example.com")
+        for obj in (product, customer, Order(id=1, customer=customer), OrderItem(product, 1)):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+        with self.assertRaises(AttributeError):
+            product.colour = "black"
+
+    def test_product_from_row(self) -> None:
+        product = Product.from_row((7, "Mouse", "Accessories", Decimal("25.50"), 3))
+        self.assertEqual(
+            (product.id, product.name, product.category, product.quantity_in_stock),
+            (7, "Mouse", "Accessories", 3),
+        )
+        self.assertIsInstance(product.price, float)
+        self.assertEqual(product.get_value_in_stock(), 76.5)
+
+    def test_customer_from_row_skips_validation(self) -> None:
+        # Rows come from the database, where only validated emails are stored.
+        customer = Customer.from_row((3, "Legacy", "not-an-email"))
+        self.assertEqual((customer.id, customer.name, customer.email), (3, "Legacy", "not-an-email"))
+        with self.assertRaises(InvalidEmailException):
+            customer.validate_email()
+
+    def test_from_rows(self) -> None:
+        customers = Customer.from_rows([(1, "A", "a@example.com"), (2, "B", "b@example.com")])
+        self.assertEqual([c.id for c in customers], [1, 2])
+        self.assertEqual(Product.from_rows(iter([])), [])
+
+
 if __name__ == "__main__":
     unittest.main()
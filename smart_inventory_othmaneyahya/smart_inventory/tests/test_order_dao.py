@@ -0,0 +1,105 @@
+"""Tests for OrderDAO against the SQLite stand-in driver."""
+
+import sys
+import os
+import unittest
+from datetime import datetime
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from database.dao import OrderDAO
+from tests.dao_support import SQLiteDAOTestCase
+
+
+# ── OrderDAO batched writes ───────────────────────────────────────────
+
+class TestOrderDAOBatchWrites(SQLiteDAOTestCase):
+    """Tests for the multi-row INSERT write path."""
+
+    def test_save_chunks_items(self) -> None:
+        order = self.make_order(7)
+        OrderDAO(batch_size=3).save(order)
+        loaded = OrderDAO().find_by_id(order.id)
+        self.assertEqual(len(loaded.items), 7)
+        self.assertEqual([i.quantity for i in loaded.items], list(range(1, 8)))
+
+    def test_update_rewrites_items(self) -> None:
+        dao = OrderDAO(batch_size=2)
+        order = self.make_order(5)
+        dao.save(order)
+        order.items = order.items[:2]
+        dao.update(order)
+        self.assertEqual(len(dao.find_by_id(order.id).items), 2)
+        self.assertEqual(self.count("order_items"), 2)
+
+    def test_save_many_assigns_ids(self) -> None:
+        orders = [self.make_order(n) for n in (1, 4, 2, 3, 5)]
+        OrderDAO(batch_size=2).save_many(orders)
+        self.assertEqual(len({o.id for o in orders}), 5)
+        self.assertEqual(self.count("orders"), 5)
+        self.assertEqual(self.count("order_items"), 15)
+        for order in orders:
+            loaded = OrderDAO().find_by_id(order.id)
+            self.assertEqual(
+                [i.quantity for i in loaded.items],
+                [i.quantity for i in order.items],
+            )
+
+    def test_assign_ids_uses_auto_increment_step(self) -> None:
+        orders = [self.make_order(1) for _ in range(5)]
+        OrderDAO._assign_ids(orders, [11, 21, 31], batch_size=2, step=3)
+        self.assertEqual([o.id for o in orders], [11, 14, 21, 24, 31])
+
+    def test_save_many_empty(self) -> None:
+        OrderDAO().save_many([])
+        self.assertEqual(self.count("orders"), 0)
+
+
+# ── OrderDAO batched reads ────────────────────────────────────────────
+
+class TestOrderDAOBatchReads(SQLiteDAOTestCase):
+    """Tests for find_many / find_all(with_items=True)."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.orders = [self.make_order(n) for n in (2, 3, 1)]
+        for day, order in enumerate(self.orders, start=1):
+            order.order_date = datetime(2026, 1, day)
+        OrderDAO().save_many(self.orders)
+
+    def test_find_many_by_ids(self) -> None:
+        wanted = [self.orders[0].id, self.orders[2].id]
+        found = OrderDAO().find_many(order_ids=wanted)
+        self.assertEqual(sorted(o.id for o in found), sorted(wanted))
+        self.assertEqual(sorted(len(o.items) for o in found), [1, 2])
+
+    def test_find_many_by_date_range(self) -> None:
+        found = OrderDAO().find_many(start=datetime(2026, 1, 2), end=datetime(2026, 1, 3))
+        self.assertEqual([o.id for o in found], [self.orders[1].id])
+        self.assertEqual(len(found[0].items), 3)
+
+    def test_shared_customer_and_product_instances(self) -> None:
+        found = OrderDAO().find_all(with_items=True)
+        self.assertEqual(len(found), 3)
+        self.assertEqual(len({id(o.customer) for o in found}), 1)
+        first_products = {}
+        for order in found:
+            for item in order.items:
+                first_products.setdefault(item.product.id, item.product)
+                self.assertIs(item.product, first_products[item.product.id])
+
+    def test_find_all_headers_only(self) -> None:
+        found = OrderDAO().find_all()
+        self.assertEqual([o.id for o in found], [o.id for o in reversed(self.orders)])
+        self.assertTrue(all(not o.items for o in found))
+
+    def test_find_many_empty_ids(self) -> None:
+        self.assertEqual(OrderDAO().find_many(order_ids=[]), [])
+        self.assertIsNone(OrderDAO().find_by_id(9999))
+
+
+if __name__ == "__main__":
+    unittest.main()
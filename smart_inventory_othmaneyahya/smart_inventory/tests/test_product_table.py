@@ -0,0 +1,128 @@
+"""Tests for ProductTable and the vectorised InventoryService catalog queries."""
+
+import sys
+import os
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from core.models import Product, ProductTable
+from core.services.inventory_service import InventoryService
+from database.dao import ProductDAO
+from tests.dao_support import SQLiteDAOTestCase
+
+ROWS = [
+    (1, "Laptop", "Electronics", 999.99, 4),
+    (2, "Mouse", "Accessories", 25.0, 50),
+    (3, "Monitor", "Electronics", 199.5, 0),
+    (4, "Cable", "Cables", 5.0, 300),
+    (5, "Keyboard", "Accessories", 49.9, 8),
+]
+
+
+class TestProductTable(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.table = ProductTable.from_rows(ROWS)
+        self.products = Product.from_rows(ROWS)
+
+    def test_rows_are_clustered_by_category(self) -> None:
+        self.assertEqual(self.table.categories, ("Electronics", "Accessories", "Cables"))
+        self.assertEqual(self.table.ids.tolist(), [1, 3, 2, 5, 4])
+        self.assertEqual(self.table.names.tolist(), ["Laptop", "Monitor", "Mouse", "Keyboard", "Cable"])
+        self.assertEqual(
+            self.table.category_slices(),
+            {"Electronics": slice(0, 2), "Accessories": slice(2, 4), "Cables": slice(4, 5)},
+        )
+
+    def test_round_trip_to_products(self) -> None:
+        products = sorted(self.table.to_products(), key=lambda p: p.id)
+        self.assertEqual(
+            [(p.id, p.name, p.category, p.price, p.quantity_in_stock) for p in products], ROWS,
+        )
+        self.assertEqual(ProductTable.from_products(self.products).ids.tolist(), self.table.ids.tolist())
+
+    def test_group_by_category_returns_views(self) -> None:
+        groups = self.table.group_by_category()
+        self.assertEqual(groups["Accessories"].names.tolist(), ["Mouse", "Keyboard"])
+        self.assertTrue(np.shares_memory(groups["Accessories"].prices, self.table.prices))
+
+    def test_category_summary(self) -> None:
+        self.assertEqual(self.table.category_summary()["Electronics"], {
+            "num_products": 2, "total_stock_units": 4, "total_stock_value": 3999.96,
+        })
+
+    def test_empty_table(self) -> None:
+        table = ProductTable.from_rows([])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.total_stock_value(), 0.0)
+        self.assertEqual(table.group_by_category(), {})
+        self.assertEqual(len(table.low_stock(10)), 0)
+
+    def test_decimal_prices(self) -> None:
+        table = ProductTable.from_rows([(1, "Mouse", "Accessories", Decimal("25.50"), 2)])
+        self.assertEqual(table.prices.dtype, np.float64)
+        self.assertEqual(table.total_stock_value(), 51.0)
+
+
+class TestVectorisedService(unittest.TestCase):
+    """Table results match the object path."""
+
+    def setUp(self) -> None:
+        self.table = ProductTable.from_rows(ROWS)
+        self.products = Product.from_rows(ROWS)
+
+    def test_total_stock_value(self) -> None:
+        self.assertAlmostEqual(
+            InventoryService.total_stock_value(self.table),
+            InventoryService.total_stock_value(self.products),
+        )
+
+    def test_stock_value_by_category(self) -> None:
+        expected = InventoryService.stock_value_by_category(self.products)
+        actual = InventoryService.stock_value_by_category(self.table)
+        self.assertEqual(set(actual), set(expected))
+        for category, value in expected.items():
+            self.assertAlmostEqual(actual[category], value)
+
+    def test_products_by_category(self) -> None:
+        expected = InventoryService.products_by_category(self.products)
+        actual = InventoryService.products_by_category(self.table)
+        self.assertEqual(
+            {c: t.ids.tolist() for c, t in actual.items()},
+            {c: [p.id for p in ps] for c, ps in expected.items()},
+        )
+
+    def test_low_stock(self) -> None:
+        self.assertEqual(
+            sorted(InventoryService.low_stock(self.table, 8).ids.tolist()),
+            sorted(p.id for p in InventoryService.low_stock(self.products, 8)),
+        )
+        self.assertEqual(sorted(InventoryService.low_stock(self.table, 8).ids.tolist()), [1, 3, 5])
+
+    def test_products_in_price_range(self) -> None:
+        table = InventoryService.products_in_price_range(self.table, 25.0, 199.5)
+        objects = InventoryService.products_in_price_range(self.products, 25.0, 199.5)
+        self.assertEqual(sorted(table.ids.tolist()), sorted(p.id for p in objects))
+        self.assertEqual(sorted(table.ids.tolist()), [2, 3, 5])
+
+
+class TestLoadTable(SQLiteDAOTestCase):
+
+    def test_load_table_from_dao_cursor(self) -> None:
+        ProductDAO().save(Product(id=0, name="Other", category="Misc", price=2.5, quantity_in_stock=4))
+        table = ProductDAO().load_table(batch_size=2)
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table.categories, ("Test", "Misc"))
+        self.assertEqual(table.total_stock_value(), 100 * (10 + 11 + 12) + 10.0)
+        self.assertEqual(table.low_stock(10).names.tolist(), ["Other"])
+
+
+if __name__ == "__main__":
+    unittest.main()
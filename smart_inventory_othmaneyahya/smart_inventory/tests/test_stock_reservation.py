@@ -0,0 +1,82 @@
+"""Tests for ProductDAO.reserve_stock (conditional, all-or-nothing decrements)."""
+
+import sys
+import os
+import threading
+import unittest
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from core.exceptions import InvalidQuantityException, OutOfStockException
+from database.dao import ProductDAO
+from tests.dao_support import SQLiteDAOTestCase
+
+
+class TestReserveStock(SQLiteDAOTestCase):
+    """Tests for ProductDAO.reserve_stock."""
+
+    def stock(self, product) -> int:
+        return ProductDAO().find_by_id(product.id).quantity_in_stock
+
+    def test_lines_are_merged_and_deducted(self) -> None:
+        a, b, _ = self.products
+        ProductDAO().reserve_stock([(b.id, 5), (a.id, 2), (b.id, 3)])
+        self.assertEqual(self.stock(a), 98)
+        self.assertEqual(self.stock(b), 92)
+
+    def test_shortage_reserves_nothing(self) -> None:
+        a, b, _ = self.products
+        with self.assertRaises(OutOfStockException) as ctx:
+            ProductDAO().reserve_stock([(a.id, 10), (b.id, 101)])
+        self.assertEqual(ctx.exception.product_name, b.name)
+        self.assertEqual(ctx.exception.requested, 101)
+        self.assertEqual(ctx.exception.available, 100)
+        self.assertEqual(self.stock(a), 100)
+
+    def test_missing_product(self) -> None:
+        with self.assertRaises(OutOfStockException):
+            ProductDAO().reserve_stock([(9999, 1)])
+
+    def test_invalid_quantity(self) -> None:
+        with self.assertRaises(InvalidQuantityException):
+            ProductDAO().reserve_stock([(self.products[0].id, 0)])
+
+    def test_concurrent_checkouts_never_oversell(self) -> None:
+        a, b, _ = self.products
+        start = threading.Barrier(8)
+        sold = []
+        lock = threading.Lock()
+
+        def checkout(lines) -> None:
+            start.wait()
+            for _ in range(20):
+                try:
+                    ProductDAO().reserve_stock(lines)
+                except OutOfStockException:
+                    continue
+                with lock:
+                    sold.append(lines)
+
+        # Half the threads list the products in the opposite order.
+        threads = [
+            threading.Thread(target=checkout, args=([(a.id, 3), (b.id, 1)],))
+            if i % 2 else
+            threading.Thread(target=checkout, args=([(b.id, 1), (a.id, 3)],))
+            for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 100 units of *a* at 3 per checkout: exactly 33 can succeed.
+        self.assertEqual(len(sold), 33)
+        self.assertEqual(self.stock(a), 1)
+        self.assertEqual(self.stock(b), 100 - 33)
+
+
+if __name__ == "__main__":
+    unittest.main()
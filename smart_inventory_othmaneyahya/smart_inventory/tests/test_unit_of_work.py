@@ -0,0 +1,112 @@
+"""Unit tests for the UnitOfWork transaction scope."""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Ensure the smart_inventory package is on the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+from core.models import Product, Customer, Order
+from database.dao import ProductDAO, OrderDAO
+from database.unit_of_work import UnitOfWork
+
+
+class FakeCursor:
+    """Cursor that records statements instead of running them."""
+
+    def __init__(self, conn) -> None:
+        self.conn = conn
+        self.lastrowid = None
+        self.closed = False
+
+    def execute(self, sql, params=()) -> None:
+        self.conn.statements.append(" ".join(sql.split()))
+        self.conn.next_id += 1
+        self.lastrowid = self.conn.next_id
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeConnection:
+    """Connection stand-in counting commits, rollbacks and cursors."""
+
+    def __init__(self, **config) -> None:
+        self.statements = []
+        self.next_id = 0
+        self.cursors = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.in_transaction = False
+
+    def cursor(self, **kwargs) -> FakeCursor:
+        self.cursors += 1
+        return FakeCursor(self)
+
+    def is_connected(self) -> bool:
+        return True
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def close(self) -> None:
+        pass
+
+
+# ── UnitOfWork Tests ──────────────────────────────────────────────────
+
+class TestUnitOfWork(unittest.TestCase):
+    """Tests for UnitOfWork."""
+
+    def setUp(self) -> None:
+        patcher = mock.patch("mysql.connector.connect", FakeConnection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.db = {"database": f"uow_{self.id()}"}
+        self.product = Product(
+            id=1, name="Mouse", category="Accessories",
+            price=25.0, quantity_in_stock=10,
+        )
+        self.customer = Customer(id=1, name="Alice", email="alice@example.com")
+
+    def test_single_commit_across_daos(self) -> None:
+        order = Order(id=0, customer=self.customer)
+        order.add_item(self.product, 2)
+        with UnitOfWork(**self.db) as uow:
+            ProductDAO().update(self.product)
+            OrderDAO().save(order)
+            conn = uow.connection
+        self.assertEqual(conn.commits, 1)
+        self.assertEqual(conn.rollbacks, 0)
+        self.assertEqual(conn.cursors, 1)
+        self.assertEqual(len(conn.statements), 3)
+        self.assertIsNone(UnitOfWork.current())
+
+    def test_rollback_on_error(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with UnitOfWork(**self.db) as uow:
+                ProductDAO().update(self.product)
+                conn = uow.connection
+                raise RuntimeError("boom")
+        self.assertEqual(conn.commits, 0)
+        self.assertEqual(conn.rollbacks, 1)
+
+    def test_nested_unit_of_work_joins_outer(self) -> None:
+        with UnitOfWork(**self.db) as outer:
+            with UnitOfWork(**self.db) as inner:
+                self.assertIs(inner, outer)
+                ProductDAO().delete(1)
+            self.assertEqual(outer.connection.commits, 0)
+            conn = outer.connection
+        self.assertEqual(conn.commits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,16 @@
 """Django settings for smart_inventory web project."""
 
 import os
+import sys
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Make the shared domain package (core/) importable from the web app.
+PROJECT_ROOT = BASE_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
 SECRET_KEY = "django-insecure-s3cr3t-k3y-ch4ng3-in-pr0duct10n"
 
 DEBUG = True
@@ -22,6 +28,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its "total" timing covers the rest of the stack.
+    "inventory.instrumentation.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -35,7 +43,8 @@ ROOT_URLCONF = "django_project.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # DjangoTemplates, plus render times for RequestMetricsMiddleware.
+        "BACKEND": "inventory.instrumentation.TimedDjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -109,5 +118,18 @@ LOGGING = {
             "handlers": ["console", "file"],
             "level": "DEBUG",
         },
+        # One key=value line per request (RequestMetricsMiddleware), to
+        # the console unless INVENTORY_REQUEST_LOG names a file.
+        "inventory.requests": {
+            "handlers": ["requests"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }
+
+REQUEST_LOG = os.environ.get("INVENTORY_REQUEST_LOG")
+if REQUEST_LOG:
+    LOGGING["handlers"]["requests"] = {"class": "logging.FileHandler", "filename": REQUEST_LOG}
+else:
+    LOGGING["handlers"]["requests"] = {"class": "logging.StreamHandler"}
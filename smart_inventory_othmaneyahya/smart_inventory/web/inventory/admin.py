@@ -44,9 +44,15 @@ class CustomerAdmin(admin.ModelAdmin):
 class OrderAdmin(admin.ModelAdmin):
     list_display = ("id", "customer", "order_date", "total")
     list_filter = ("order_date",)
+    list_select_related = ("customer",)
     search_fields = ("customer__name",)
     inlines = [OrderItemInline]
 
+    def get_queryset(self, request):
+        # Totals come from one aggregate query instead of one per row.
+        return super().get_queryset(request).with_totals()
+
     def total(self, obj):
         return f"${obj.calculate_total():.2f}"
     total.short_description = "Total"
+    total.admin_order_field = "total"
@@ -7,3 +7,6 @@ class InventoryConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "inventory"
     verbose_name = "Smart Inventory"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401  (connects the metrics receivers)
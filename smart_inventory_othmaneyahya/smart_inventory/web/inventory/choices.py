@@ -0,0 +1,117 @@
+"""Cached ``<select>`` choices and server-side search for products and customers.
+
+The order form used to query (and render) every product once per item
+row.  :func:`get_choices` instead serves ``(pk, label)`` lists from
+Django's cache, memoised per process and validated against a version
+key, so a page render costs at most one query per list however many
+rows it has.  Saves and deletes bump the version (see
+``inventory.signals``).
+
+Above :data:`INLINE_LIMIT` entries the selects render only the chosen
+option and the page searches :func:`search` through the typeahead
+endpoint instead of embedding the whole catalog.
+"""
+
+import uuid
+from typing import Dict, List, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Customer, Product
+
+CACHE_TIMEOUT = 600
+INLINE_LIMIT = 200
+SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 50
+
+Choice = Tuple[int, str]
+
+
+def _product_label(pk, name, price) -> str:
+    return f"{name} (${price})"  # same as str(Product)
+
+
+def _customer_label(pk, name, email) -> str:
+    return f"{name} <{email}>"  # same as str(Customer)
+
+
+# kind -> (model, label columns, label builder, searched columns)
+SOURCES = {
+    "products": (Product, ("pk", "name", "price"), _product_label, ("name", "category")),
+    "customers": (Customer, ("pk", "name", "email"), _customer_label, ("name", "email")),
+}
+
+_local: Dict[str, Tuple[str, List[Choice]]] = {}
+
+
+def _version_key(kind: str) -> str:
+    return f"inventory:choices:{kind}:version"
+
+
+def _current_version(kind: str) -> str:
+    version = cache.get(_version_key(kind))
+    if version is None:
+        cache.add(_version_key(kind), uuid.uuid4().hex, None)
+        version = cache.get(_version_key(kind))
+    return version
+
+
+def _load(kind: str) -> List[Choice]:
+    model, columns, label, _ = SOURCES[kind]
+    rows = model.objects.order_by("name", "pk").values_list(*columns)
+    return [(row[0], label(*row)) for row in rows]
+
+
+def get_choices(kind: str) -> List[Choice]:
+    """Return every ``(pk, label)`` pair for *kind*, ordered by name.
+
+    Raises:
+        KeyError: If *kind* is not ``"products"`` or ``"customers"``.
+    """
+    if kind not in SOURCES:
+        raise KeyError(kind)
+    version = _current_version(kind)
+    memo = _local.get(kind)
+    if memo is not None and memo[0] == version:
+        return memo[1]
+    data_key = f"inventory:choices:{kind}:{version}"
+    choices = cache.get(data_key)
+    if choices is None:
+        choices = _load(kind)
+        cache.set(data_key, choices, CACHE_TIMEOUT)
+    _local[kind] = (version, choices)
+    return choices
+
+
+def invalidate(kind: str) -> None:
+    """Make the next :func:`get_choices` call for *kind* reload."""
+    def bump() -> None:
+        cache.set(_version_key(kind), uuid.uuid4().hex, None)
+
+    # Bump now, and again after COMMIT in case another request cached the
+    # pre-commit rows in between.
+    bump()
+    transaction.on_commit(bump)
+
+
+def search(kind: str, term: str, limit: int = SEARCH_LIMIT) -> List[Dict[str, object]]:
+    """Return up to *limit* ``{"id", "text"}`` matches for *term*.
+
+    Raises:
+        KeyError: If *kind* is unknown.
+    """
+    model, columns, label, searched = SOURCES[kind]
+    limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+    qs = model.objects.order_by("name", "pk")
+    term = term.strip()
+    if term:
+        match = Q()
+        for column in searched:
+            match |= Q(**{f"{column}__icontains": term})
+        qs = qs.filter(match)
+    return [
+        {"id": row[0], "text": label(*row)}
+        for row in qs.values_list(*columns)[:limit]
+    ]
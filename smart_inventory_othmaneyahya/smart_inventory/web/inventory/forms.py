@@ -1,10 +1,14 @@
 """Django forms with custom validation and user-friendly error messages."""
 
 import re
+from typing import Dict, Optional
 
 from django import forms
 from django.core.exceptions import ValidationError
+from django.urls import reverse
+from django.utils.functional import cached_property
 
+from . import choices
 from .models import Product, Customer, Order, OrderItem
 
 
@@ -78,6 +82,62 @@ class CustomerForm(forms.ModelForm):
         return email
 
 
+# ── Cached choice fields ─────────────────────────────────────────────
+
+class CachedModelChoiceIterator(forms.models.ModelChoiceIterator):
+    """Yields ``(pk, label)`` from :func:`inventory.choices.get_choices`."""
+
+    @property
+    def kind(self) -> str:
+        return self.queryset.model._meta.db_table
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        yield from choices.get_choices(self.kind)
+
+    def __len__(self) -> int:
+        return len(choices.get_choices(self.kind)) + (self.field.empty_label is not None)
+
+    def __bool__(self) -> bool:
+        return self.field.empty_label is not None or bool(choices.get_choices(self.kind))
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    """ModelChoiceField whose options come from the shared choices cache."""
+
+    iterator = CachedModelChoiceIterator
+
+
+class TypeaheadSelect(forms.Select):
+    """Select that stops embedding every option once the list is large.
+
+    Past :data:`inventory.choices.INLINE_LIMIT` entries only the selected
+    option is rendered, plus a ``data-typeahead`` URL the page uses to
+    search the rest server-side.
+    """
+
+    def _is_large(self) -> bool:
+        kind = getattr(self.choices, "kind", None)
+        return kind is not None and len(choices.get_choices(kind)) > choices.INLINE_LIMIT
+
+    def get_context(self, name, value, attrs):
+        if self._is_large():
+            attrs = {**(attrs or {}), "data-typeahead": reverse("typeahead", args=[self.choices.kind])}
+        return super().get_context(name, value, attrs)
+
+    def optgroups(self, name, value, attrs=None):
+        if not self._is_large():
+            return super().optgroups(name, value, attrs)
+        selected = {str(v) for v in value if v not in (None, "")}
+        full = self.choices
+        self.choices = [c for c in full if c[0] == "" or str(c[0]) in selected]
+        try:
+            return super().optgroups(name, value, attrs)
+        finally:
+            self.choices = full
+
+
 # ── Order Form ───────────────────────────────────────────────────────
 
 class OrderForm(forms.ModelForm):
@@ -86,26 +146,65 @@ class OrderForm(forms.ModelForm):
     class Meta:
         model = Order
         fields = ["customer"]
+        field_classes = {"customer": CachedModelChoiceField}
         widgets = {
-            "customer": forms.Select(attrs={"class": "form-select"}),
+            "customer": TypeaheadSelect(attrs={"class": "form-select"}),
         }
 
 
 # ── OrderItem Inline Formset ─────────────────────────────────────────
 
+class ProductSnapshotChoiceField(CachedModelChoiceField):
+    """ModelChoiceField that resolves ids from a preloaded ``{pk: Product}``.
+
+    Without a snapshot it falls back to one query per value, like the
+    stock field.
+    """
+
+    snapshot: Optional[Dict[int, Product]] = None
+
+    def to_python(self, value):
+        if self.snapshot is None or value in self.empty_values:
+            return super().to_python(value)
+        try:
+            product = self.snapshot.get(int(value))
+        except (TypeError, ValueError):
+            product = None
+        if product is None:
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+        return product
+
+
 class OrderItemForm(forms.ModelForm):
     """Form for a single line item."""
 
     class Meta:
         model = OrderItem
         fields = ["product", "quantity"]
+        field_classes = {"product": ProductSnapshotChoiceField}
         widgets = {
-            "product": forms.Select(attrs={"class": "form-select"}),
+            "product": TypeaheadSelect(attrs={"class": "form-select"}),
             "quantity": forms.NumberInput(attrs={
                 "class": "form-control", "min": "1",
             }),
         }
 
+    def __init__(self, *args, products: Optional[Dict[int, Product]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["product"].snapshot = products
+
+    def _get_validation_exclusions(self):
+        exclude = super()._get_validation_exclusions()
+        if self.fields["product"].snapshot is not None:
+            # The snapshot already proves the product exists; skip the
+            # model-level ForeignKey check (one EXISTS query per row).
+            exclude.add("product")
+        return exclude
+
     def clean_quantity(self) -> int:
         qty = self.cleaned_data.get("quantity")
         if qty is not None and qty <= 0:
@@ -125,10 +224,53 @@ class OrderItemForm(forms.ModelForm):
         return cleaned
 
 
+class BaseOrderItemFormSet(forms.BaseInlineFormSet):
+    """Loads every submitted product with one ``IN`` query.
+
+    The rows then validate against that snapshot instead of each running
+    its own lookup; the final say on stock is
+    :func:`inventory.stock.reserve_stock`.
+    """
+
+    @cached_property
+    def products(self) -> Dict[int, Product]:
+        pks = set()
+        for i in range(self.total_form_count()):
+            value = self.data.get(f"{self.add_prefix(i)}-product")
+            if value and str(value).isdigit():
+                pks.add(int(value))
+        return Product.objects.in_bulk(pks) if pks else {}
+
+    def get_form_kwargs(self, index):
+        kwargs = super().get_form_kwargs(index)
+        if self.is_bound and index is not None:
+            kwargs["products"] = self.products
+        return kwargs
+
+    def clean(self) -> None:
+        super().clean()
+        # Rows for the same product must fit the stock together.
+        wanted: Dict[Product, int] = {}
+        for form in self.forms:
+            if not hasattr(form, "cleaned_data") or self._should_delete_form(form):
+                continue
+            product = form.cleaned_data.get("product")
+            quantity = form.cleaned_data.get("quantity")
+            if product and quantity:
+                wanted[product] = wanted.get(product, 0) + quantity
+        for product, quantity in wanted.items():
+            if quantity > product.quantity_in_stock:
+                raise ValidationError(
+                    f"Not enough stock for {product.name}. "
+                    f"Available: {product.quantity_in_stock}, requested: {quantity}."
+                )
+
+
 OrderItemFormSet = forms.inlineformset_factory(
     Order,
     OrderItem,
     form=OrderItemForm,
+    formset=BaseOrderItemFormSet,
     extra=3,
     can_delete=True,
     min_num=1,
@@ -0,0 +1,250 @@
+"""Per-request SQL, view and template timings.
+
+:class:`RequestMetricsMiddleware` times every request and, through
+``connection.execute_wrapper``, every SQL statement it runs; the
+:class:`TimedDjangoTemplates` backend adds template render time.  Each
+request then
+
+* gets a ``Server-Timing`` header (shown in the browser's network tab),
+* is logged as one ``key=value`` line on the ``inventory.requests``
+  logger, and
+* is added to a rolling window per endpoint (``"GET order_list"``), from
+  which :func:`snapshot` computes percentiles for the stats endpoint.
+
+The windows live in process memory: each worker process reports its
+own traffic, and a restart starts from scratch.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.db import connections
+from django.template.backends.django import DjangoTemplates
+
+logger = logging.getLogger("inventory.requests")
+
+WINDOW = 500                 # requests kept per endpoint
+PERCENTILES = (50, 90, 99)
+UNRESOLVED = "<unresolved>"  # 404s share one bucket instead of one per path
+
+
+@dataclass
+class RequestMetrics:
+    """Timings collected while one request is being served (milliseconds)."""
+
+    queries: int = 0
+    sql_ms: float = 0.0
+    render_ms: float = 0.0
+    view_ms: float = 0.0
+    total_ms: float = 0.0
+    _view_started: Optional[float] = None
+    _rendering: int = 0
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.sql_ms:.1f};desc="{self.queries} queries", '
+            f"tpl;dur={self.render_ms:.1f}, view;dur={self.view_ms:.1f}, "
+            f"total;dur={self.total_ms:.1f}"
+        )
+
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar("inventory_request_metrics", default=None)
+
+
+def current() -> Optional[RequestMetrics]:
+    """The metrics of the request being served, if any."""
+    return _current.get()
+
+
+def _wrap_connections() -> ExitStack:
+    """Install :func:`_time_sql` on this thread's connections until closed."""
+    stack = ExitStack()
+    for conn in connections.all():
+        stack.enter_context(conn.execute_wrapper(_time_sql))
+    return stack
+
+
+def _time_sql(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.sql_ms += (time.perf_counter() - start) * 1000
+        metrics.queries += 1
+
+
+# ── Rolling per-endpoint windows ─────────────────────────────────────
+
+class EndpointStats:
+    """The last :data:`WINDOW` requests of every endpoint."""
+
+    FIELDS = ("total_ms", "view_ms", "sql_ms", "render_ms", "queries")
+
+    def __init__(self, window: int = WINDOW) -> None:
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[tuple]] = {}
+        self._counts: Dict[str, int] = {}
+
+    def record(self, endpoint: str, metrics: RequestMetrics) -> None:
+        sample = tuple(getattr(metrics, name) for name in self.FIELDS)
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(sample)
+            self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Percentiles per endpoint, slowest p90 first."""
+        with self._lock:
+            windows = {endpoint: list(samples) for endpoint, samples in self._samples.items()}
+            counts = dict(self._counts)
+        rows = []
+        for endpoint, samples in windows.items():
+            row: Dict[str, Any] = {"endpoint": endpoint, "count": counts[endpoint], "window": len(samples)}
+            for i, name in enumerate(self.FIELDS):
+                row[name] = _summary(sorted(sample[i] for sample in samples))
+            rows.append(row)
+        rows.sort(key=lambda row: row["total_ms"]["p90"], reverse=True)
+        return rows
+
+
+def _percentile(ordered: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of the sorted, non-empty *ordered*."""
+    rank = max(math.ceil(pct * len(ordered) / 100), 1)
+    return ordered[rank - 1]
+
+
+def _summary(ordered: Sequence[float]) -> Dict[str, float]:
+    summary = {f"p{pct}": round(_percentile(ordered, pct), 2) for pct in PERCENTILES}
+    summary["max"] = round(ordered[-1], 2)
+    return summary
+
+
+stats = EndpointStats()
+
+
+def snapshot() -> List[Dict[str, Any]]:
+    return stats.snapshot()
+
+
+# ── Middleware ───────────────────────────────────────────────────────
+
+class RequestMetricsMiddleware:
+    """Time requests, their SQL and their templates; see the module docstring.
+
+    Put it first in ``MIDDLEWARE`` so that ``total`` covers the rest of
+    the stack.  It runs natively under both WSGI and ASGI; under ASGI the
+    SQL wrappers are installed on the request's thread-sensitive worker
+    thread, where the async ORM runs its queries.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            with _wrap_connections():
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics, start)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            stack = await sync_to_async(_wrap_connections)()
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(stack.close)()
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics, start)
+
+    def _finish(self, request, response, metrics: RequestMetrics, start: float):
+        end = time.perf_counter()
+        metrics.total_ms = (end - start) * 1000
+        if metrics._view_started is not None:
+            metrics.view_ms = (end - metrics._view_started) * 1000
+
+        match = getattr(request, "resolver_match", None)
+        endpoint = f"{request.method} {match.view_name if match else UNRESOLVED}"
+        stats.record(endpoint, metrics)
+        response["Server-Timing"] = metrics.server_timing()
+        logger.info(
+            "endpoint=%s path=%s status=%s queries=%d sql_ms=%.1f render_ms=%.1f view_ms=%.1f total_ms=%.1f",
+            endpoint.replace(" ", ":"), request.path, response.status_code, metrics.queries,
+            metrics.sql_ms, metrics.render_ms, metrics.view_ms, metrics.total_ms,
+        )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = _current.get()
+        if metrics is not None:
+            metrics._view_started = time.perf_counter()
+        return None
+
+
+# ── Template render time ─────────────────────────────────────────────
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """The Django template backend, with render time added to the
+    current request's :class:`RequestMetrics`."""
+
+    def from_string(self, template_code):
+        return _TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return _TimedTemplate(super().get_template(template_name))
+
+
+class _TimedTemplate:
+    def __init__(self, template) -> None:
+        self._template = template
+
+    def __getattr__(self, name):
+        return getattr(self._template, name)
+
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return self._template.render(context, request)
+        # Only the outermost render counts (templates rendered from tags).
+        metrics._rendering += 1
+        start = time.perf_counter()
+        try:
+            return self._template.render(context, request)
+        finally:
+            metrics._rendering -= 1
+            if not metrics._rendering:
+                metrics.render_ms += (time.perf_counter() - start) * 1000
@@ -0,0 +1,22 @@
+"""Recompute the dashboard summary tables from scratch.
+
+Run it after bulk imports or raw SQL that bypassed the ORM signals:
+
+    python manage.py rebuild_dashboard_metrics
+"""
+
+from django.core.management.base import BaseCommand
+
+from inventory import metrics
+
+
+class Command(BaseCommand):
+    help = "Recompute dashboard metrics and per-product sales from the source tables."
+
+    def handle(self, *args, **options):
+        row = metrics.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt metrics: {row.product_count} products, "
+            f"{row.customer_count} customers, {row.order_count} orders, "
+            f"revenue {row.total_revenue}, stock value {row.total_stock_value}"
+        ))
@@ -0,0 +1,175 @@
+"""Incrementally maintained dashboard metrics.
+
+Writes apply small deltas to the one-row :class:`DashboardMetrics` table
+and the per-product :class:`ProductSales` table (the receivers in
+``inventory.signals`` do this for ordinary ORM saves and deletes; bulk
+code paths call :func:`record_items` / :func:`adjust` directly).  Reads
+go through :func:`get_dashboard_metrics`, which is served from Django's
+cache and otherwise costs two small queries, regardless of table sizes.
+
+``python manage.py rebuild_dashboard_metrics`` recomputes everything
+from scratch.
+"""
+
+import logging
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Dict, Iterable
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Case, F, IntegerField, Sum, Value, When
+
+from .models import Customer, DashboardMetrics, Order, OrderItem, Product, ProductSales
+
+logger = logging.getLogger("inventory")
+
+CACHE_KEY = "inventory:dashboard_metrics"
+CACHE_TIMEOUT = 300
+TOP_PRODUCTS = 5
+
+
+def _invalidate_cache() -> None:
+    # Drop now, and again after COMMIT in case another request re-cached
+    # the pre-commit values in between.
+    cache.delete(CACHE_KEY)
+    transaction.on_commit(lambda: cache.delete(CACHE_KEY))
+
+
+# ── Writers ──────────────────────────────────────────────────────────
+
+def adjust(**deltas: Any) -> None:
+    """Atomically add *deltas* to the summary row.
+
+    Example: ``adjust(order_count=1, total_revenue=Decimal("9.99"))``.
+    """
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    updated = DashboardMetrics.objects.filter(pk=1).update(
+        **{name: F(name) + delta for name, delta in deltas.items()}
+    )
+    if not updated:
+        # No summary row yet: build it from the tables (which already
+        # include the change being recorded).
+        rebuild()
+        return
+    _invalidate_cache()
+
+
+def add_units_sold(product_id: int, units: int) -> None:
+    """Add *units* (may be negative) to a product's units-sold counter."""
+    if not units:
+        return
+    qs = ProductSales.objects.filter(product_id=product_id)
+    if not qs.update(units_sold=F("units_sold") + units):
+        _, created = ProductSales.objects.get_or_create(
+            product_id=product_id, defaults={"units_sold": units}
+        )
+        if not created:
+            qs.update(units_sold=F("units_sold") + units)
+    _invalidate_cache()
+
+
+def add_units_sold_many(units: Dict[int, int]) -> None:
+    """Apply several units-sold deltas (``{product_id: units}``) at once.
+
+    Costs a fixed handful of queries however many products are involved.
+    """
+    units = {pk: qty for pk, qty in units.items() if qty}
+    if not units:
+        return
+    existing = set(
+        ProductSales.objects.filter(product_id__in=units).values_list("product_id", flat=True)
+    )
+    if existing:
+        ProductSales.objects.filter(product_id__in=existing).update(
+            units_sold=F("units_sold") + Case(
+                *(When(product_id=pk, then=Value(units[pk])) for pk in existing),
+                output_field=IntegerField(),
+            )
+        )
+    missing = [pk for pk in units if pk not in existing]
+    if missing:
+        try:
+            with transaction.atomic():
+                ProductSales.objects.bulk_create(
+                    ProductSales(product_id=pk, units_sold=units[pk]) for pk in missing
+                )
+        except IntegrityError:
+            # A concurrent writer created some of the rows first.
+            for pk in missing:
+                add_units_sold(pk, units[pk])
+    _invalidate_cache()
+
+
+def record_items(items: Iterable[OrderItem], sign: int = 1) -> None:
+    """Record many new (``sign=1``) or removed (``sign=-1``) order items.
+
+    Meant for bulk code paths that bypass model signals; the number of
+    queries does not grow with the number of items.
+    """
+    revenue = Decimal("0")
+    units: Dict[int, int] = defaultdict(int)
+    for item in items:
+        revenue += Decimal(str(item.unit_price)) * item.quantity
+        units[item.product_id] += sign * item.quantity
+    adjust(total_revenue=sign * revenue)
+    add_units_sold_many(units)
+
+
+def rebuild() -> DashboardMetrics:
+    """Recompute every metric from the source tables."""
+    with transaction.atomic():
+        stock_value = Product.objects.aggregate(
+            total=Sum(F("price") * F("quantity_in_stock"))
+        )["total"] or 0
+        revenue = OrderItem.objects.aggregate(
+            total=Sum(F("unit_price") * F("quantity"))
+        )["total"] or 0
+        row, _ = DashboardMetrics.objects.update_or_create(
+            pk=1,
+            defaults={
+                "product_count": Product.objects.count(),
+                "customer_count": Customer.objects.count(),
+                "order_count": Order.objects.count(),
+                "total_revenue": revenue,
+                "total_stock_value": stock_value,
+            },
+        )
+        ProductSales.objects.all().delete()
+        ProductSales.objects.bulk_create(
+            ProductSales(product_id=r["product"], units_sold=r["units"])
+            for r in OrderItem.objects.values("product").annotate(units=Sum("quantity"))
+        )
+    _invalidate_cache()
+    logger.info("Dashboard metrics rebuilt")
+    return row
+
+
+# ── Reader ───────────────────────────────────────────────────────────
+
+def get_dashboard_metrics() -> Dict[str, Any]:
+    """Return the dashboard KPIs and best sellers (cached)."""
+    data = cache.get(CACHE_KEY)
+    if data is not None:
+        return data
+
+    row = DashboardMetrics.objects.filter(pk=1).first() or rebuild()
+    top_products = list(
+        ProductSales.objects
+        .filter(units_sold__gt=0)
+        .order_by("-units_sold")
+        .values("product__name", total_sold=F("units_sold"))[:TOP_PRODUCTS]
+    )
+    data = {
+        "total_products": row.product_count,
+        "total_customers": row.customer_count,
+        "total_orders": row.order_count,
+        "total_revenue": row.total_revenue,
+        "total_stock_value": row.total_stock_value,
+        "top_products": top_products,
+    }
+    cache.set(CACHE_KEY, data, CACHE_TIMEOUT)
+    return data
+
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F, Sum
+
+
+def populate(apps, schema_editor):
+    """Seed the summary tables from the existing rows."""
+    Product = apps.get_model('inventory', 'Product')
+    Customer = apps.get_model('inventory', 'Customer')
+    Order = apps.get_model('inventory', 'Order')
+    OrderItem = apps.get_model('inventory', 'OrderItem')
+    DashboardMetrics = apps.get_model('inventory', 'DashboardMetrics')
+    ProductSales = apps.get_model('inventory', 'ProductSales')
+
+    DashboardMetrics.objects.create(
+        pk=1,
+        product_count=Product.objects.count(),
+        customer_count=Customer.objects.count(),
+        order_count=Order.objects.count(),
+        total_revenue=OrderItem.objects.aggregate(
+            total=Sum(F('unit_price') * F('quantity')))['total'] or 0,
+        total_stock_value=Product.objects.aggregate(
+            total=Sum(F('price') * F('quantity_in_stock')))['total'] or 0,
+    )
+    ProductSales.objects.bulk_create(
+        ProductSales(product_id=row['product'], units_sold=row['units'])
+        for row in OrderItem.objects.values('product').annotate(units=Sum('quantity'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardMetrics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('product_count', models.IntegerField(default=0)),
+                ('customer_count', models.IntegerField(default=0)),
+                ('order_count', models.IntegerField(default=0)),
+                ('total_revenue', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('total_stock_value', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'dashboard metrics',
+                'db_table': 'dashboard_metrics',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductSales',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sales', serialize=False, to='inventory.product')),
+                ('units_sold', models.IntegerField(db_index=True, default=0)),
+            ],
+            options={
+                'db_table': 'product_sales',
+            },
+        ),
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -4,13 +4,169 @@ These models mirror the core domain objects (Product, Customer, Order,
 OrderItem) while leveraging Django's ORM for database operations.
 """
 
-from django.db import models
+import threading
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.db import models, router, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from django.core.validators import MinValueValidator, EmailValidator
+from django.dispatch import Signal
+
+#: Sent once per collected ``delete()`` call, inside its transaction, with
+#: ``deleted``: the ``(model, instance)`` pairs its cascade removed.
+deletes_collected = Signal()
+
+_collector = threading.local()
+
+
+def locked_row(instance, fields, update_fields=None):
+    """Return the stored values of *fields* for *instance*, read under a row lock.
+
+    Meant to be called inside the transaction that saves or deletes
+    *instance*, so that the metrics receivers (``inventory.signals``)
+    see the row as it is now, not as it was when the instance was
+    loaded.  Returns None for new instances and for saves whose
+    *update_fields* do not include any of *fields*.
+    """
+    if instance._state.adding or instance.pk is None:
+        return None
+    if update_fields is not None:
+        names = set(fields) | {name[:-3] for name in fields if name.endswith("_id")}
+        if not names & set(update_fields):
+            return None
+    db = instance._state.db or router.db_for_write(type(instance), instance=instance)
+    return (
+        type(instance)._base_manager.using(db).select_for_update()
+        .filter(pk=instance.pk).values_list(*fields).first()
+    )
+
+
+class LockedSaveMixin:
+    """Saves that change :attr:`METRIC_FIELDS` first lock the stored row.
+
+    Such saves run in a transaction that reads the row with
+    :func:`locked_row` and leaves its values on the instance as
+    ``_stored_row`` for the ``post_save`` receivers.  Saves that leave
+    the metric fields as they were loaded (an admin renaming a product,
+    say) skip the lock and write every other field instead, so they
+    cannot put back stale stock or prices either.  Fixtures go through
+    ``save_base(raw=True)`` and never reach :meth:`save`.
+    """
+
+    METRIC_FIELDS: tuple = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_metrics = {
+            name: value for name, value in zip(field_names, values) if name in cls.METRIC_FIELDS
+        }
+        return instance
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        self._stored_row = None
+        if self._state.adding:
+            super().save(*args, **kwargs)
+        elif args or self._changed_metrics(update_fields):
+            using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+            with transaction.atomic(using=using):
+                self._stored_row = locked_row(self, self.METRIC_FIELDS, update_fields)
+                super().save(*args, **kwargs)
+        else:
+            kwargs["update_fields"] = [
+                name for name in self._written_fields(update_fields)
+                if name not in self._metric_names()
+            ]
+            super().save(**kwargs)
+            return
+        loaded = getattr(self, "_loaded_metrics", {})
+        written = self._written_fields(update_fields)
+        self._loaded_metrics = {
+            **loaded,
+            **{name: getattr(self, name) for name in self.METRIC_FIELDS if name in written},
+        }
+
+    def _metric_names(self) -> set:
+        """:attr:`METRIC_FIELDS`, also under their field names (``product`` for ``product_id``)."""
+        return set(self.METRIC_FIELDS) | {name[:-3] for name in self.METRIC_FIELDS if name.endswith("_id")}
+
+    def _written_fields(self, update_fields) -> set:
+        """Attribute names a save with *update_fields* writes."""
+        if update_fields is not None:
+            return {
+                name for field in self._meta.concrete_fields
+                for name in (field.name, field.attname)
+                if field.name in update_fields or field.attname in update_fields
+            }
+        deferred = self.get_deferred_fields()
+        return {
+            field.attname for field in self._meta.concrete_fields
+            if not field.primary_key and field.attname not in deferred
+        }
+
+    def _changed_metrics(self, update_fields) -> bool:
+        """Whether the save writes a metric field that differs from its loaded value."""
+        loaded = getattr(self, "_loaded_metrics", {})
+        written = self._written_fields(update_fields)
+        return any(
+            name not in loaded or getattr(self, name) != loaded[name]
+            for name in self.METRIC_FIELDS if name in written
+        )
+
+
+def collected_deletes():
+    """The list the current collected ``delete()`` call fills, or None."""
+    return getattr(_collector, "deleted", None)
+
+
+@contextmanager
+def collecting_deletes(using):
+    """Collect the instances removed inside the block into one batch.
+
+    ``post_delete`` receivers append to :func:`collected_deletes`; when
+    the block finishes, :data:`deletes_collected` is sent with the whole
+    batch, still inside the delete's transaction.  The list is cleared
+    however the block exits, and a nested block joins the outer batch.
+    """
+    if collected_deletes() is not None:
+        yield
+        return
+    deleted = _collector.deleted = []
+    try:
+        with transaction.atomic(using=using):
+            yield
+            deletes_collected.send(sender=None, deleted=deleted)
+    finally:
+        _collector.deleted = None
+
+
+class CollectedDeleteQuerySet(models.QuerySet):
+    """Queryset whose :meth:`delete` runs in :func:`collecting_deletes`."""
+
+    def delete(self):
+        with collecting_deletes(self.db):
+            return super().delete()
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+class CollectedDeleteMixin:
+    """Model whose :meth:`delete` runs in :func:`collecting_deletes`."""
+
+    def delete(self, using=None, keep_parents=False):
+        with collecting_deletes(using or router.db_for_write(type(self), instance=self)):
+            return super().delete(using=using, keep_parents=keep_parents)
 
 
-class Product(models.Model):
+class Product(LockedSaveMixin, models.Model):
     """A product in the inventory."""
 
+    METRIC_FIELDS = ("price", "quantity_in_stock")
+
     name = models.CharField(max_length=200)
     category = models.CharField(max_length=100)
     price = models.DecimalField(
@@ -24,6 +180,11 @@ class Product(models.Model):
     class Meta:
         db_table = "products"
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["name"], name="products_name_idx"),
+            models.Index(fields=["category", "name"], name="products_category_name_idx"),
+            models.Index(fields=["quantity_in_stock"], name="products_stock_idx"),
+        ]
 
     def get_value_in_stock(self) -> float:
         """Return total monetary value of current stock."""
@@ -33,7 +194,7 @@ class Product(models.Model):
         return f"{self.name} (${self.price})"
 
 
-class Customer(models.Model):
+class Customer(CollectedDeleteMixin, models.Model):
     """A registered customer."""
 
     name = models.CharField(max_length=200)
@@ -41,6 +202,8 @@ class Customer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CollectedDeleteQuerySet.as_manager()
+
     class Meta:
         db_table = "customers"
         ordering = ["name"]
@@ -49,7 +212,32 @@ class Customer(models.Model):
         return f"{self.name} <{self.email}>"
 
 
-class Order(models.Model):
+class OrderQuerySet(CollectedDeleteQuerySet):
+    """Query helpers for :class:`Order`."""
+
+    def with_totals(self) -> "OrderQuerySet":
+        """Annotate each order with ``total`` and ``item_count`` in SQL.
+
+        Uses correlated subqueries (an index probe on ``order_items``
+        per order) rather than JOIN + GROUP BY, so a sorted, limited page
+        of orders can be read straight off ``orders_date_id_idx``.
+        """
+        items = OrderItem.objects.filter(order=OuterRef("pk")).order_by().values("order")
+        return self.annotate(
+            total=Coalesce(
+                Subquery(items.annotate(t=Sum(F("unit_price") * F("quantity"))).values("t")),
+                Value(Decimal("0")),
+                output_field=models.DecimalField(max_digits=14, decimal_places=2),
+            ),
+            item_count=Coalesce(
+                Subquery(items.annotate(n=Count("pk")).values("n")),
+                Value(0),
+                output_field=models.IntegerField(),
+            ),
+        )
+
+
+class Order(CollectedDeleteMixin, models.Model):
     """A customer order."""
 
     customer = models.ForeignKey(
@@ -58,21 +246,36 @@ class Order(models.Model):
     order_date = models.DateTimeField(auto_now_add=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = OrderQuerySet.as_manager()
+
     class Meta:
         db_table = "orders"
         ordering = ["-order_date"]
+        indexes = [
+            models.Index(fields=["order_date", "id"], name="orders_date_id_idx"),
+            models.Index(fields=["customer", "order_date"], name="orders_customer_date_idx"),
+        ]
 
     def calculate_total(self) -> float:
-        """Return the sum of all order-item subtotals."""
+        """Return the sum of all order-item subtotals.
+
+        Uses the ``total`` annotation from :meth:`OrderQuerySet.with_totals`
+        when present instead of loading the items.
+        """
+        total = getattr(self, "total", None)
+        if total is not None:
+            return float(total)
         return sum(item.get_subtotal() for item in self.items.all())
 
     def __str__(self) -> str:
         return f"Order #{self.pk} — {self.customer.name}"
 
 
-class OrderItem(models.Model):
+class OrderItem(CollectedDeleteMixin, LockedSaveMixin, models.Model):
     """A single line item inside an Order."""
 
+    METRIC_FIELDS = ("product_id", "quantity", "unit_price")
+
     order = models.ForeignKey(
         Order, on_delete=models.CASCADE, related_name="items"
     )
@@ -82,8 +285,17 @@ class OrderItem(models.Model):
     quantity = models.PositiveIntegerField(validators=[MinValueValidator(1)])
     unit_price = models.DecimalField(max_digits=10, decimal_places=2)
 
+    objects = CollectedDeleteQuerySet.as_manager()
+
     class Meta:
         db_table = "order_items"
+        indexes = [
+            # Covers per-product sales totals without touching the table.
+            models.Index(
+                fields=["product", "quantity", "unit_price"],
+                name="order_items_product_cover_idx",
+            ),
+        ]
 
     def get_subtotal(self) -> float:
         """Return quantity * unit_price."""
@@ -91,3 +303,42 @@ class OrderItem(models.Model):
 
     def __str__(self) -> str:
         return f"{self.quantity}x {self.product.name}"
+
+
+# ── Dashboard summary tables ─────────────────────────────────────────
+
+class DashboardMetrics(models.Model):
+    """Running business totals, kept up to date by ``inventory.metrics``.
+
+    A single row (pk=1) replaces the full-table aggregates the dashboard
+    used to run on every page load.
+    """
+
+    product_count = models.IntegerField(default=0)
+    customer_count = models.IntegerField(default=0)
+    order_count = models.IntegerField(default=0)
+    total_revenue = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    total_stock_value = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "dashboard_metrics"
+        verbose_name_plural = "dashboard metrics"
+
+    def __str__(self) -> str:
+        return f"Dashboard metrics @ {self.updated_at:%Y-%m-%d %H:%M}"
+
+
+class ProductSales(models.Model):
+    """Units sold per product, for the best-sellers panel."""
+
+    product = models.OneToOneField(
+        Product, on_delete=models.CASCADE, primary_key=True, related_name="sales"
+    )
+    units_sold = models.IntegerField(default=0, db_index=True)
+
+    class Meta:
+        db_table = "product_sales"
+
+    def __str__(self) -> str:
+        return f"{self.product.name}: {self.units_sold} sold"
@@ -0,0 +1,225 @@
+"""Keyset (cursor) pagination for the list views.
+
+Unlike OFFSET pagination, every page costs the same single indexed query
+no matter how deep the user pages: the ``?after=`` token carries the sort
+key of the last row shown and the next page starts right after it, and
+``?before=`` carries the first row's key and reads the previous page
+with the ordering reversed.  ``?start=`` only numbers the rows shown.
+"""
+
+import base64
+import json
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+from urllib.parse import urlencode
+
+from django.db.models import Q, QuerySet
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class KeysetPage:
+    """One page of results plus the tokens for its neighbours."""
+
+    items: List[Any]
+    page_size: int
+    default_size: int = DEFAULT_PAGE_SIZE
+    next_token: Optional[str] = None
+    prev_token: Optional[str] = None
+    is_first: bool = True
+    start: int = 1
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_token is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_token is not None
+
+    @property
+    def end(self) -> int:
+        """Number of the last row shown (``start`` counts from 1)."""
+        return self.start + len(self.items) - 1
+
+    def _query(self, **params: Any) -> str:
+        if self.page_size != self.default_size:
+            params["size"] = self.page_size
+        return urlencode(params)
+
+    @property
+    def next_query(self) -> str:
+        """Query string (without ``?``) for the next page."""
+        return self._query(after=self.next_token, start=self.end + 1)
+
+    @property
+    def prev_query(self) -> str:
+        """Query string (without ``?``) for the previous page."""
+        return self._query(before=self.prev_token, start=max(1, self.start - self.page_size))
+
+    @property
+    def first_query(self) -> str:
+        """Query string (without ``?``) for the first page."""
+        return self._query()
+
+
+@dataclass
+class _PageQuery:
+    """A page request parsed from the query string."""
+
+    queryset: QuerySet
+    ordering: Sequence[str]
+    size: int
+    default_size: int
+    values: Optional[List[Any]] = None   # decoded ?after= / ?before= token
+    backwards: bool = False              # ?before=: read in reverse
+    start: int = 1
+
+    def rows(self) -> QuerySet:
+        """The page's rows plus one (in reverse for ``?before=``)."""
+        ordering = [_reversed(name) for name in self.ordering] if self.backwards else self.ordering
+        qs = self.queryset.order_by(*ordering)
+        if self.values is not None:
+            qs = qs.filter(_after_filter(ordering, self.values))
+        return qs[: self.size + 1]
+
+    def short_of_start(self, rows: List[Any]) -> bool:
+        """Whether a ``?before=`` page ran into the first row short of a full page."""
+        return self.backwards and len(rows) < self.size
+
+    def first_page(self) -> "_PageQuery":
+        return replace(self, values=None, backwards=False, start=1)
+
+
+def _encode(values: Sequence[Any]) -> str:
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(token: str, ordering: Sequence[str], model) -> Optional[List[Any]]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(values, list) or len(values) != len(ordering):
+        return None
+    decoded = []
+    for name, value in zip(ordering, values):
+        model_field = model._meta.get_field(name.lstrip("-"))
+        try:
+            decoded.append(model_field.to_python(value))
+        except Exception:
+            return None
+    return decoded
+
+
+def _after_filter(ordering: Sequence[str], values: Sequence[Any]) -> Q:
+    """Build ``(a, b, …) > (x, y, …)`` honouring each field's direction."""
+    condition = Q()
+    for depth in range(len(ordering) - 1, -1, -1):
+        name = ordering[depth].lstrip("-")
+        op = "lt" if ordering[depth].startswith("-") else "gt"
+        step = Q(**{f"{name}__{op}": values[depth]})
+        if depth < len(ordering) - 1:
+            step |= Q(**{name: values[depth]}) & condition
+        condition = step
+    return condition
+
+
+def _reversed(name: str) -> str:
+    return name[1:] if name.startswith("-") else "-" + name
+
+
+def keyset_paginate(
+    request,
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    default_size: int = DEFAULT_PAGE_SIZE,
+    max_size: int = MAX_PAGE_SIZE,
+) -> KeysetPage:
+    """Return the page of *queryset* selected by ``?after=`` / ``?before=``
+    and ``?size=``.
+
+    Args:
+        request: The current request.
+        queryset: Rows to paginate (unordered; *ordering* is applied).
+        ordering: Unique sort key, e.g. ``("name", "id")`` or
+            ``("-order_date", "-id")``; the last field must be unique.
+        default_size: Page size when ``?size=`` is absent.
+        max_size: Upper bound for ``?size=``.
+    """
+    query = _page_query(request, queryset, ordering, default_size, max_size)
+    rows = list(query.rows())
+    if query.short_of_start(rows):
+        # Back at the start with a partial page: show the first page.
+        query = query.first_page()
+        rows = list(query.rows())
+    return _build_page(rows, query)
+
+
+async def akeyset_paginate(
+    request,
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    default_size: int = DEFAULT_PAGE_SIZE,
+    max_size: int = MAX_PAGE_SIZE,
+) -> KeysetPage:
+    """Async :func:`keyset_paginate` for async views (same arguments)."""
+    query = _page_query(request, queryset, ordering, default_size, max_size)
+    rows = [row async for row in query.rows()]
+    if query.short_of_start(rows):
+        query = query.first_page()
+        rows = [row async for row in query.rows()]
+    return _build_page(rows, query)
+
+
+def _int_param(request, name: str, default: int) -> int:
+    try:
+        return int(request.GET.get(name, default))
+    except ValueError:
+        return default
+
+
+def _page_query(
+    request, queryset: QuerySet, ordering: Sequence[str], default_size: int, max_size: int,
+) -> _PageQuery:
+    """Parse ``?size=``, ``?start=`` and the ``?after=`` / ``?before=`` token."""
+    size = max(1, min(_int_param(request, "size", default_size), max_size))
+    query = _PageQuery(queryset, ordering, size, default_size)
+    for param, backwards in (("after", False), ("before", True)):
+        token = request.GET.get(param)
+        values = _decode(token, ordering, queryset.model) if token else None
+        if values is not None:
+            return replace(
+                query, values=values, backwards=backwards,
+                start=max(1, _int_param(request, "start", 1)),
+            )
+    return query
+
+
+def _build_page(rows: List[Any], query: _PageQuery) -> KeysetPage:
+    """Turn up to ``size + 1`` fetched rows into a page and its tokens."""
+    more = len(rows) > query.size
+    rows = rows[: query.size]
+    if query.backwards:
+        rows.reverse()
+
+    def token(row: Any) -> str:
+        return _encode([getattr(row, f.lstrip("-")) for f in query.ordering])
+
+    has_next = query.backwards or more
+    has_prev = more if query.backwards else query.values is not None
+    return KeysetPage(
+        items=rows,
+        page_size=query.size,
+        default_size=query.default_size,
+        next_token=token(rows[-1]) if rows and has_next else None,
+        prev_token=token(rows[0]) if rows and has_prev else None,
+        is_first=query.values is None or (query.backwards and not more),
+        start=query.start,
+    )
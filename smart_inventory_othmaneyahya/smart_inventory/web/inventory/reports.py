@@ -0,0 +1,153 @@
+"""Sales reports for the web UI, aggregated in SQL.
+
+The same reports the analysis notebook shows (revenue per month, best
+sellers, stock by category, order value statistics and customer spend),
+each computed by a GROUP BY query so that only the result rows leave
+the database.  ``analytics.engine`` computes them from whole-table
+DataFrames, which suits offline and batch use but not a web request.
+
+The queries still scan ``order_items``, so the result is cached for
+:data:`CACHE_TIMEOUT` seconds rather than invalidated on every write
+like ``inventory.metrics``.
+"""
+
+from typing import Any, Dict, List
+
+from django.core.cache import cache
+from django.db.models import Avg, Count, DecimalField, F, Max, Min, Q, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth
+
+from .models import Customer, OrderItem, Product
+
+CACHE_KEY = "inventory:sales_reports"
+CACHE_TIMEOUT = 300
+TOP_N = 10
+
+MONEY = DecimalField(max_digits=14, decimal_places=2)
+
+
+def _line_total(prefix: str = "") -> Any:
+    return Sum(F(prefix + "unit_price") * F(prefix + "quantity"), output_field=MONEY)
+
+
+def _float(value: Any) -> float:
+    return float(value or 0)
+
+
+def monthly_revenue() -> List[Dict[str, Any]]:
+    rows = (
+        OrderItem.objects.order_by()
+        .annotate(month=TruncMonth("order__order_date"))
+        .values("month").annotate(total=_line_total()).order_by("month")
+    )
+    return [
+        {"year_month_str": row["month"].strftime("%Y-%m"), "total_revenue": _float(row["total"])}
+        for row in rows
+    ]
+
+
+def best_sellers(limit: int = TOP_N) -> List[Dict[str, Any]]:
+    rows = (
+        OrderItem.objects.order_by()
+        .values("product_id", "product__name")
+        .annotate(total_qty_sold=Sum("quantity"), total_revenue=_line_total())
+        .order_by("-total_qty_sold", "product_id")[:limit]
+    )
+    return [
+        {
+            "product_id": row["product_id"],
+            "name": row["product__name"],
+            "total_qty_sold": row["total_qty_sold"],
+            "total_revenue": _float(row["total_revenue"]),
+        }
+        for row in rows
+    ]
+
+
+def stock_by_category() -> List[Dict[str, Any]]:
+    rows = (
+        Product.objects.order_by().values("category")
+        .annotate(
+            num_products=Count("pk"),
+            total_stock_units=Sum("quantity_in_stock"),
+            total_stock_value=Sum(F("price") * F("quantity_in_stock"), output_field=MONEY),
+        )
+        .order_by("-total_stock_value", "category")
+    )
+    return [dict(row, total_stock_value=_float(row["total_stock_value"])) for row in rows]
+
+
+def order_value_stats() -> Dict[str, float]:
+    """``count``, ``mean``, ``median``, ``min`` and ``max`` order total.
+
+    Orders without items are left out.  The median is read with
+    ``ORDER BY ... LIMIT`` so only its one or two rows are fetched.
+    """
+    totals = OrderItem.objects.order_by().values("order_id").annotate(total=_line_total())
+    stats = totals.aggregate(
+        count=Count("order_id"), mean=Avg("total"), min=Min("total"), max=Max("total"),
+    )
+    count = stats["count"]
+    if not count:
+        return {"count": 0, "mean": 0.0, "median": 0.0, "min": 0.0, "max": 0.0}
+    start = (count - 1) // 2
+    middle = [row["total"] for row in totals.order_by("total")[start:count // 2 + 1]]
+    return {
+        "count": count,
+        "mean": _float(stats["mean"]),
+        "median": sum(_float(value) for value in middle) / len(middle),
+        "min": _float(stats["min"]),
+        "max": _float(stats["max"]),
+    }
+
+
+def top_customers(limit: int = TOP_N) -> List[Dict[str, Any]]:
+    """Biggest spenders first.
+
+    Orders without items count towards ``num_orders`` but not the
+    average, as in the notebook.
+    """
+    rows = (
+        Customer.objects.order_by()
+        .annotate(
+            num_orders=Count("orders", distinct=True),
+            priced_orders=Count("orders", filter=Q(orders__items__isnull=False), distinct=True),
+            total_spent=Coalesce(_line_total("orders__items__"), Value(0), output_field=MONEY),
+        )
+        .filter(num_orders__gt=0)
+        .order_by("-total_spent", "pk")
+        .values("pk", "name", "num_orders", "priced_orders", "total_spent")[:limit]
+    )
+    return [
+        {
+            "customer_id": row["pk"],
+            "name": row["name"],
+            "num_orders": row["num_orders"],
+            "total_spent": _float(row["total_spent"]),
+            "avg_order_value": (
+                _float(row["total_spent"]) / row["priced_orders"] if row["priced_orders"] else None
+            ),
+        }
+        for row in rows
+    ]
+
+
+def build_sales_reports() -> Dict[str, Any]:
+    """Compute every report as template-friendly lists of dicts."""
+    return {
+        "total_revenue": _float(OrderItem.objects.aggregate(total=_line_total())["total"]),
+        "monthly_revenue": monthly_revenue(),
+        "best_sellers": best_sellers(),
+        "stock_by_category": stock_by_category(),
+        "order_stats": order_value_stats(),
+        "top_customers": top_customers(),
+    }
+
+
+def get_sales_reports() -> Dict[str, Any]:
+    """Return :func:`build_sales_reports`, cached."""
+    reports = cache.get(CACHE_KEY)
+    if reports is None:
+        reports = build_sales_reports()
+        cache.set(CACHE_KEY, reports, CACHE_TIMEOUT)
+    return reports
@@ -0,0 +1,165 @@
+"""Signal receivers that keep the dashboard metrics and select choices current.
+
+Each save or delete turns into a small delta on the summary tables (see
+``inventory.metrics``).  Updates compare against the stored row, read
+under a row lock in the save's own transaction (``_stored_row``, see
+:class:`inventory.models.LockedSaveMixin`), so concurrent edits of the
+same product or line cannot apply deltas against stale values.
+
+Deletes are batched per ``delete()`` call (collected by
+:func:`inventory.models.collecting_deletes`): a customer or order deleted
+with all its orders and items costs a fixed number of metric queries,
+however many rows the cascade removes.
+
+Product and customer changes also invalidate the cached form choices
+(``inventory.choices``).
+
+Receivers are connected in :meth:`InventoryConfig.ready`.
+"""
+
+from decimal import Decimal
+from typing import Dict, List
+
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from . import choices, metrics
+from .models import (
+    Customer, Order, OrderItem, Product, collected_deletes, deletes_collected, locked_row,
+)
+
+
+def _value(price, quantity) -> Decimal:
+    return Decimal(str(price)) * quantity
+
+
+def _touches(update_fields, fields) -> bool:
+    if update_fields is None:
+        return True
+    return any(name in update_fields for name in fields)
+
+
+# ── Products ─────────────────────────────────────────────────────────
+
+@receiver(post_save, sender=Product)
+def product_saved(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw or not _touches(update_fields, Product.METRIC_FIELDS):
+        return
+    new_value = _value(instance.price, instance.quantity_in_stock)
+    if created:
+        metrics.adjust(product_count=1, total_stock_value=new_value)
+        return
+    before = getattr(instance, "_stored_row", None)
+    if before is not None:
+        metrics.adjust(total_stock_value=new_value - _value(*before))
+
+
+@receiver(pre_delete, sender=Product)
+def product_deleting(sender, instance, **kwargs):
+    # pre_delete runs inside the delete's transaction.
+    instance._stored_row = locked_row(instance, Product.METRIC_FIELDS)
+
+
+@receiver(post_delete, sender=Product)
+def product_deleted(sender, instance, **kwargs):
+    before = getattr(instance, "_stored_row", None) or (instance.price, instance.quantity_in_stock)
+    metrics.adjust(product_count=-1, total_stock_value=-_value(*before))
+
+
+# ── Customers and orders ─────────────────────────────────────────────
+
+@receiver(post_save, sender=Customer)
+def customer_saved(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        metrics.adjust(customer_count=1)
+
+
+@receiver(post_save, sender=Order)
+def order_saved(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        metrics.adjust(order_count=1)
+
+
+# ── Order items ──────────────────────────────────────────────────────
+
+@receiver(post_save, sender=OrderItem)
+def order_item_saved(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw or not _touches(update_fields, ("product", "product_id", "quantity", "unit_price")):
+        return
+    if created:
+        metrics.record_items([instance])
+        return
+    before = getattr(instance, "_stored_row", None)
+    if before is None:
+        return
+    product_id, quantity, unit_price = before
+    metrics.adjust(
+        total_revenue=_value(instance.unit_price, instance.quantity) - _value(unit_price, quantity)
+    )
+    metrics.add_units_sold_many(
+        _merge({product_id: -quantity}, {instance.product_id: instance.quantity})
+    )
+
+
+def _merge(*deltas: Dict[int, int]) -> Dict[int, int]:
+    merged: Dict[int, int] = {}
+    for delta in deltas:
+        for key, value in delta.items():
+            merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+# ── Batched deletes of customers, orders and items ───────────────────
+
+class _DeleteBatch:
+    """Metric changes of deleted customers, orders and items, applied together."""
+
+    def __init__(self, deleted) -> None:
+        self.items: List[OrderItem] = []
+        self.orders = 0
+        self.customers = 0
+        for sender, instance in deleted:
+            if sender is OrderItem:
+                self.items.append(instance)
+            elif sender is Order:
+                self.orders += 1
+            else:
+                self.customers += 1
+
+    def flush(self) -> None:
+        metrics.record_items(self.items, sign=-1)
+        metrics.adjust(order_count=-self.orders, customer_count=-self.customers)
+
+
+@receiver(post_delete, sender=Customer)
+@receiver(post_delete, sender=Order)
+@receiver(post_delete, sender=OrderItem)
+def batch_deleted(sender, instance, **kwargs):
+    deleted = collected_deletes()
+    if deleted is None:
+        # Cascade from a model outside the collector: record it on its own.
+        _DeleteBatch([(sender, instance)]).flush()
+    else:
+        deleted.append((sender, instance))
+
+
+@receiver(deletes_collected)
+def deletes_finished(sender, deleted, **kwargs):
+    if deleted:
+        _DeleteBatch(deleted).flush()
+
+
+# ── Select choices ───────────────────────────────────────────────────
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def product_choices_changed(sender, raw=False, update_fields=None, **kwargs):
+    if not raw and _touches(update_fields, ("name", "price")):
+        choices.invalidate("products")
+
+
+@receiver(post_save, sender=Customer)
+@receiver(post_delete, sender=Customer)
+def customer_choices_changed(sender, raw=False, **kwargs):
+    if not raw:
+        choices.invalidate("customers")
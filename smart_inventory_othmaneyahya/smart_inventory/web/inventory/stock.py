@@ -0,0 +1,91 @@
+"""Concurrency-safe stock reservation for order creation.
+
+Stock for a whole order is checked with one ``SELECT ... FOR UPDATE`` of
+the order's products and taken with a single conditional ``UPDATE``
+(``quantity_in_stock - CASE id ... END``, guarded by ``quantity_in_stock
+>= CASE id ... END``) instead of a read / subtract / ``save()`` round trip
+per line, so two checkouts racing for the last units can never both
+succeed.  The ORM counterpart of
+:meth:`database.dao.ProductDAO.reserve_stock`.
+"""
+
+from decimal import Decimal
+from typing import Dict, Iterable, Tuple
+
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+
+from core.exceptions import InvalidQuantityException, OutOfStockException
+
+from . import metrics
+from .models import Product
+
+
+def _per_product(amounts: Dict[int, int]) -> Case:
+    """``CASE id WHEN <pk> THEN <amount> ... END``."""
+    return Case(
+        *(When(pk=pk, then=Value(qty)) for pk, qty in amounts.items()),
+        output_field=IntegerField(),
+    )
+
+
+def reserve_stock(lines: Iterable[Tuple[Product, int]]) -> None:
+    """Atomically take stock for every ``(product, quantity)`` line.
+
+    Lines for the same product are merged.  The products' rows are
+    locked in primary-key order, so concurrent reservations cannot
+    deadlock, and the locked stock decides any shortage before a single
+    ``UPDATE`` takes every line.  Either every line is reserved or none
+    is; inside an ``atomic()`` block a failure leaves that block to be
+    rolled back.
+
+    Args:
+        lines: Pairs of (product, quantity); the product's ``price`` is
+            used to keep the dashboard stock value in step.
+
+    Raises:
+        InvalidQuantityException: If a quantity is not positive.
+        OutOfStockException: If a product is missing or short of stock.
+    """
+    wanted: Dict[int, int] = {}
+    prices: Dict[int, Decimal] = {}
+    for product, quantity in lines:
+        if quantity <= 0:
+            raise InvalidQuantityException(quantity=quantity)
+        wanted[product.pk] = wanted.get(product.pk, 0) + quantity
+        prices[product.pk] = product.price
+
+    if not wanted:
+        return
+    # No savepoint of its own: a shortage raises, and the enclosing
+    # transaction (the view's, or this one) rolls every line back.
+    with transaction.atomic(savepoint=False):
+        _check_stock(wanted)
+        updated = Product.objects.filter(
+            pk__in=wanted, quantity_in_stock__gte=_per_product(wanted)
+        ).update(
+            quantity_in_stock=F("quantity_in_stock") - _per_product(wanted),
+            updated_at=timezone.now(),
+        )
+        if updated != len(wanted):  # the rows are locked: cannot happen
+            raise OutOfStockException()
+        # QuerySet.update() bypasses the post_save metrics receivers.
+        metrics.adjust(total_stock_value=-sum(
+            Decimal(str(prices[pk])) * qty for pk, qty in wanted.items()
+        ))
+
+
+def _check_stock(wanted: Dict[int, int]) -> None:
+    """Lock the products' rows and raise for the first line they cannot cover."""
+    rows = {
+        pk: (name, available)
+        for pk, name, available in Product.objects.select_for_update()
+        .filter(pk__in=wanted).order_by("pk").values_list("pk", "name", "quantity_in_stock")
+    }
+    for pk in sorted(wanted):
+        name, available = rows.get(pk, (f"#{pk}", 0))
+        if available < wanted[pk]:
+            raise OutOfStockException(
+                product_name=name, requested=wanted[pk], available=available
+            )
@@ -0,0 +1,762 @@
+"""Tests for the inventory app views."""
+
+import logging
+import os
+from decimal import Decimal
+from typing import List
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import F, Sum
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from core.exceptions import OutOfStockException
+from analytics.engine import SalesAnalytics
+from inventory import choices, instrumentation, metrics, reports
+from inventory.models import DashboardMetrics, Product, ProductSales, Customer, Order, OrderItem, collected_deletes
+from inventory.stock import reserve_stock
+
+_request_log = logging.getLogger("inventory.requests")
+_request_log_handlers: List[logging.Handler] = []
+
+
+def setUpModule() -> None:
+    # Keep the request lines out of test output, whichever runner is
+    # used (assertLogs still sees them).
+    _request_log_handlers[:] = _request_log.handlers
+    _request_log.handlers = [logging.NullHandler()]
+
+
+def tearDownModule() -> None:
+    _request_log.handlers = _request_log_handlers[:]
+
+
+class PaginatedListViewTests(TestCase):
+    """product_list / customer_list / order_list page with ?after= / ?before= tokens."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.products = [
+            Product.objects.create(
+                name=f"Product {i % 4}", category="Test",
+                price=Decimal("2.50"), quantity_in_stock=100,
+            )
+            for i in range(7)
+        ]
+        cls.customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        for i in range(5):
+            Customer.objects.create(name=f"C{i}", email=f"c{i}@example.com")
+        for i in range(6):
+            order = Order.objects.create(customer=cls.customer)
+            for product in cls.products[: i + 1]:
+                OrderItem.objects.create(
+                    order=order, product=product, quantity=2, unit_price=product.price,
+                )
+
+    def walk(self, url_name: str, context_name: str, size: int):
+        """Follow next-page links and return every row seen."""
+        seen, query = [], f"size={size}"
+        while True:
+            response = self.client.get(f"{reverse(url_name)}?{query}")
+            self.assertEqual(response.status_code, 200)
+            rows = list(response.context[context_name])
+            self.assertLessEqual(len(rows), size)
+            seen.extend(rows)
+            page = response.context["page"]
+            if not page.has_next:
+                return seen
+            query = page.next_query
+
+    def test_product_pages_cover_all_rows_in_order(self) -> None:
+        rows = self.walk("product_list", "products", 3)
+        expected = list(Product.objects.order_by("name", "id"))
+        self.assertEqual(rows, expected)
+
+    def test_customer_pages_cover_all_rows(self) -> None:
+        rows = self.walk("customer_list", "customers", 4)
+        self.assertEqual(rows, list(Customer.objects.order_by("name", "id")))
+
+    def test_order_pages_have_sql_totals(self) -> None:
+        rows = self.walk("order_list", "orders", 4)
+        self.assertEqual(rows, list(Order.objects.order_by("-order_date", "-id")))
+        for order in rows:
+            self.assertEqual(order.item_count, order.items.count())
+            self.assertEqual(float(order.total), order.calculate_total())
+
+    def test_order_list_query_count_independent_of_items(self) -> None:
+        # One query for the page of orders, however many items they have.
+        with self.assertNumQueries(1):
+            self.client.get(reverse("order_list"))
+
+    def test_prev_links_walk_back_over_the_same_pages(self) -> None:
+        forward, query = [], "size=2"
+        while True:
+            page = self.client.get(f"{reverse('order_list')}?{query}").context["page"]
+            forward.append((page.start, page.items))
+            if not page.has_next:
+                break
+            query = page.next_query
+        backward = [forward[-1]]
+        while page.has_prev:
+            page = self.client.get(f"{reverse('order_list')}?{page.prev_query}").context["page"]
+            backward.append((page.start, page.items))
+        self.assertEqual(backward[::-1], forward)
+        self.assertTrue(page.is_first)
+        self.assertEqual([start for start, _ in forward], [1, 3, 5])
+
+    def test_prev_past_the_start_shows_the_first_page(self) -> None:
+        token = self.client.get(reverse("product_list") + "?size=1").context["page"].next_token
+        page = self.client.get(reverse("product_list") + "?size=3&after=" + token).context["page"]
+        self.assertEqual(page.start, 1)  # no ?start= given
+        response = self.client.get(f"{reverse('product_list')}?{page.prev_query}")
+        first = response.context["page"]
+        self.assertTrue(first.is_first)
+        self.assertEqual(first.items, list(Product.objects.order_by("name", "id")[:3]))
+        self.assertContains(response, "Showing 1&ndash;3")
+
+    def test_page_size_is_clamped(self) -> None:
+        response = self.client.get(reverse("product_list") + "?size=100000")
+        self.assertEqual(response.context["page"].page_size, 100)
+
+    def test_bad_token_falls_back_to_first_page(self) -> None:
+        response = self.client.get(reverse("product_list") + "?after=!!garbage")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["page"].is_first)
+
+
+class OrderTotalsTests(TestCase):
+    """Order.objects.with_totals() and its use in calculate_total / admin."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.customer = Customer.objects.create(name="Bob", email="bob@example.com")
+        cls.product = Product.objects.create(
+            name="Widget", category="Test", price=Decimal("3.00"), quantity_in_stock=50,
+        )
+        cls.empty = Order.objects.create(customer=cls.customer)
+        cls.full = cls.add_order(3)
+
+    @classmethod
+    def add_order(cls, n_items: int) -> Order:
+        order = Order.objects.create(customer=cls.customer)
+        for qty in range(1, n_items + 1):
+            OrderItem.objects.create(
+                order=order, product=cls.product, quantity=qty, unit_price=Decimal("1.50"),
+            )
+        return order
+
+    def test_with_totals_annotations(self) -> None:
+        orders = {o.pk: o for o in Order.objects.with_totals()}
+        self.assertEqual(orders[self.full.pk].total, Decimal("9.00"))
+        self.assertEqual(orders[self.full.pk].item_count, 3)
+        self.assertEqual(orders[self.empty.pk].total, Decimal("0"))
+        self.assertEqual(orders[self.empty.pk].item_count, 0)
+
+    def test_calculate_total_uses_annotation(self) -> None:
+        order = Order.objects.with_totals().get(pk=self.full.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(order.calculate_total(), 9.0)
+        plain = Order.objects.get(pk=self.full.pk)
+        self.assertEqual(plain.calculate_total(), 9.0)
+
+    def test_admin_changelist_queries_do_not_grow_with_orders(self) -> None:
+        admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(admin)
+        url = reverse("admin:inventory_order_changelist")
+
+        with CaptureQueriesContext(connection) as before:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        for n in range(1, 6):
+            self.add_order(n)
+        with CaptureQueriesContext(connection) as after:
+            response = self.client.get(url)
+        self.assertContains(response, "$9.00")
+        self.assertEqual(len(after), len(before))
+
+
+class DashboardMetricsTests(TestCase):
+    """Summary tables track the source tables through creates, edits and deletes."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        self.mouse = Product.objects.create(
+            name="Mouse", category="Accessories", price=Decimal("25.00"), quantity_in_stock=10,
+        )
+        self.cable = Product.objects.create(
+            name="Cable", category="Accessories", price=Decimal("5.00"), quantity_in_stock=40,
+        )
+        self.order = Order.objects.create(customer=self.customer)
+        self.line = OrderItem.objects.create(
+            order=self.order, product=self.mouse, quantity=3, unit_price=self.mouse.price,
+        )
+        OrderItem.objects.create(
+            order=self.order, product=self.cable, quantity=1, unit_price=self.cable.price,
+        )
+
+    def assertMetricsMatchAggregates(self) -> None:
+        data = metrics.get_dashboard_metrics()
+        self.assertEqual(data["total_products"], Product.objects.count())
+        self.assertEqual(data["total_customers"], Customer.objects.count())
+        self.assertEqual(data["total_orders"], Order.objects.count())
+        self.assertEqual(
+            data["total_stock_value"],
+            Product.objects.aggregate(t=Sum(F("price") * F("quantity_in_stock")))["t"] or 0,
+        )
+        self.assertEqual(
+            data["total_revenue"],
+            OrderItem.objects.aggregate(t=Sum(F("unit_price") * F("quantity")))["t"] or 0,
+        )
+        expected_top = list(
+            OrderItem.objects.values("product__name")
+            .annotate(total_sold=Sum("quantity")).order_by("-total_sold")
+        )
+        self.assertEqual(data["top_products"], expected_top)
+
+    def test_creates(self) -> None:
+        self.assertMetricsMatchAggregates()
+        self.assertEqual(metrics.get_dashboard_metrics()["total_revenue"], Decimal("80.00"))
+
+    def test_updates(self) -> None:
+        self.mouse.quantity_in_stock = 4
+        self.mouse.save()
+        self.mouse.price = Decimal("30.00")
+        self.mouse.save()
+        line = OrderItem.objects.get(pk=self.line.pk)
+        line.quantity = 5
+        line.product = self.cable
+        line.save()
+        self.assertMetricsMatchAggregates()
+
+    def test_update_of_deferred_instance(self) -> None:
+        cable = Product.objects.only("name").get(pk=self.cable.pk)
+        cable.price = Decimal("6.00")
+        cable.save()
+        self.assertMetricsMatchAggregates()
+
+    def test_updates_from_stale_instances(self) -> None:
+        # Both copies are loaded before either is saved; deltas come from
+        # the stored row, not from what each copy loaded.
+        first, second = Product.objects.get(pk=self.mouse.pk), Product.objects.get(pk=self.mouse.pk)
+        first.quantity_in_stock = 2
+        first.save()
+        second.price = Decimal("40.00")
+        second.save()
+        line_a, line_b = OrderItem.objects.get(pk=self.line.pk), OrderItem.objects.get(pk=self.line.pk)
+        line_a.quantity = 7
+        line_a.save()
+        line_b.product = self.cable
+        line_b.save()
+        self.assertMetricsMatchAggregates()
+
+    def test_save_without_metric_changes_skips_the_lock(self) -> None:
+        mouse = Product.objects.get(pk=self.mouse.pk)
+        Product.objects.filter(pk=self.mouse.pk).update(quantity_in_stock=2)
+        mouse.name = "Wireless mouse"
+        with CaptureQueriesContext(connection) as queries:
+            mouse.save()
+        self.assertEqual(len(queries), 1)  # the UPDATE, without a locking read
+        mouse.refresh_from_db()
+        self.assertEqual((mouse.name, mouse.quantity_in_stock), ("Wireless mouse", 2))
+
+    def test_failed_delete_leaves_no_batch_behind(self) -> None:
+        with mock.patch.object(metrics, "record_items", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.order.delete()
+        self.assertIsNone(collected_deletes())
+        self.customer.delete()
+        self.assertMetricsMatchAggregates()
+
+    def test_deletes_cascade(self) -> None:
+        self.order.delete()
+        self.cable.delete()
+        self.customer.delete()
+        self.assertMetricsMatchAggregates()
+        self.assertEqual(metrics.get_dashboard_metrics()["total_orders"], 0)
+
+    def test_cascade_metric_queries_do_not_grow_with_rows(self) -> None:
+        def delete_customer(orders: int) -> int:
+            customer = Customer.objects.create(name="Bob", email=f"bob{orders}@example.com")
+            for _ in range(orders):
+                order = Order.objects.create(customer=customer)
+                OrderItem.objects.create(order=order, product=self.mouse, quantity=1, unit_price=1)
+                OrderItem.objects.create(order=order, product=self.cable, quantity=2, unit_price=1)
+            with CaptureQueriesContext(connection) as queries:
+                customer.delete()
+            return len(queries)
+
+        self.assertEqual(delete_customer(1), delete_customer(5))
+        Order.objects.filter(customer=self.customer).delete()
+        self.assertMetricsMatchAggregates()
+
+    def test_cache_is_invalidated_after_commit(self) -> None:
+        metrics.get_dashboard_metrics()
+        with self.captureOnCommitCallbacks(execute=True):
+            Customer.objects.create(name="Bob", email="bob@example.com")
+        self.assertEqual(metrics.get_dashboard_metrics()["total_customers"], 2)
+
+    def test_rebuild_command_repairs_drift(self) -> None:
+        DashboardMetrics.objects.filter(pk=1).update(order_count=99, total_revenue=0)
+        Product.objects.filter(pk=self.mouse.pk).update(quantity_in_stock=0)
+        call_command("rebuild_dashboard_metrics", stdout=open(os.devnull, "w"))
+        self.assertMetricsMatchAggregates()
+
+    def test_dashboard_queries_do_not_scan_tables(self) -> None:
+        self.client.get(reverse("dashboard"))
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("dashboard"))
+        self.assertContains(response, "$80.00")
+
+
+def order_post_data(customer, lines):
+    """POST payload for order_create with one formset row per line."""
+    data = {
+        "customer": customer.pk,
+        "items-TOTAL_FORMS": len(lines),
+        "items-INITIAL_FORMS": 0,
+        "items-MIN_NUM_FORMS": 1,
+        "items-MAX_NUM_FORMS": 1000,
+    }
+    for i, (product, quantity) in enumerate(lines):
+        data[f"items-{i}-product"] = product.pk
+        data[f"items-{i}-quantity"] = quantity
+    return data
+
+
+class StockReservationTests(TestCase):
+    """order_create takes stock with conditional UPDATEs."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        self.mouse = Product.objects.create(
+            name="Mouse", category="Accessories", price=Decimal("25.00"), quantity_in_stock=5,
+        )
+        self.cable = Product.objects.create(
+            name="Cable", category="Accessories", price=Decimal("5.00"), quantity_in_stock=40,
+        )
+
+    def test_order_create_deducts_stock(self) -> None:
+        response = self.client.post(reverse("order_create"), order_post_data(
+            self.customer, [(self.mouse, 2), (self.cable, 4), (self.mouse, 1)],
+        ))
+        self.assertRedirects(response, reverse("order_list"))
+        self.mouse.refresh_from_db()
+        self.cable.refresh_from_db()
+        self.assertEqual(self.mouse.quantity_in_stock, 2)
+        self.assertEqual(self.cable.quantity_in_stock, 36)
+        self.assertEqual(
+            metrics.get_dashboard_metrics()["total_stock_value"], Decimal("230.00"),
+        )
+
+    def test_stale_snapshot_cannot_oversell(self) -> None:
+        stale = Product.objects.get(pk=self.mouse.pk)
+        reserve_stock([(self.mouse, 4)])  # another checkout wins the race
+        with self.assertRaises(OutOfStockException) as ctx:
+            with transaction.atomic():
+                reserve_stock([(self.cable, 1), (stale, 2)])
+        self.assertEqual(ctx.exception.available, 1)
+        self.cable.refresh_from_db()
+        self.assertEqual(self.cable.quantity_in_stock, 40)
+
+    def test_shortage_found_whatever_the_timestamps(self) -> None:
+        # Both rows carry the timestamp the reservation writes.
+        stamp = timezone.now()
+        Product.objects.update(updated_at=stamp)
+        with mock.patch("inventory.stock.timezone.now", return_value=stamp):
+            with self.assertRaises(OutOfStockException) as ctx:
+                with transaction.atomic():
+                    reserve_stock([(self.cable, 1), (self.mouse, 6)])
+        self.assertEqual((ctx.exception.product_name, ctx.exception.available), ("Mouse", 5))
+
+    def test_rows_for_one_product_are_validated_together(self) -> None:
+        # Each row fits the stock on its own; together they do not.
+        response = self.client.post(reverse("order_create"), order_post_data(
+            self.customer, [(self.cable, 1), (self.mouse, 3), (self.mouse, 3)],
+        ))
+        self.assertContains(response, "Available: 5, requested: 6.")
+        self.assertEqual(Order.objects.count(), 0)
+
+    def test_failed_reservation_rolls_back_order(self) -> None:
+        def concurrent_checkout_first(lines):
+            Product.objects.filter(pk=self.mouse.pk).update(quantity_in_stock=2)
+            return reserve_stock(lines)
+
+        with mock.patch("inventory.views.reserve_stock", concurrent_checkout_first):
+            response = self.client.post(reverse("order_create"), order_post_data(
+                self.customer, [(self.cable, 1), (self.mouse, 3)],
+            ))
+        self.assertContains(response, "requested 3, available 2")
+        self.assertEqual(Order.objects.count(), 0)
+        self.cable.refresh_from_db()
+        self.assertEqual(self.cable.quantity_in_stock, 40)
+
+
+class OrderCreateQueryCountTests(TestCase):
+    """order_create costs the same number of queries for any order size."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        self.products = [
+            Product.objects.create(
+                name=f"P{i}", category="Test", price=Decimal("1.50"), quantity_in_stock=1000,
+            )
+            for i in range(50)
+        ]
+
+    def post(self, n_lines: int):
+        lines = [(self.products[i % 50], 2) for i in range(n_lines)]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("order_create"), order_post_data(self.customer, lines),
+            )
+        self.assertRedirects(response, reverse("order_list"), fetch_redirect_response=False)
+        return len(queries)
+
+    def test_query_count_is_constant(self) -> None:
+        counts = {}
+        for n_lines in (1, 10, 100):
+            # Start each order from a clean per-product sales table so the
+            # same code path runs every time.
+            ProductSales.objects.all().delete()
+            counts[n_lines] = self.post(n_lines)
+        self.assertEqual(counts, {1: 16, 10: 16, 100: 16})
+
+        self.assertEqual(OrderItem.objects.count(), 111)
+        self.assertEqual(
+            Product.objects.get(name="P0").quantity_in_stock, 1000 - 2 * (1 + 1 + 2),
+        )
+        self.assertMetricsConsistent()
+
+    def assertMetricsConsistent(self) -> None:
+        data = metrics.get_dashboard_metrics()
+        self.assertEqual(
+            data["total_revenue"],
+            OrderItem.objects.aggregate(
+                t=Sum(F("unit_price") * F("quantity"))
+            )["t"].quantize(Decimal("0.01")),
+        )
+        self.assertEqual(
+            data["total_stock_value"],
+            Product.objects.aggregate(t=Sum(F("price") * F("quantity_in_stock")))["t"],
+        )
+
+
+class OrderFormChoicesTests(TestCase):
+    """Order form selects come from the shared choices cache."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        self.mouse = Product.objects.create(
+            name="Mouse", category="Accessories", price=Decimal("25.00"), quantity_in_stock=5,
+        )
+
+    def test_warm_render_runs_no_queries(self) -> None:
+        self.client.get(reverse("order_create"))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("order_create"))
+        self.assertContains(response, "Mouse ($25.00)", count=4)  # 1 + 3 extra rows
+        self.assertContains(response, "Alice &lt;alice@example.com&gt;", count=1)
+
+    def test_changes_invalidate_choices(self) -> None:
+        self.client.get(reverse("order_create"))
+        Product.objects.create(name="Cable", category="Accessories", price=Decimal("5.00"))
+        self.mouse.price = Decimal("20.00")
+        self.mouse.save()
+        self.customer.delete()
+        response = self.client.get(reverse("order_create"))
+        self.assertContains(response, "Cable ($5.00)")
+        self.assertContains(response, "Mouse ($20.00)")
+        self.assertNotContains(response, "Alice")
+
+    def test_large_lists_switch_to_typeahead(self) -> None:
+        with mock.patch.object(choices, "INLINE_LIMIT", 0):
+            response = self.client.get(reverse("order_create"))
+        self.assertNotContains(response, "Mouse ($25.00)")
+        self.assertContains(response, f'data-typeahead="{reverse("typeahead", args=["products"])}"')
+        self.assertContains(response, f'data-typeahead="{reverse("typeahead", args=["customers"])}"')
+
+    def test_typeahead_endpoint(self) -> None:
+        for i in range(30):
+            Product.objects.create(name=f"Keyboard {i:02}", category="Input", price=Decimal("9.99"))
+        url = reverse("typeahead", args=["products"])
+
+        results = self.client.get(url, {"q": "keyb", "limit": 5}).json()["results"]
+        self.assertEqual([r["text"] for r in results][:2], ["Keyboard 00 ($9.99)", "Keyboard 01 ($9.99)"])
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(self.client.get(url, {"q": "input", "limit": 999}).json()["results"]), 30)
+
+        results = self.client.get(reverse("typeahead", args=["customers"]), {"q": "alice@"}).json()
+        self.assertEqual(results["results"], [{"id": self.customer.pk, "text": "Alice <alice@example.com>"}])
+        self.assertEqual(self.client.get(reverse("typeahead", args=["orders"])).status_code, 404)
+
+
+class IndexUsageTests(TestCase):
+    """EXPLAIN the queries the dashboard and list views run."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        products = [
+            Product.objects.create(
+                name=f"P{i:02}", category="Test", price=Decimal("1.00"), quantity_in_stock=i,
+            )
+            for i in range(30)
+        ]
+        for i in range(30):
+            order = Order.objects.create(customer=customer)
+            OrderItem.objects.create(order=order, product=products[i], quantity=1, unit_price=1)
+
+    def explain(self, sql: str) -> str:
+        prefix = "EXPLAIN QUERY PLAN " if connection.vendor == "sqlite" else "EXPLAIN "
+        with connection.cursor() as cursor:
+            cursor.execute(prefix + sql)
+            return " ".join(str(col) for row in cursor.fetchall() for col in row)
+
+    def view_plans(self, url: str, table: str) -> List[str]:
+        """Plans of every SELECT ... FROM *table* the view at *url* runs."""
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        source = f"FROM {connection.ops.quote_name(table)}"
+        return [
+            self.explain(q["sql"]) for q in ctx.captured_queries
+            if q["sql"].startswith("SELECT") and source in q["sql"]
+        ]
+
+    def assertUsesIndex(self, plans: List[str], index: str) -> None:
+        self.assertTrue(
+            any(index in plan for plan in plans),
+            f"{index} not used by any of: {plans}",
+        )
+
+    def test_dashboard(self) -> None:
+        url = reverse("dashboard")
+        self.assertUsesIndex(self.view_plans(url, "products"), "products_stock_idx")
+        self.assertUsesIndex(self.view_plans(url, "orders"), "orders_date_id_idx")
+
+    def test_product_list_pages(self) -> None:
+        url = reverse("product_list")
+        self.assertUsesIndex(self.view_plans(url, "products"), "products_name_idx")
+        next_query = self.client.get(url).context["page"].next_query
+        self.assertUsesIndex(self.view_plans(f"{url}?{next_query}", "products"), "products_name_idx")
+
+    def test_order_list_pages(self) -> None:
+        url = reverse("order_list")
+        self.assertUsesIndex(self.view_plans(url, "orders"), "orders_date_id_idx")
+        next_query = self.client.get(url).context["page"].next_query
+        self.assertUsesIndex(self.view_plans(f"{url}?{next_query}", "orders"), "orders_date_id_idx")
+
+    def test_sales_per_product_is_covered(self) -> None:
+        plan = OrderItem.objects.values("product").annotate(units=Sum("quantity")).explain()
+        self.assertIn("order_items_product_cover_idx", plan)
+
+    def test_customer_order_history(self) -> None:
+        plan = Order.objects.filter(customer_id=1).order_by("-order_date").explain()
+        self.assertIn("orders_customer_date_idx", plan)
+
+
+class SalesReportsTests(TestCase):
+    """The reports page aggregates in SQL, matching analytics.engine."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        alice = Customer.objects.create(name="Alice", email="alice@example.com")
+        bob = Customer.objects.create(name="Bob", email="bob@example.com")
+        mouse = Product.objects.create(
+            name="Mouse", category="Accessories", price=Decimal("25.00"), quantity_in_stock=10,
+        )
+        laptop = Product.objects.create(
+            name="Laptop", category="Electronics", price=Decimal("900.00"), quantity_in_stock=2,
+        )
+        for customer, product, quantity in ((alice, mouse, 3), (alice, laptop, 1), (bob, mouse, 1)):
+            order = Order.objects.create(customer=customer)
+            OrderItem.objects.create(
+                order=order, product=product, quantity=quantity, unit_price=product.price,
+            )
+        Order.objects.create(customer=bob)  # no items
+
+    def test_reports_page(self) -> None:
+        response = self.client.get(reverse("sales_reports"))
+        self.assertEqual(response.status_code, 200)
+        ctx = response.context
+        self.assertEqual(ctx["total_revenue"], 1000.0)
+        self.assertEqual(
+            [(r["name"], r["total_qty_sold"], r["total_revenue"]) for r in ctx["best_sellers"]],
+            [("Mouse", 4, 100.0), ("Laptop", 1, 900.0)],
+        )
+        self.assertEqual(
+            [(r["category"], r["total_stock_value"]) for r in ctx["stock_by_category"]],
+            [("Electronics", 1800.0), ("Accessories", 250.0)],
+        )
+        self.assertEqual(ctx["order_stats"]["count"], 3)
+        self.assertEqual(ctx["order_stats"]["median"], 75.0)
+        alice, bob = ctx["top_customers"]
+        self.assertEqual((alice["name"], alice["num_orders"], alice["total_spent"]), ("Alice", 2, 975.0))
+        self.assertEqual((bob["name"], bob["num_orders"], bob["avg_order_value"]), ("Bob", 2, 25.0))
+        self.assertEqual(sum(r["total_revenue"] for r in ctx["monthly_revenue"]), 1000.0)
+        self.assertContains(response, "Laptop")
+
+    def test_reports_match_analytics_engine(self) -> None:
+        engine = SalesAnalytics.from_connection(connection)
+        built = reports.build_sales_reports()
+        for name, value in engine.order_value_stats().items():
+            self.assertAlmostEqual(built["order_stats"][name], value, places=6)
+        self.assertEqual(
+            built["monthly_revenue"],
+            engine.revenue_by_month()[["year_month_str", "total_revenue"]].to_dict("records"),
+        )
+        self.assertEqual(
+            [r["customer_id"] for r in built["top_customers"]],
+            engine.customer_spend()["customer_id"].tolist(),
+        )
+
+    def test_reports_fetch_aggregates_only(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            reports.build_sales_reports()
+        self.assertEqual(len(queries), 7)
+        for query in queries:
+            self.assertRegex(query["sql"], r"SUM|COUNT|AVG")
+
+    def test_reports_are_cached(self) -> None:
+        self.client.get(reverse("sales_reports"))
+        with self.assertNumQueries(0):
+            self.client.get(reverse("sales_reports"))
+
+
+class RequestMetricsTests(TestCase):
+    """RequestMetricsMiddleware times requests and serves percentiles."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        instrumentation.stats.reset()
+        self.addCleanup(instrumentation.stats.reset)
+        customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        Order.objects.create(customer=customer)
+
+    def server_timing(self, response):
+        timings = {}
+        for entry in response["Server-Timing"].split(", "):
+            name, *params = entry.split(";")
+            timings[name] = dict(param.split("=", 1) for param in params)
+        return timings
+
+    def test_server_timing_header(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("order_list"))
+        timings = self.server_timing(response)
+        self.assertEqual(set(timings), {"db", "tpl", "view", "total"})
+        self.assertEqual(timings["db"]["desc"], f'"{len(queries)} queries"')
+        self.assertGreater(float(timings["tpl"]["dur"]), 0)
+        self.assertGreaterEqual(float(timings["total"]["dur"]), float(timings["view"]["dur"]))
+
+    def test_log_line(self) -> None:
+        with self.assertLogs("inventory.requests", "INFO") as logs:
+            self.client.get(reverse("order_list"))
+        self.assertEqual(len(logs.records), 1)
+        self.assertRegex(
+            logs.output[0],
+            r"endpoint=GET:order_list path=/orders/ status=200 queries=\d+ sql_ms=[\d.]+ "
+            r"render_ms=[\d.]+ view_ms=[\d.]+ total_ms=[\d.]+",
+        )
+
+    def test_stats_endpoint(self) -> None:
+        for _ in range(3):
+            self.client.get(reverse("order_list"))
+        self.client.get("/no-such-page/")
+        self.client.force_login(User.objects.create_user("admin", is_staff=True))
+
+        data = self.client.get(reverse("request_stats")).json()
+        endpoints = {row["endpoint"]: row for row in data["endpoints"]}
+        self.assertEqual(data["window"], instrumentation.WINDOW)
+        self.assertIn("GET <unresolved>", endpoints)
+        orders = endpoints["GET order_list"]
+        self.assertEqual((orders["count"], orders["window"]), (3, 3))
+        self.assertEqual(set(orders["total_ms"]), {"p50", "p90", "p99", "max"})
+        self.assertEqual(orders["queries"]["p50"], orders["queries"]["max"])
+
+    def test_stats_endpoint_is_staff_only(self) -> None:
+        self.assertEqual(self.client.get(reverse("request_stats")).status_code, 404)
+
+    def test_rolling_window_percentiles(self) -> None:
+        stats = instrumentation.EndpointStats(window=100)
+        for ms in range(1, 151):  # 1..50 fall out of the window
+            stats.record("GET x", instrumentation.RequestMetrics(total_ms=float(ms)))
+        (row,) = stats.snapshot()
+        self.assertEqual((row["count"], row["window"]), (150, 100))
+        self.assertEqual(row["total_ms"], {"p50": 100.0, "p90": 140.0, "p99": 149.0, "max": 150.0})
+
+
+class AsyncViewTests(TestCase):
+    """The async read-only views, served through the ASGI handler."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.mouse = Product.objects.create(
+            name="Mouse", category="Accessories", price=Decimal("25.00"), quantity_in_stock=3,
+        )
+        customer = Customer.objects.create(name="Alice", email="alice@example.com")
+        cls.order = Order.objects.create(customer=customer)
+        OrderItem.objects.create(order=cls.order, product=cls.mouse, quantity=2, unit_price=cls.mouse.price)
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    async def test_dashboard(self) -> None:
+        response = await self.async_client.get(reverse("dashboard"))
+        self.assertContains(response, "$50.00")
+        self.assertEqual([p.name for p in response.context["low_stock_products"]], ["Mouse"])
+        self.assertEqual([o.pk for o in response.context["recent_orders"]], [self.order.pk])
+
+    async def test_detail_views(self) -> None:
+        response = await self.async_client.get(reverse("order_detail", args=[self.order.pk]))
+        self.assertContains(response, "Mouse")
+        self.assertContains(response, "alice@example.com")
+        response = await self.async_client.get(reverse("product_detail", args=[self.mouse.pk]))
+        self.assertContains(response, "Accessories")
+        response = await self.async_client.get(reverse("product_detail", args=[self.mouse.pk + 100]))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_list_views_paginate(self) -> None:
+        for url_name, context_name in (("product_list", "products"), ("customer_list", "customers"),
+                                       ("order_list", "orders")):
+            response = await self.async_client.get(reverse(url_name))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.context[context_name]), 1)
+            self.assertFalse(response.context["page"].has_next)
+
+    async def test_server_timing_counts_async_queries(self) -> None:
+        response = await self.async_client.get(reverse("order_list"))
+        queries = response["Server-Timing"].split('desc="', 1)[1].split(" ", 1)[0]
+        self.assertGreater(int(queries), 0)
+
+
+class GenerateDataCommandTests(TransactionTestCase):
+    """manage.py generate_data bulk-loads through the Django connection."""
+
+    def test_generate_data(self) -> None:
+        cache.clear()
+        call_command(
+            "generate_data", "--products", "20", "--customers", "15", "--orders", "200",
+            "--seed", "3", stdout=open(os.devnull, "w"),
+        )
+        self.assertEqual(Product.objects.count(), 20)
+        self.assertEqual(Order.objects.count(), 200)
+        self.assertTrue(all(o.items.exists() for o in Order.objects.all()[:20]))
+        data = metrics.get_dashboard_metrics()
+        self.assertEqual(data["total_orders"], 200)
+        self.assertEqual(
+            data["total_revenue"],
+            OrderItem.objects.aggregate(
+                t=Sum(F("unit_price") * F("quantity"))
+            )["t"].quantize(Decimal("0.01")),
+        )
+        self.assertEqual(len(choices.get_choices("customers")), 15)
+        self.assertEqual(self.client.get(reverse("order_list")).status_code, 200)
@@ -6,6 +6,7 @@ from . import views
 urlpatterns = [
     # Dashboard
     path("", views.dashboard, name="dashboard"),
+    path("reports/", views.sales_reports, name="sales_reports"),
 
     # Products
     path("products/", views.product_list, name="product_list"),
@@ -24,4 +25,8 @@ urlpatterns = [
     path("orders/", views.order_list, name="order_list"),
     path("orders/add/", views.order_create, name="order_create"),
     path("orders/<int:pk>/", views.order_detail, name="order_detail"),
+
+    # JSON
+    path("api/typeahead/<slug:kind>/", views.typeahead, name="typeahead"),
+    path("api/stats/requests/", views.request_stats, name="request_stats"),
 ]
@@ -2,17 +2,26 @@
 
 Implements Product CRUD, Customer registration, Order creation,
 order history, and a dashboard with analytics integration.
+
+The detail and list views are read-only and ``async def``: under ASGI
+they use the async ORM and do not tie up a worker thread while their
+queries run.  Templates are rendered from fully loaded objects, so
+rendering never queries the database.
 """
 
 import logging
-from django.shortcuts import render, redirect, get_object_or_404
+from django.conf import settings
+from django.http import Http404, JsonResponse
+from django.shortcuts import aget_object_or_404, render, redirect, get_object_or_404
 from django.contrib import messages
 from django.db import transaction
-from django.db.models import Sum, F, Count
 from django.utils import timezone
 
+from . import choices, instrumentation, metrics, reports
 from .models import Product, Customer, Order, OrderItem
 from .forms import ProductForm, CustomerForm, OrderForm, OrderItemFormSet
+from .pagination import akeyset_paginate
+from .stock import reserve_stock
 
 logger = logging.getLogger("inventory")
 
@@ -22,56 +31,43 @@ logger = logging.getLogger("inventory")
 # ══════════════════════════════════════════════════════════════
 
 def dashboard(request):
-    """Landing page with key business metrics."""
-    total_products = Product.objects.count()
-    total_customers = Customer.objects.count()
-    total_orders = Order.objects.count()
-
-    total_stock_value = (
-        Product.objects.aggregate(
-            total=Sum(F("price") * F("quantity_in_stock"))
-        )["total"]
-        or 0
-    )
-
-    total_revenue = (
-        OrderItem.objects.aggregate(
-            total=Sum(F("unit_price") * F("quantity"))
-        )["total"]
-        or 0
-    )
-
-    recent_orders = Order.objects.select_related("customer").prefetch_related("items")[:5]
-
-    low_stock_products = Product.objects.filter(quantity_in_stock__lte=10).order_by("quantity_in_stock")[:5]
-
-    top_products = (
-        OrderItem.objects
-        .values("product__name")
-        .annotate(total_sold=Sum("quantity"))
-        .order_by("-total_sold")[:5]
-    )
-
+    """Landing page with key business metrics.
+
+    The totals come from the incrementally maintained summary tables
+    (see ``inventory.metrics``) instead of full-table aggregates.  The
+    view is synchronous: Django's async ORM runs its queries one at a
+    time on a single thread anyway, so an ``async def`` version only
+    added a thread hop per query.
+    """
     context = {
-        "total_products": total_products,
-        "total_customers": total_customers,
-        "total_orders": total_orders,
-        "total_stock_value": total_stock_value,
-        "total_revenue": total_revenue,
-        "recent_orders": recent_orders,
-        "low_stock_products": low_stock_products,
-        "top_products": top_products,
+        **metrics.get_dashboard_metrics(),
+        "recent_orders": list(Order.objects.select_related("customer").with_totals()[:5]),
+        "low_stock_products": list(
+            Product.objects.filter(quantity_in_stock__lte=10).order_by("quantity_in_stock")[:5]
+        ),
     }
     return render(request, "inventory/dashboard.html", context)
 
 
+def sales_reports(request):
+    """Revenue, best-seller, stock and customer reports.
+
+    Computed by GROUP BY queries in ``inventory.reports`` (cached), not
+    by ``analytics.engine``, which loads whole tables into DataFrames.
+    """
+    return render(request, "inventory/reports.html", reports.get_sales_reports())
+
+
 # ══════════════════════════════════════════════════════════════
 # Product CRUD
 # ══════════════════════════════════════════════════════════════
 
-def product_list(request):
-    products = Product.objects.all()
-    return render(request, "inventory/product_list.html", {"products": products})
+async def product_list(request):
+    page = await akeyset_paginate(request, Product.objects.all(), ("name", "id"))
+    return render(request, "inventory/product_list.html", {
+        "products": page.items,
+        "page": page,
+    })
 
 
 def product_create(request):
@@ -112,8 +108,8 @@ def product_delete(request, pk):
     return render(request, "inventory/product_confirm_delete.html", {"product": product})
 
 
-def product_detail(request, pk):
-    product = get_object_or_404(Product, pk=pk)
+async def product_detail(request, pk):
+    product = await aget_object_or_404(Product, pk=pk)
     return render(request, "inventory/product_detail.html", {"product": product})
 
 
@@ -121,9 +117,12 @@ def product_detail(request, pk):
 # Customer CRUD
 # ══════════════════════════════════════════════════════════════
 
-def customer_list(request):
-    customers = Customer.objects.all()
-    return render(request, "inventory/customer_list.html", {"customers": customers})
+async def customer_list(request):
+    page = await akeyset_paginate(request, Customer.objects.all(), ("name", "id"))
+    return render(request, "inventory/customer_list.html", {
+        "customers": page.items,
+        "page": page,
+    })
 
 
 def customer_create(request):
@@ -164,9 +163,14 @@ def customer_delete(request, pk):
 # Order Management
 # ══════════════════════════════════════════════════════════════
 
-def order_list(request):
-    orders = Order.objects.select_related("customer").prefetch_related("items__product")
-    return render(request, "inventory/order_list.html", {"orders": orders})
+async def order_list(request):
+    # Totals and line counts come from SQL; items are never loaded here.
+    orders = Order.objects.select_related("customer").with_totals()
+    page = await akeyset_paginate(request, orders, ("-order_date", "-id"))
+    return render(request, "inventory/order_list.html", {
+        "orders": page.items,
+        "page": page,
+    })
 
 
 def order_create(request):
@@ -179,18 +183,15 @@ def order_create(request):
                     order = form.save()
                     formset.instance = order
                     items = formset.save(commit=False)
+                    # One conditional UPDATE for all lines: raises
+                    # OutOfStockException (and rolls the order back) if a
+                    # concurrent checkout won.
+                    reserve_stock((item.product, item.quantity) for item in items)
                     for item in items:
                         item.unit_price = item.product.price
-                        # Deduct stock
-                        product = item.product
-                        if item.quantity > product.quantity_in_stock:
-                            raise Exception(
-                                f"Not enough stock for {product.name}. "
-                                f"Available: {product.quantity_in_stock}"
-                            )
-                        product.quantity_in_stock -= item.quantity
-                        product.save()
-                        item.save()
+                    OrderItem.objects.bulk_create(items)
+                    # bulk_create skips the post_save metrics receivers.
+                    metrics.record_items(items)
                     for obj in formset.deleted_objects:
                         obj.delete()
                 messages.success(request, "Order created successfully.")
@@ -208,9 +209,48 @@ def order_create(request):
     })
 
 
-def order_detail(request, pk):
-    order = get_object_or_404(
+async def order_detail(request, pk):
+    # aget() runs the prefetch too, so the template's items need no query.
+    order = await aget_object_or_404(
         Order.objects.select_related("customer").prefetch_related("items__product"),
         pk=pk,
     )
     return render(request, "inventory/order_detail.html", {"order": order})
+
+
+# ══════════════════════════════════════════════════════════════
+# Typeahead search (JSON)
+# ══════════════════════════════════════════════════════════════
+
+def typeahead(request, kind):
+    """Search products or customers by name for the order form selects.
+
+    ``GET /api/typeahead/products/?q=mou&limit=20`` returns
+    ``{"results": [{"id": 1, "text": "Mouse ($25.00)"}, ...]}``.
+    """
+    if kind not in choices.SOURCES:
+        raise Http404(f"Unknown choice list: {kind}")
+    try:
+        limit = int(request.GET.get("limit", choices.SEARCH_LIMIT))
+    except ValueError:
+        limit = choices.SEARCH_LIMIT
+    results = choices.search(kind, request.GET.get("q", ""), limit)
+    return JsonResponse({"results": results})
+
+
+# ══════════════════════════════════════════════════════════════
+# Request statistics (JSON)
+# ══════════════════════════════════════════════════════════════
+
+def request_stats(request):
+    """Rolling latency / query-count percentiles per endpoint, from
+    ``inventory.instrumentation`` (this worker process only).
+
+    Only for staff users, or anyone while ``DEBUG`` is on.
+    """
+    if not (settings.DEBUG or request.user.is_staff):
+        raise Http404("Not found")
+    return JsonResponse({
+        "window": instrumentation.stats.window,
+        "endpoints": instrumentation.snapshot(),
+    })